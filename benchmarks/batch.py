@@ -0,0 +1,42 @@
+# Rendering a site: many small pages through `render_batch`
+#
+#   python -m benchmarks.batch [pages] [workers] [--cache]
+#
+# With --cache, the pages are rendered twice with a RenderCache in a temporary directory: cold, then warm.
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.render import SECTION
+from markdown_parser.batch import render_batch
+from markdown_parser.render_cache import RenderCache
+
+
+def run(docs: list[tuple[str, str]], workers: int, cache: RenderCache | None, name: str) -> None:
+    t = time.perf_counter()
+    results = list(render_batch(docs, workers=workers, cache=cache))
+    elapsed = time.perf_counter() - t
+    failed = sum(1 for r in results if not r.ok)
+    print(f"  {name}: {elapsed:.2f} s, {len(docs) / elapsed:.0f} pages/s, {failed} failed")
+
+
+def main(pages: int, workers: int, use_cache: bool) -> None:
+    docs = [(f"page-{i}", "\n\n".join([f"# Page {i}", SECTION, SECTION])) for i in range(pages)]
+    print(f"{pages} pages, {workers} workers ({os.cpu_count()} CPUs)")
+    if not use_cache:
+        run(docs, workers, None, "no cache")
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        run(docs, workers, RenderCache(directory), "cold cache")
+        run(docs, workers, RenderCache(directory), "warm cache")
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if a != "--cache"]
+    main(
+        int(args[0]) if len(args) > 0 else 1000,
+        int(args[1]) if len(args) > 1 else 0,
+        "--cache" in sys.argv,
+    )
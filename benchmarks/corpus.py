@@ -0,0 +1,149 @@
+# Seeded generator of synthetic markdown documents, using every construct of the grammar
+#
+#   python -m benchmarks.corpus [kilobytes] [seed]   # prints a document
+
+import random
+import sys
+
+from markdown_parser.lifter import HTMLNode
+from markdown_parser.nodes import KV, CustomDirective
+
+WORDS = (
+    "the parser splits each document into chunks which are parsed on their own then lifted into blocks "
+    "and rendered to html a list can be nested quotes too while tables have aligned columns code blocks "
+    "keep their lines footnotes are numbered in order of reference"
+).split()
+LANGS = ["py", "c", "bash", "", "rust"]
+TAGS = ["sup", "sub", "small", "smaller"]
+
+
+class Generator:
+    def __init__(self, seed: int) -> None:
+        self.rng = random.Random(seed)
+        self.refs: list[str] = []
+
+    def words(self, lo: int, hi: int) -> str:
+        return " ".join(self.rng.choice(WORDS) for _ in range(self.rng.randint(lo, hi)))
+
+    def inline(self, directives: bool = True) -> str:
+        r = self.rng.random()
+        if r < 0.5:
+            return self.words(3, 12)
+        if r < 0.58:
+            return f"**{self.words(1, 4)}**"
+        if r < 0.64:
+            return f"_{self.words(1, 4)}_"
+        if r < 0.70:
+            return f"`{self.words(1, 3)}()`"
+        if r < 0.76:
+            return f"[{self.words(1, 3)}](https://example.com/{self.rng.choice(WORDS)})"
+        if r < 0.79:
+            return f"![{self.words(1, 2)}](img/{self.rng.randint(1, 99)}.png)"
+        if r < 0.84:
+            ref = f"n{len(self.refs) + 1}"
+            self.refs.append(ref)
+            return f"{self.rng.choice(WORDS)}[^{ref}]"
+        if r < 0.91 and not directives:
+            return self.words(1, 3)
+        if r < 0.88:
+            return f"{{^{self.rng.choice(WORDS)}|{self.words(2, 6)}}}"
+        if r < 0.91:
+            return f"{{^embed: {self.rng.choice(WORDS)}.txt}}"
+        if r < 0.95:
+            tag = self.rng.choice(TAGS)
+            return f"<{tag}>{self.words(1, 3)}</{tag}>"
+        if r < 0.98:
+            return f"a \\* b -> c <- d {self.words(1, 3)}"
+        return f"*{self.words(1, 3)}*"
+
+    def line(self) -> str:
+        return " ".join(self.inline() for _ in range(self.rng.randint(1, 4)))
+
+    def paragraph(self) -> str:
+        return "\n".join(self.line() for _ in range(self.rng.randint(1, 4)))
+
+    def heading(self) -> str:
+        return f"{'#' * self.rng.randint(1, 4)} {self.words(2, 6)}"
+
+    def ulist(self) -> str:
+        lines = []
+        level = 0
+        for _ in range(self.rng.randint(2, 12)):
+            level = self.rng.randint(0, min(level + 1, 3))
+            lines.append(f"{'    ' * level}{self.rng.choice('*+-')} {self.line()}")
+        return "\n".join(lines)
+
+    def olist(self) -> str:
+        return "\n".join(f"{i}. {self.line()}" for i in range(1, self.rng.randint(2, 8)))
+
+    def quote(self) -> str:
+        # lift only takes one top-level quote
+        lines = [f"> {self.line()}"]
+        level = 1
+        for _ in range(self.rng.randint(0, 5)):
+            level = self.rng.randint(2, min(level + 1, 4))
+            lines.append(f"{'>' * level} {self.line()}")
+        return "\n".join(lines)
+
+    def table(self) -> str:
+        cols = self.rng.randint(2, 5)
+        rows = [f"| {' | '.join(self.words(1, 3) for _ in range(cols))} |"]
+        rows.append("|" + "|".join(self.rng.choice(["---", ":--", "--:", ":-:"]) for _ in range(cols)) + "|")
+        for _ in range(self.rng.randint(1, 8)):
+            # `|` ends a table cell
+            rows.append(f"| {' | '.join(self.inline(directives=False) for _ in range(cols))} |")
+        return "\n".join(rows)
+
+    def code(self) -> str:
+        body = "\n".join(f"{'    ' * self.rng.randint(0, 2)}{self.words(1, 8)}" for _ in range(self.rng.randint(1, 15)))
+        return f"```{self.rng.choice(LANGS)}\n{body}\n```"
+
+    def html(self) -> str:
+        # no bold nor italic in html
+        body = f"{self.words(2, 8)} `{self.words(1, 2)}` [{self.words(1, 3)}](#{self.rng.choice(WORDS)}) {self.words(2, 8)}"
+        return f"<details><summary>{self.words(1, 4)}</summary>\n{body}\n</details>"
+
+    def block(self) -> str:
+        kind = self.rng.choices(
+            [self.paragraph, self.heading, self.ulist, self.olist, self.quote, self.table, self.code, self.html],
+            weights=[40, 10, 10, 5, 8, 7, 8, 3],
+        )[0]
+        return kind()
+
+    def document(self, size: int) -> str:
+        """
+        A document of about `size` characters
+        """
+        self.refs = []
+        blocks = [f"---\ntitle: {self.words(2, 5)}\ntags: {self.words(1, 3)}\n---"]
+        total = 0
+        while total < size:
+            blocks.append(self.block())
+            total += len(blocks[-1]) + 2
+        if self.refs:
+            blocks.append("\n".join(f"[^{ref}]: {self.line()}" for ref in self.refs))
+        return "\n\n".join(blocks)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    return Generator(seed).document(size)
+
+
+class Directives:
+    """
+    Directives have no built-in rendering, a site provides it with an extension like this one
+    """
+
+    render_type = CustomDirective
+
+    @staticmethod
+    def render(node: CustomDirective) -> list[HTMLNode]:
+        return [HTMLNode("span", [], [KV("data-directive", node.name), KV("data-args", " ".join(node.arguments))])]
+
+
+EXT = [Directives()]
+
+
+if __name__ == "__main__":
+    kb = float(sys.argv[1]) if len(sys.argv) > 1 else 4
+    print(generate(int(kb * 1000), int(sys.argv[2]) if len(sys.argv) > 2 else 0))
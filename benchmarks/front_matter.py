@@ -0,0 +1,43 @@
+# Listing page: reading the metadata of many posts, with `read_front_matter` vs parsing and lifting them
+#
+#   python -m benchmarks.front_matter [posts] [sections per post]
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.render import SECTION
+from markdown_parser.front_matter import read_front_matter_file
+from markdown_parser.lifter import lift
+from markdown_parser.parser import make_parser
+
+
+def main(posts: int, sections: int) -> None:
+    parser = make_parser()
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(posts):
+            path = os.path.join(directory, f"{i}.md")
+            with open(path, "w") as fd:
+                fd.write(f"---\ntitle: Post {i}\ndate: 2024-01-{i % 28 + 1:02}\ntags: a, b\n---\n\n")
+                fd.write("\n\n".join([SECTION] * sections))
+            paths.append(path)
+
+        t = time.perf_counter()
+        metas = [read_front_matter_file(parser, path) for path in paths]
+        fast = time.perf_counter() - t
+        print(f"{posts} posts: read_front_matter {fast * 1000:8.1f} ms ({fast / posts * 1e6:.0f} us/post)")
+
+        sample = paths[: max(1, posts // 20)]
+        t = time.perf_counter()
+        for path in sample:
+            with open(path) as fd:
+                lifted = lift(parser.parse_nodes(fd.read()))
+        full = (time.perf_counter() - t) / len(sample)
+        print(f"  parse + lift: {full * posts * 1000:8.1f} ms ({full * 1e6:.0f} us/post, on {len(sample)} posts)")
+        assert lifted[0].entries == metas[len(sample) - 1]  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000, int(sys.argv[2]) if len(sys.argv) > 2 else 5)
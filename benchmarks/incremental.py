@@ -0,0 +1,32 @@
+# Editor preview latency: re-parse after a one-character edit, full vs incremental
+#
+#   python -m benchmarks.incremental [paragraphs]
+
+import sys
+import time
+
+from benchmarks.parse import MARKUP
+from markdown_parser.incremental import parse_state, reparse
+from markdown_parser.parser import make_parser
+
+
+def main(paragraphs: int) -> None:
+    parser = make_parser()
+    text = "\n\n".join([MARKUP] * paragraphs)
+    state = parse_state(parser, text)
+    offset = len(text) // 2
+
+    t = time.perf_counter()
+    parse_state(parser, text[:offset] + "x" + text[offset:])
+    full = time.perf_counter() - t
+
+    t = time.perf_counter()
+    reparse(parser, state, offset, 0, "x")
+    incremental = time.perf_counter() - t
+    print(f"{paragraphs} paragraphs, {len(text) / 1e6:.2f} MB")
+    print(f"full:        {full * 1000:8.1f} ms")
+    print(f"incremental: {incremental * 1000:8.1f} ms ({full / incremental:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,42 @@
+# lift() scaling with the number of top-level nodes, time per node should stay flat
+#
+#   python -m benchmarks.lift [max_nodes]
+
+import sys
+import time
+
+from markdown_parser.lifter import lift
+from markdown_parser.nodes import *
+
+
+def make_nodes(n: int) -> list[Node]:
+    pattern: list[Node] = [
+        Heading(2, [PlainText("title")]),
+        ParBreak(),
+        PlainText("text "),
+        Bold([PlainText("bold")]),
+        ParBreak(),
+        Quote(0, [PlainText("quote")]),
+        Quote(1, [PlainText("nested")]),
+        ParBreak(),
+        HtmlOpenTag("div", []),
+        PlainText("in html"),
+        HtmlCloseTag("div"),
+        ParBreak(),
+    ]
+    return [pattern[i % len(pattern)] for i in range(n)]
+
+
+def main(max_nodes: int) -> None:
+    n = max_nodes // 8
+    while n <= max_nodes:
+        nodes = make_nodes(n)
+        t = time.perf_counter()
+        lift(nodes)
+        elapsed = time.perf_counter() - t
+        print(f"{n:>8} nodes: {elapsed * 1000:8.1f} ms, {elapsed / n * 1e6:6.2f} us/node")
+        n *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,34 @@
+# Building list and quote trees (`make_list`, `make_quote`) from long flat and nested sequences of items
+#
+#   python -m benchmarks.lists [items]
+
+import sys
+import time
+
+from markdown_parser.lifter import make_list, make_quote
+from markdown_parser.nodes import *
+
+SHAPES = {
+    "flat": lambda i: 0,
+    "nested": lambda i: i % 8,  # 0 1 2 .. 7 0 1 ..
+    "deep": lambda i: i,
+}
+
+
+def main(n: int) -> None:
+    for name, level in SHAPES.items():
+        items = [ListItem("*", [PlainText(f"item {i}")], 4 * level(i)) for i in range(n)]
+        t = time.perf_counter()
+        make_list(items)
+        elapsed = time.perf_counter() - t
+        print(f"{n} {name:>6} list items:  {elapsed * 1000:8.1f} ms")
+
+        quotes = [Quote(level(i) + (i > 0), [PlainText(f"quote {i}")]) for i in range(n)]
+        t = time.perf_counter()
+        make_quote(quotes)
+        elapsed = time.perf_counter() - t
+        print(f"{n} {name:>6} quote items: {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
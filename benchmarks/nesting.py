@@ -0,0 +1,52 @@
+# Rendering and serializing deeply nested documents, and an ordinary one (`benchmarks.corpus`)
+#
+#   python -m benchmarks.nesting [depth]
+
+import io
+import sys
+import time
+
+from benchmarks.corpus import EXT, generate
+from markdown_parser.lifter import lift
+from markdown_parser.parser import make_parser
+from markdown_parser.renderer import render, write_html
+from markdown_parser.serialize import decode, encode
+
+
+def stages(lifted: list) -> dict:
+    blob = encode(lifted)
+    return {
+        "render+str": lambda: "".join(str(n) for n in render(lifted, EXT)),
+        "write": lambda: write_html(lifted, io.StringIO(), EXT),
+        "encode": lambda: encode(lifted),
+        "decode": lambda: decode(blob),
+    }
+
+
+def report(name: str, lifted: list, repeat: int) -> None:
+    try:
+        fns = stages(lifted)
+    except RecursionError:
+        print(f"{name}: RecursionError")
+        return
+    for stage, fn in fns.items():
+        try:
+            times = []
+            for _ in range(repeat):
+                t = time.perf_counter()
+                fn()
+                times.append(time.perf_counter() - t)
+            print(f"{name} {stage:>10}: {min(times) * 1000:8.1f} ms")
+        except RecursionError:
+            print(f"{name} {stage:>10}: RecursionError")
+
+
+def main(depth: int) -> None:
+    parser = make_parser()
+    report("100 KB document", lift(parser.parse_nodes(generate(100_000))), 10)
+    html = "<div>" * depth + "x" + "</div>" * depth
+    report(f"{depth} nested <div>", lift(parser.parse_nodes(html)), 3)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,43 @@
+# Memory and construction cost of the AST for a large document
+#
+#   python -m benchmarks.nodes [MB]
+
+import resource
+import sys
+import time
+import tracemalloc
+
+from benchmarks.render import SECTION
+from markdown_parser.lifter import lift
+from markdown_parser.nodes import Bold, PlainText
+from markdown_parser.parser import make_parser
+
+
+def main(mb: float) -> None:
+    parser = make_parser()
+    text = "\n\n".join([SECTION] * max(1, int(mb * 1e6 / len(SECTION))))
+    nodes = parser.parse_nodes(text)
+
+    t = time.perf_counter()
+    for _ in range(200_000):
+        Bold([PlainText("x")])
+    construct = time.perf_counter() - t
+
+    tracemalloc.start()
+    t = time.perf_counter()
+    nodes = parser.parse_nodes(text)
+    lifted = lift(nodes)
+    elapsed = time.perf_counter() - t
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(f"{len(text) / 1e6:.2f} MB of markdown, {len(lifted)} top level blocks")
+    print(f"200k Bold([PlainText]): {construct * 1000:8.1f} ms")
+    print(f"parse + lift:           {elapsed * 1000:8.1f} ms (traced)")
+    print(f"AST held:               {held / 1e6:8.1f} MB, peak {peak / 1e6:.1f} MB")
+    print(f"max RSS:                {rss:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 1)
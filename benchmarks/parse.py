@@ -0,0 +1,39 @@
+# Parse throughput on prose-heavy and markup-heavy documents
+#
+#   python -m benchmarks.parse [paragraphs] [workers]
+
+import sys
+import time
+
+from markdown_parser.parser import make_parser
+
+PROSE = (
+    "The quick brown fox jumps over the lazy dog, then it goes back to sleep for a while. "
+    "Numbers like 1.5 or 42 and punctuation (commas, colons: semicolons; quotes \"x\") are plain text too. "
+) * 10
+
+MARKUP = (
+    "Some **bold text with _emphasis_** and `inline code`, a [link](https://example.com) and a footnote[^ref]. "
+    "Escaped \\* stars, {^hint|a popover} and <sup>superscript</sup> text. "
+) * 10
+
+
+def bench(name: str, paragraph: str, paragraphs: int, workers: int) -> None:
+    text = "\n\n".join([paragraph] * paragraphs)
+    mb = len(text.encode()) / 1e6
+    with make_parser(workers=workers) as parser:
+        tokens = sum(1 for _ in parser.p2.parse_interactive(paragraph).iter_parse()) * paragraphs
+        if workers:
+            parser.parse(text)  # start the pool
+        t = time.perf_counter()
+        parser.parse(text)
+        elapsed = time.perf_counter() - t
+    print(f"{name}: {paragraphs} paragraphs, {mb:.2f} MB, {tokens} inline tokens")
+    print(f"  parse: {elapsed * 1000:.1f} ms ({mb / elapsed:.2f} MB/s)")
+
+
+if __name__ == "__main__":
+    paragraphs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    bench("prose", PROSE, paragraphs, workers)
+    bench("markup", MARKUP, paragraphs, workers)
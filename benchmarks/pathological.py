@@ -0,0 +1,45 @@
+# Inputs which could make lexing or parsing superlinear: the time should about double with the size
+#
+#   python -m benchmarks.pathological [case ...]
+
+import sys
+import time
+
+from markdown_parser.parser import make_parser
+
+CASES = {
+    "directives line": lambda n: "{^d: a} " * n,
+    "popovers line": lambda n: "{^h|c} " * n,
+    "anchors line": lambda n: "[a](b) " * n,
+    "brackets line": lambda n: "[a] " * n,
+    "curly line": lambda n: "{a} " * n,
+    "bracket lines": lambda n: "a\n" + "[x\n" * n,  # fails
+    "open paren": lambda n: "[a](" + "x" * n,  # fails
+    "big code block": lambda n: "```\n" + "code line\n" * n + "```",
+    "unterminated fence": lambda n: "```\n" + "code line\n" * n,  # fails
+    "fence lines": lambda n: "x ```\n" * n,
+    "table": lambda n: "| a | b |\n|---|---|\n" + "| x | y |\n" * n,
+    "underscores": lambda n: "a _b" * n,
+    "nested bold": lambda n: "**_" * n,  # fails
+}
+
+
+def main(names: list[str]) -> None:
+    parser = make_parser()
+    sizes = (2000, 4000, 8000)
+    print(f"{'':>20}  " + " ".join(f"{n:>9}" for n in sizes) + "   (ms, for n repetitions)")
+    for name in names:
+        row = []
+        for n in sizes:
+            text = CASES[name](n)
+            t = time.perf_counter()
+            try:
+                parser.parse_nodes(text)
+            except Exception:
+                pass
+            row.append((time.perf_counter() - t) * 1000)
+        print(f"{name:>20}: " + " ".join(f"{ms:9.1f}" for ms in row) + f"   x{row[-1] / row[-2]:.1f} per doubling")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or list(CASES))
@@ -0,0 +1,54 @@
+# Rendering a lifted document: HTMLNode tree + str() vs writing the HTML directly
+#
+#   python -m benchmarks.render [paragraphs]
+
+import io
+import sys
+import time
+import tracemalloc
+
+from benchmarks.parse import MARKUP
+from markdown_parser.lifter import lift
+from markdown_parser.parser import make_parser
+from markdown_parser.renderer import render, write_html
+
+SECTION = "\n\n".join([
+    "## Section",
+    MARKUP,
+    "* item **one**\n    * nested `code`\n* item two",
+    "> quote _text_\n>> nested",
+    "| a | b |\n|---|---|\n| *c* | d |",
+])
+
+
+def measure(fn) -> tuple[float, int]:
+    tracemalloc.start()
+    t = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(sections: int) -> None:
+    parser = make_parser()
+    lifted = lift(parser.parse_nodes("\n\n".join([SECTION] * sections)))
+
+    def tree():
+        return "".join(str(n) for n in render(lifted))
+
+    def direct():
+        buf = io.StringIO()
+        write_html(lifted, buf)
+        return buf.getvalue()
+
+    assert tree() == direct()
+    print(f"{sections} sections, {len(tree()) / 1e6:.2f} MB of HTML")
+    for name, fn in [("tree", tree), ("direct", direct)]:
+        elapsed, peak = measure(fn)
+        print(f"{name:>6}: {elapsed * 1000:8.1f} ms, peak {peak / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
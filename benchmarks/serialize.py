@@ -0,0 +1,40 @@
+# Loading a lifted document: re-parsing vs the binary format (`markdown_parser.serialize`) vs pickle
+#
+#   python -m benchmarks.serialize [sections]
+
+import pickle
+import sys
+import time
+
+from benchmarks.render import SECTION
+from markdown_parser.lifter import lift
+from markdown_parser.parser import make_parser
+from markdown_parser.serialize import decode, encode
+
+
+def best(fn, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return min(times) * 1000
+
+
+def main(sections: int) -> None:
+    parser = make_parser()
+    text = "\n\n".join([SECTION] * sections)
+    lifted = lift(parser.parse_nodes(text))
+    blob = encode(lifted)
+    pickled = pickle.dumps(lifted, pickle.HIGHEST_PROTOCOL)
+
+    print(f"{len(text) / 1e6:.2f} MB of markdown: encoded {len(blob) / 1e3:.0f} KB, pickled {len(pickled) / 1e3:.0f} KB")
+    print(f"  parse + lift: {best(lambda: lift(parser.parse_nodes(text)), 3):8.1f} ms")
+    print(f"  encode:       {best(lambda: encode(lifted)):8.1f} ms")
+    print(f"  decode:       {best(lambda: decode(blob)):8.1f} ms")
+    print(f"  pickle.dumps: {best(lambda: pickle.dumps(lifted, pickle.HIGHEST_PROTOCOL)):8.1f} ms")
+    print(f"  pickle.loads: {best(lambda: pickle.loads(pickled)):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,38 @@
+# Worker cold-start: time to build a DoubleParser in a fresh interpreter,
+# compiling the grammars, compiling with a warm table cache and loading the generated tables.
+#
+#   python -m benchmarks.startup [runs]
+
+import subprocess
+import sys
+import tempfile
+
+SNIPPET = """
+import time
+t = time.perf_counter()
+from markdown_parser.parser import make_parser
+make_parser({cache_dir!r}, compile_grammar={compile_grammar!r})
+print(time.perf_counter() - t)
+"""
+
+
+def cold_start(cache_dir: str | None, compile_grammar: bool) -> float:
+    snippet = SNIPPET.format(cache_dir=cache_dir, compile_grammar=compile_grammar)
+    out = subprocess.check_output([sys.executable, "-c", snippet])
+    return float(out)
+
+
+def best_of(runs: int, cache_dir: str | None, compile_grammar: bool) -> float:
+    return min(cold_start(cache_dir, compile_grammar) for _ in range(runs))
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold_start(cache_dir, True)  # populate
+        compiled = best_of(runs, None, True)
+        cached = best_of(runs, cache_dir, True)
+    generated = best_of(runs, None, False)
+    print(f"compile grammars: {compiled * 1000:8.1f} ms")
+    print(f"with cache:       {cached * 1000:8.1f} ms ({compiled / cached:.1f}x)")
+    print(f"generated tables: {generated * 1000:8.1f} ms ({compiled / generated:.1f}x)")
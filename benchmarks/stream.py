@@ -0,0 +1,48 @@
+# Peak memory of parsing a file: whole text vs streaming the lines
+#
+#   python -m benchmarks.stream [paragraphs]
+
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.parse import MARKUP
+from markdown_parser.parser import make_parser
+
+
+def measure(fn) -> tuple[float, int]:
+    tracemalloc.start()
+    t = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(paragraphs: int) -> None:
+    parser = make_parser()
+    with tempfile.NamedTemporaryFile("w+", suffix=".md") as fd:
+        for _ in range(paragraphs):
+            fd.write(MARKUP + "\n\n")
+        fd.flush()
+        size = fd.tell()
+
+        def whole():
+            with open(fd.name) as f:
+                len(parser.parse_nodes(f.read()))
+
+        def streamed():
+            with open(fd.name) as f:
+                for _ in parser.parse_stream(f):
+                    pass
+
+        print(f"{paragraphs} paragraphs, {size / 1e6:.2f} MB")
+        for name, fn in [("whole", whole), ("stream", streamed)]:
+            elapsed, peak = measure(fn)
+            print(f"{name:>6}: {elapsed * 1000:8.1f} ms, peak {peak / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
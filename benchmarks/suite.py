@@ -0,0 +1,130 @@
+# Scaling of each stage (split, parse, lift, render, write) on generated documents (`benchmarks.corpus`)
+#
+#   python -m benchmarks.suite [--sizes 10,100,1000] [--seed 0] [--repeat 3] [--json out.json] [--compare base.json]
+#
+# Sizes are in kilobytes of markdown. Reports the best time of `repeat` runs, the throughput and the peak
+# memory (traced in a separate run) of each stage; `--json` saves them, `--compare` shows the ratio to a saved run.
+
+import argparse
+import gc
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+import lark
+
+from benchmarks.corpus import EXT, generate
+from markdown_parser.lifter import lift
+from markdown_parser.parser import make_parser
+from markdown_parser.renderer import render, write_html
+
+
+def best(fn: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+def peak(fn: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_size(parser, kb: int, seed: int, repeat: int) -> dict:
+    text = generate(kb * 1000, seed)
+    nodes = parser.parse_nodes(text)
+    lifted = lift(nodes)
+    html = io.StringIO()
+    write_html(lifted, html, EXT)
+
+    def write():
+        write_html(lifted, io.StringIO(), EXT)
+
+    stages: dict[str, Callable[[], object]] = {
+        "split": lambda: parser.split(text),
+        "parse": lambda: parser.parse_nodes(text),
+        "lift": lambda: lift(nodes),
+        "render": lambda: "".join(str(n) for n in render(lifted, EXT)),
+        "write": write,
+    }
+    size = len(text.encode())
+    ret: dict = {"kb": kb, "bytes": size, "html_bytes": len(html.getvalue().encode()), "stages": {}}
+    for name, fn in stages.items():
+        elapsed = best(fn, repeat)
+        ret["stages"][name] = {
+            "ms": elapsed * 1000,
+            "mb_s": size / 1e6 / elapsed,
+            "peak_mb": peak(fn) / 1e6,
+        }
+    return ret
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def print_results(results: list[dict], base: dict | None) -> None:
+    base_by_kb = {r["kb"]: r for r in base["results"]} if base else {}
+    for r in results:
+        print(f"{r['kb']} KB ({r['bytes'] / 1e6:.2f} MB of markdown, {r['html_bytes'] / 1e6:.2f} MB of HTML)")
+        for name, s in r["stages"].items():
+            line = f"  {name:>7}: {s['ms']:9.1f} ms {s['mb_s']:7.2f} MB/s, peak {s['peak_mb']:8.2f} MB"
+            if (b := base_by_kb.get(r["kb"], {}).get("stages", {}).get(name)) is not None:
+                line += f"  (x{s['ms'] / b['ms']:.2f} time, x{s['peak_mb'] / b['peak_mb']:.2f} memory)"
+            print(line)
+
+
+def main() -> None:
+    args = argparse.ArgumentParser(description=__doc__)
+    args.add_argument("--sizes", default="10,100,1000", help="document sizes, in kilobytes")
+    args.add_argument("--seed", type=int, default=0)
+    args.add_argument("--repeat", type=int, default=3)
+    args.add_argument("--json", help="write the results to this file")
+    args.add_argument("--compare", help="results of an earlier run (from --json)")
+    opts = args.parse_args()
+
+    base = None
+    if opts.compare:
+        with open(opts.compare) as fd:
+            base = json.load(fd)
+        if base["seed"] != opts.seed:
+            print(f"warning: {opts.compare} used seed {base['seed']}, the documents differ", file=sys.stderr)
+
+    parser = make_parser()
+    results = [run_size(parser, int(kb), opts.seed, opts.repeat) for kb in opts.sizes.split(",")]
+    print_results(results, base)
+
+    if opts.json:
+        out = {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "lark": lark.__version__,
+            "machine": platform.machine(),
+            "seed": opts.seed,
+            "repeat": opts.repeat,
+            "results": results,
+        }
+        with open(opts.json, "w") as fd:
+            json.dump(out, fd, indent=2)
+
+
+if __name__ == "__main__":
+    main()
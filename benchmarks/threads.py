@@ -0,0 +1,65 @@
+# Parsing from many threads: a parser built by each thread vs one SharedParser (`markdown_parser.shared`)
+#
+#   python -m benchmarks.threads [threads] [docs per thread]
+#
+# Reports the wall time, the latency of each thread's first document (which pays for building its parser)
+# and the memory held by the parsers.
+
+import gc
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Callable
+
+from benchmarks.corpus import generate
+from markdown_parser.parser import DoubleParser, make_parser
+from markdown_parser.shared import SharedParser
+
+
+def run(threads: int, docs: list[str], get_parser: Callable[[], DoubleParser | SharedParser]) -> tuple[float, float]:
+    first: list[float] = []
+    barrier = threading.Barrier(threads + 1)
+
+    def work() -> None:
+        barrier.wait()
+        t = time.perf_counter()
+        parser = get_parser()
+        for i, doc in enumerate(docs):
+            parser.parse_nodes(doc)
+            if i == 0:
+                first.append(time.perf_counter() - t)
+
+    pool = [threading.Thread(target=work) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    t = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - t, max(first)
+
+
+def held(build: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()  # alive while measured
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main(threads: int, per_thread: int) -> None:
+    docs = [generate(10_000, seed) for seed in range(per_thread)]
+    make_parser().parse_nodes(docs[0])  # import the tables
+    shared = SharedParser()
+    for name, get_parser in [("parser per thread", make_parser), ("shared parser", lambda: shared)]:
+        elapsed, first = run(threads, docs, get_parser)
+        print(f"{name:>17}: {elapsed * 1000:8.1f} ms, first document after {first * 1000:7.1f} ms")
+    print(f"memory of {threads} parsers: {held(lambda: [make_parser() for _ in range(threads)]) / 1e6:6.2f} MB, "
+          f"of a shared one: {held(SharedParser) / 1e6:6.2f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 8, int(sys.argv[2]) if len(sys.argv) > 2 else 10)
@@ -0,0 +1,4 @@
+# Generated by `python -m markdown_parser.build_tables`, do not edit
+DIGEST = 'b59b8085f8836fe1c06d3ca636782cc38c403b25d5debeebff9c83878b808d85'
+DATA = {'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}], 'ignore': [], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}], 'start': ['start'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'CODE_BLOCK', 1: '__start_plus_0', 2: 'TEXT', 3: 'PAR_BREAK', 4: 'start', 5: 'LF', 6: '$END'}, 'states': {0: {0: (0, 4), 1: (0, 1), 2: (0, 5), 3: (0, 10), 4: (0, 9), 5: (0, 2)}, 1: {0: (0, 8), 2: (0, 6), 3: (0, 7), 5: (0, 3), 6: (1, {'@': 4})}, 2: {5: (1, {'@': 7}), 2: (1, {'@': 7}), 0: (1, {'@': 7}), 3: (1, {'@': 7}), 6: (1, {'@': 7})}, 3: {5: (1, {'@': 11}), 2: (1, {'@': 11}), 0: (1, {'@': 11}), 3: (1, {'@': 11}), 6: (1, {'@': 11})}, 4: {5: (1, {'@': 5}), 2: (1, {'@': 5}), 0: (1, {'@': 5}), 3: (1, {'@': 5}), 6: (1, {'@': 5})}, 5: {5: (1, {'@': 6}), 2: (1, {'@': 6}), 0: (1, {'@': 6}), 3: (1, {'@': 6}), 6: (1, {'@': 6})}, 6: {5: (1, {'@': 10}), 2: (1, {'@': 10}), 0: (1, {'@': 10}), 3: (1, {'@': 10}), 6: (1, {'@': 10})}, 7: {5: (1, {'@': 12}), 2: (1, {'@': 12}), 0: (1, {'@': 12}), 3: (1, {'@': 12}), 6: (1, {'@': 12})}, 8: {5: (1, {'@': 9}), 2: (1, {'@': 9}), 0: (1, {'@': 9}), 3: (1, {'@': 9}), 6: (1, {'@': 9})}, 9: {}, 10: {5: (1, {'@': 8}), 2: (1, {'@': 8}), 0: (1, {'@': 8}), 3: (1, {'@': 8}), 6: (1, {'@': 8})}}, 'start_states': {'start': 0}, 'end_states': {'start': 9}}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}], 'options': {'debug': False, 'strict': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'cache_grammar': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': True, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'ordered_sets': True, 'import_paths': [], 'source_path': None, '_plugins': {}}, '__type__': 'Lark'}
+MEMO = {0: {'name': 'TEXT', 'pattern': {'value': '[^\n]+', 'flags': [], 'raw': '/[^\\n]+/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 1: {'name': 'LF', 'pattern': {'value': '\n', 'flags': [], 'raw': '/\\n/', '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 2: {'name': 'PAR_BREAK', 'pattern': {'value': '\n(?:\n)+', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 3: {'name': 'CODE_BLOCK', 'pattern': {'value': '```(?:[A-Za-z]+)?\n[\\s\\S]+?(?=```)```', 'flags': [], 'raw': None, '_width': [8, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 4: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_plus_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 5: {'origin': {'name': '__start_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CODE_BLOCK', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 6: {'origin': {'name': '__start_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TEXT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 7: {'origin': {'name': '__start_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LF', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 8: {'origin': {'name': '__start_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PAR_BREAK', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 9: {'origin': {'name': '__start_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_plus_0', '__type__': 'NonTerminal'}, {'name': 'CODE_BLOCK', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 10: {'origin': {'name': '__start_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_plus_0', '__type__': 'NonTerminal'}, {'name': 'TEXT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 11: {'origin': {'name': '__start_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_plus_0', '__type__': 'NonTerminal'}, {'name': 'LF', 'filter_out': False, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 12: {'origin': {'name': '__start_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_plus_0', '__type__': 'NonTerminal'}, {'name': 'PAR_BREAK', 'filter_out': False, '__type__': 'Terminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
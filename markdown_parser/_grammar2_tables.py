@@ -0,0 +1,4 @@
+# Generated by `python -m markdown_parser.build_tables`, do not edit
+DIGEST = 'e3afa7b82b411e81a75e2e395764c47e838ee884f637caca2d20e4bd43d094d7'
+DATA = {'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}], 'ignore': [], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}, {'@': 221}, {'@': 222}, {'@': 223}, {'@': 224}, {'@': 225}, {'@': 226}, {'@': 227}, {'@': 228}, {'@': 229}, {'@': 230}, {'@': 231}, {'@': 232}, {'@': 233}, {'@': 234}, {'@': 235}, {'@': 236}, {'@': 237}], 'start': ['start'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'image', 1: '__plain_text_plus_12', 2: 'anchor', 3: 'smaller', 4: 'small', 5: 'italic', 6: 'BR_WORD_NOT_ANCHOR', 7: 'subscript', 8: '__ANON_3', 9: 'STRING', 10: 'LSQB', 11: '__ANON_12', 12: 'ARROW_R', 13: 'custom_directive', 14: 'UNDERSCORE', 15: '__ANON_6', 16: '__ANON_0', 17: 'ref', 18: 'plain_text', 19: '__ANON_14', 20: 'popover', 21: 'superscript', 22: 'under_italic', 23: 'inline_pre', 24: 'STAR', 25: 'BACKQUOTE', 26: 'star_bold', 27: 'ARROW_L', 28: '__ANON_17', 29: '__ANON_9', 30: 'CUR_BR_WORD_NOT_DIRECTIVE', 31: 'non_nestable_inlines', 32: 'ESCAPED_CHAR', 33: '__ANON_2', 34: '__ANON_4', 35: 'star_italic', 36: 'NON_IMAGE_BANG', 37: '_LF', 38: '__ANON_11', 39: 'LEADING_SPACE_LI', 40: '__ANON_8', 41: '$END', 42: '__ANON_7', 43: '__ANON_19', 44: 'LESSTHAN', 45: '__ANON_1', 46: 'VBAR', 47: '__ANON_5', 48: 'QUOTE_LEAD', 49: '__ANON_15', 50: 'COLON', 51: '__ANON_13', 52: '__superscript_plus_0', 53: 'MINUS', 54: 'RBRACE', 55: 'html_close_tag', 56: 'html_tag', 57: 'html_open_tag', 58: 'code_block', 59: '__list_item_plus_8', 60: 'WS', 61: 'MORETHAN', 62: 'HTML_PROP_NAME', 63: '__under_italic_plus_10', 64: 'TAB_DIV', 65: '__hr_star_2', 66: '__table_plus_15', 67: 'table_row', 68: 'RSQB', 69: 'hr', 70: '__ANON_16', 71: '__refitem_plus_18', 72: 'HTML_VALUE', 73: 'CUR_BR_STRING', 74: 'HASH', 75: '__html_star_19', 76: '__star_bold_plus_11', 77: 'CODELINE', 78: 'code', 79: '__table_divisor_plus_14', 80: 'quote_body', 81: 'RPAR', 82: 'PAR_STRING', 83: '__ANON_18', 84: '__start_star_1', 85: '__ANON_10', 86: 'identifier', 87: 'html', 88: 'heading', 89: '__list_block_plus_7', 90: '__refblock_plus_17', 91: 'list_block', 92: 'non_nestable_blocks', 93: 'start', 94: '__heading_plus_21', 95: 'list_item', 96: 'SPACES', 97: '__quote_plus_6', 98: 'refblock', 99: 'quote', 100: 'refitem', 101: 'table', 102: '__anchor_star_16', 103: '__table_row_plus_13', 104: 'table_cell', 105: '__html_open_tag_star_20', 106: 'BR_STRING', 107: 'COLON_STRING', 108: 'PIPE_STRING', 109: '__ANON_20', 110: 'inline_code', 111: 'NOT_BACKTICK', 112: '__quote_body_plus_5', 113: 'table_divisor'}, 'states': {0: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 5: (0, 55), 6: (0, 28), 7: (0, 11), 8: (0, 182), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 26: (0, 93), 27: (0, 87), 28: (0, 156), 29: (0, 91), 30: (0, 166), 31: (0, 80), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 1: {37: (1, {'@': 168}), 12: (1, {'@': 168}), 24: (1, {'@': 168}), 38: (1, {'@': 168}), 28: (1, {'@': 168}), 34: (1, {'@': 168}), 19: (1, {'@': 168}), 9: (1, {'@': 168}), 15: (1, {'@': 168}), 39: (1, {'@': 168}), 33: (1, {'@': 168}), 32: (1, {'@': 168}), 36: (1, {'@': 168}), 25: (1, {'@': 168}), 6: (1, {'@': 168}), 14: (1, {'@': 168}), 40: (1, {'@': 168}), 30: (1, {'@': 168}), 29: (1, {'@': 168}), 10: (1, {'@': 168}), 16: (1, {'@': 168}), 41: (1, {'@': 168}), 27: (1, {'@': 168}), 11: (1, {'@': 168})}, 2: {25: (1, {'@': 118}), 6: (1, {'@': 118}), 14: (1, {'@': 118}), 30: (1, {'@': 118}), 12: (1, {'@': 118}), 24: (1, {'@': 118}), 29: (1, {'@': 118}), 28: (1, {'@': 118}), 34: (1, {'@': 118}), 19: (1, {'@': 118}), 8: (1, {'@': 118}), 9: (1, {'@': 118}), 10: (1, {'@': 118}), 15: (1, {'@': 118}), 16: (1, {'@': 118}), 27: (1, {'@': 118}), 11: (1, {'@': 118}), 33: (1, {'@': 118}), 32: (1, {'@': 118}), 36: (1, {'@': 118}), 42: (1, {'@': 118}), 37: (1, {'@': 118}), 43: (1, {'@': 118}), 40: (1, {'@': 118}), 38: (1, {'@': 118}), 44: (1, {'@': 118}), 41: (1, {'@': 118}), 39: (1, {'@': 118}), 45: (1, {'@': 118}), 46: (1, {'@': 118}), 47: (1, {'@': 118}), 48: (1, {'@': 118})}, 3: {49: (0, 218)}, 4: {50: (0, 49)}, 5: {37: (1, {'@': 125}), 25: (1, {'@': 125}), 43: (1, {'@': 125}), 6: (1, {'@': 125}), 14: (1, {'@': 125}), 40: (1, {'@': 125}), 30: (1, {'@': 125}), 38: (1, {'@': 125}), 12: (1, {'@': 125}), 24: (1, {'@': 125}), 28: (1, {'@': 125}), 34: (1, {'@': 125}), 29: (1, {'@': 125}), 19: (1, {'@': 125}), 9: (1, {'@': 125}), 10: (1, {'@': 125}), 15: (1, {'@': 125}), 16: (1, {'@': 125}), 44: (1, {'@': 125}), 41: (1, {'@': 125}), 27: (1, {'@': 125}), 11: (1, {'@': 125}), 33: (1, {'@': 125}), 32: (1, {'@': 125}), 36: (1, {'@': 125})}, 6: {37: (1, {'@': 72}), 38: (1, {'@': 72}), 12: (1, {'@': 72}), 24: (1, {'@': 72}), 28: (1, {'@': 72}), 34: (1, {'@': 72}), 19: (1, {'@': 72}), 9: (1, {'@': 72}), 15: (1, {'@': 72}), 33: (1, {'@': 72}), 32: (1, {'@': 72}), 36: (1, {'@': 72}), 25: (1, {'@': 72}), 6: (1, {'@': 72}), 14: (1, {'@': 72}), 40: (1, {'@': 72}), 30: (1, {'@': 72}), 29: (1, {'@': 72}), 10: (1, {'@': 72}), 16: (1, {'@': 72}), 41: (1, {'@': 72}), 27: (1, {'@': 72}), 11: (1, {'@': 72})}, 7: {48: (1, {'@': 153}), 37: (1, {'@': 153}), 12: (1, {'@': 153}), 24: (1, {'@': 153}), 38: (1, {'@': 153}), 28: (1, {'@': 153}), 34: (1, {'@': 153}), 19: (1, {'@': 153}), 9: (1, {'@': 153}), 15: (1, {'@': 153}), 33: (1, {'@': 153}), 32: (1, {'@': 153}), 36: (1, {'@': 153}), 25: (1, {'@': 153}), 6: (1, {'@': 153}), 14: (1, {'@': 153}), 40: (1, {'@': 153}), 30: (1, {'@': 153}), 29: (1, {'@': 153}), 10: (1, {'@': 153}), 16: (1, {'@': 153}), 41: (1, {'@': 153}), 27: (1, {'@': 153}), 11: (1, {'@': 153})}, 8: {37: (1, {'@': 214}), 12: (1, {'@': 214}), 24: (1, {'@': 214}), 38: (1, {'@': 214}), 28: (1, {'@': 214}), 34: (1, {'@': 214}), 19: (1, {'@': 214}), 9: (1, {'@': 214}), 15: (1, {'@': 214}), 33: (1, {'@': 214}), 32: (1, {'@': 214}), 36: (1, {'@': 214}), 25: (1, {'@': 214}), 6: (1, {'@': 214}), 14: (1, {'@': 214}), 40: (1, {'@': 214}), 30: (1, {'@': 214}), 29: (1, {'@': 214}), 10: (1, {'@': 214}), 16: (1, {'@': 214}), 41: (1, {'@': 214}), 27: (1, {'@': 214}), 11: (1, {'@': 214})}, 9: {25: (1, {'@': 107}), 6: (1, {'@': 107}), 14: (1, {'@': 107}), 30: (1, {'@': 107}), 12: (1, {'@': 107}), 24: (1, {'@': 107}), 29: (1, {'@': 107}), 28: (1, {'@': 107}), 34: (1, {'@': 107}), 19: (1, {'@': 107}), 8: (1, {'@': 107}), 9: (1, {'@': 107}), 10: (1, {'@': 107}), 15: (1, {'@': 107}), 16: (1, {'@': 107}), 27: (1, {'@': 107}), 11: (1, {'@': 107}), 33: (1, {'@': 107}), 32: (1, {'@': 107}), 36: (1, {'@': 107}), 42: (1, {'@': 107}), 37: (1, {'@': 107}), 43: (1, {'@': 107}), 40: (1, {'@': 107}), 38: (1, {'@': 107}), 44: (1, {'@': 107}), 41: (1, {'@': 107}), 39: (1, {'@': 107}), 45: (1, {'@': 107}), 51: (1, {'@': 107}), 46: (1, {'@': 107}), 47: (1, {'@': 107}), 48: (1, {'@': 107})}, 10: {25: (1, {'@': 85}), 6: (1, {'@': 85}), 14: (1, {'@': 85}), 30: (1, {'@': 85}), 12: (1, {'@': 85}), 24: (1, {'@': 85}), 29: (1, {'@': 85}), 28: (1, {'@': 85}), 34: (1, {'@': 85}), 19: (1, {'@': 85}), 8: (1, {'@': 85}), 9: (1, {'@': 85}), 10: (1, {'@': 85}), 15: (1, {'@': 85}), 16: (1, {'@': 85}), 27: (1, {'@': 85}), 11: (1, {'@': 85}), 33: (1, {'@': 85}), 32: (1, {'@': 85}), 36: (1, {'@': 85}), 42: (1, {'@': 85}), 37: (1, {'@': 85}), 40: (1, {'@': 85}), 38: (1, {'@': 85}), 41: (1, {'@': 85}), 39: (1, {'@': 85}), 45: (1, {'@': 85}), 51: (1, {'@': 85}), 46: (1, {'@': 85}), 47: (1, {'@': 85}), 48: (1, {'@': 85})}, 11: {25: (1, {'@': 70}), 6: (1, {'@': 70}), 14: (1, {'@': 70}), 30: (1, {'@': 70}), 12: (1, {'@': 70}), 24: (1, {'@': 70}), 29: (1, {'@': 70}), 28: (1, {'@': 70}), 34: (1, {'@': 70}), 19: (1, {'@': 70}), 8: (1, {'@': 70}), 9: (1, {'@': 70}), 10: (1, {'@': 70}), 15: (1, {'@': 70}), 16: (1, {'@': 70}), 27: (1, {'@': 70}), 11: (1, {'@': 70}), 33: (1, {'@': 70}), 32: (1, {'@': 70}), 36: (1, {'@': 70}), 42: (1, {'@': 70}), 37: (1, {'@': 70}), 43: (1, {'@': 70}), 40: (1, {'@': 70}), 38: (1, {'@': 70}), 44: (1, {'@': 70}), 41: (1, {'@': 70}), 39: (1, {'@': 70}), 45: (1, {'@': 70}), 46: (1, {'@': 70}), 47: (1, {'@': 70}), 48: (1, {'@': 70})}, 12: {51: (0, 183)}, 13: {0: (0, 111), 52: (0, 25), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 26: (0, 54), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 31: (0, 242), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 5: (0, 130), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 14: {37: (1, {'@': 149}), 38: (1, {'@': 149}), 12: (1, {'@': 149}), 24: (1, {'@': 149}), 28: (1, {'@': 149}), 34: (1, {'@': 149}), 19: (1, {'@': 149}), 9: (1, {'@': 149}), 15: (1, {'@': 149}), 33: (1, {'@': 149}), 32: (1, {'@': 149}), 36: (1, {'@': 149}), 53: (1, {'@': 149}), 25: (1, {'@': 149}), 6: (1, {'@': 149}), 14: (1, {'@': 149}), 40: (1, {'@': 149}), 30: (1, {'@': 149}), 29: (1, {'@': 149}), 10: (1, {'@': 149}), 16: (1, {'@': 149}), 41: (1, {'@': 149}), 27: (1, {'@': 149}), 11: (1, {'@': 149})}, 15: {25: (1, {'@': 68}), 6: (1, {'@': 68}), 14: (1, {'@': 68}), 30: (1, {'@': 68}), 12: (1, {'@': 68}), 24: (1, {'@': 68}), 29: (1, {'@': 68}), 28: (1, {'@': 68}), 34: (1, {'@': 68}), 19: (1, {'@': 68}), 8: (1, {'@': 68}), 9: (1, {'@': 68}), 10: (1, {'@': 68}), 15: (1, {'@': 68}), 16: (1, {'@': 68}), 27: (1, {'@': 68}), 11: (1, {'@': 68}), 33: (1, {'@': 68}), 32: (1, {'@': 68}), 36: (1, {'@': 68}), 42: (1, {'@': 68}), 37: (1, {'@': 68}), 43: (1, {'@': 68}), 40: (1, {'@': 68}), 38: (1, {'@': 68}), 44: (1, {'@': 68}), 41: (1, {'@': 68}), 39: (1, {'@': 68}), 45: (1, {'@': 68}), 46: (1, {'@': 68}), 47: (1, {'@': 68}), 48: (1, {'@': 68})}, 16: {25: (1, {'@': 69}), 6: (1, {'@': 69}), 14: (1, {'@': 69}), 30: (1, {'@': 69}), 12: (1, {'@': 69}), 24: (1, {'@': 69}), 29: (1, {'@': 69}), 28: (1, {'@': 69}), 34: (1, {'@': 69}), 19: (1, {'@': 69}), 8: (1, {'@': 69}), 9: (1, {'@': 69}), 10: (1, {'@': 69}), 15: (1, {'@': 69}), 16: (1, {'@': 69}), 27: (1, {'@': 69}), 11: (1, {'@': 69}), 33: (1, {'@': 69}), 32: (1, {'@': 69}), 36: (1, {'@': 69}), 42: (1, {'@': 69}), 37: (1, {'@': 69}), 43: (1, {'@': 69}), 40: (1, {'@': 69}), 38: (1, {'@': 69}), 44: (1, {'@': 69}), 41: (1, {'@': 69}), 39: (1, {'@': 69}), 45: (1, {'@': 69}), 46: (1, {'@': 69}), 47: (1, {'@': 69}), 48: (1, {'@': 69})}, 17: {37: (1, {'@': 170}), 12: (1, {'@': 170}), 24: (1, {'@': 170}), 38: (1, {'@': 170}), 28: (1, {'@': 170}), 34: (1, {'@': 170}), 19: (1, {'@': 170}), 9: (1, {'@': 170}), 15: (1, {'@': 170}), 39: (1, {'@': 170}), 33: (1, {'@': 170}), 32: (1, {'@': 170}), 36: (1, {'@': 170}), 25: (1, {'@': 170}), 6: (1, {'@': 170}), 14: (1, {'@': 170}), 40: (1, {'@': 170}), 30: (1, {'@': 170}), 29: (1, {'@': 170}), 10: (1, {'@': 170}), 16: (1, {'@': 170}), 41: (1, {'@': 170}), 27: (1, {'@': 170}), 11: (1, {'@': 170})}, 18: {54: (0, 107)}, 19: {25: (1, {'@': 60}), 6: (1, {'@': 60}), 14: (1, {'@': 60}), 30: (1, {'@': 60}), 12: (1, {'@': 60}), 24: (1, {'@': 60}), 29: (1, {'@': 60}), 28: (1, {'@': 60}), 34: (1, {'@': 60}), 19: (1, {'@': 60}), 8: (1, {'@': 60}), 9: (1, {'@': 60}), 10: (1, {'@': 60}), 15: (1, {'@': 60}), 16: (1, {'@': 60}), 27: (1, {'@': 60}), 11: (1, {'@': 60}), 33: (1, {'@': 60}), 32: (1, {'@': 60}), 36: (1, {'@': 60}), 42: (1, {'@': 60}), 37: (1, {'@': 60}), 43: (1, {'@': 60}), 40: (1, {'@': 60}), 38: (1, {'@': 60}), 44: (1, {'@': 60}), 41: (1, {'@': 60}), 39: (1, {'@': 60}), 45: (1, {'@': 60}), 46: (1, {'@': 60}), 47: (1, {'@': 60}), 48: (1, {'@': 60})}, 20: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 37: (0, 229), 9: (0, 71), 10: (0, 139), 11: (0, 152), 38: (0, 131), 12: (0, 216), 13: (0, 73), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 44: (0, 123), 20: (0, 82), 21: (0, 16), 23: (0, 19), 31: (0, 223), 25: (0, 176), 27: (0, 87), 55: (0, 5), 28: (0, 156), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 56: (0, 210), 57: (0, 109), 43: (0, 163), 58: (0, 191), 36: (0, 198), 14: (1, {'@': 122}), 40: (1, {'@': 122}), 24: (1, {'@': 122}), 29: (1, {'@': 122}), 41: (1, {'@': 122})}, 21: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 26: (0, 110), 11: (0, 152), 12: (0, 216), 13: (0, 73), 15: (0, 13), 14: (0, 29), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 31: (0, 62), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 28: (0, 156), 29: (0, 91), 30: (0, 166), 5: (0, 22), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198), 37: (1, {'@': 117}), 40: (1, {'@': 117}), 38: (1, {'@': 117}), 41: (1, {'@': 117})}, 22: {37: (1, {'@': 218}), 12: (1, {'@': 218}), 24: (1, {'@': 218}), 38: (1, {'@': 218}), 28: (1, {'@': 218}), 34: (1, {'@': 218}), 19: (1, {'@': 218}), 9: (1, {'@': 218}), 15: (1, {'@': 218}), 33: (1, {'@': 218}), 32: (1, {'@': 218}), 36: (1, {'@': 218}), 25: (1, {'@': 218}), 6: (1, {'@': 218}), 14: (1, {'@': 218}), 40: (1, {'@': 218}), 30: (1, {'@': 218}), 29: (1, {'@': 218}), 10: (1, {'@': 218}), 16: (1, {'@': 218}), 41: (1, {'@': 218}), 27: (1, {'@': 218}), 11: (1, {'@': 218})}, 23: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 31: (0, 165), 13: (0, 73), 59: (0, 64), 15: (0, 13), 14: (0, 29), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 5: (0, 1), 26: (0, 84), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 24: {37: (1, {'@': 137}), 38: (1, {'@': 137}), 12: (1, {'@': 137}), 24: (1, {'@': 137}), 28: (1, {'@': 137}), 34: (1, {'@': 137}), 19: (1, {'@': 137}), 9: (1, {'@': 137}), 15: (1, {'@': 137}), 33: (1, {'@': 137}), 32: (1, {'@': 137}), 36: (1, {'@': 137}), 25: (1, {'@': 137}), 6: (1, {'@': 137}), 14: (1, {'@': 137}), 40: (1, {'@': 137}), 30: (1, {'@': 137}), 29: (1, {'@': 137}), 10: (1, {'@': 137}), 16: (1, {'@': 137}), 41: (1, {'@': 137}), 27: (1, {'@': 137}), 11: (1, {'@': 137})}, 25: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 5: (0, 55), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 26: (0, 93), 27: (0, 87), 42: (0, 226), 28: (0, 156), 29: (0, 91), 30: (0, 166), 31: (0, 80), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 26: {60: (1, {'@': 234}), 61: (1, {'@': 234}), 62: (1, {'@': 234})}, 27: {37: (1, {'@': 139}), 38: (1, {'@': 139}), 12: (1, {'@': 139}), 24: (1, {'@': 139}), 28: (1, {'@': 139}), 34: (1, {'@': 139}), 19: (1, {'@': 139}), 9: (1, {'@': 139}), 15: (1, {'@': 139}), 33: (1, {'@': 139}), 32: (1, {'@': 139}), 36: (1, {'@': 139}), 25: (1, {'@': 139}), 6: (1, {'@': 139}), 14: (1, {'@': 139}), 40: (1, {'@': 139}), 30: (1, {'@': 139}), 29: (1, {'@': 139}), 10: (1, {'@': 139}), 16: (1, {'@': 139}), 41: (1, {'@': 139}), 27: (1, {'@': 139}), 11: (1, {'@': 139})}, 28: {25: (1, {'@': 181}), 6: (1, {'@': 181}), 14: (1, {'@': 181}), 30: (1, {'@': 181}), 12: (1, {'@': 181}), 24: (1, {'@': 181}), 29: (1, {'@': 181}), 28: (1, {'@': 181}), 34: (1, {'@': 181}), 19: (1, {'@': 181}), 8: (1, {'@': 181}), 9: (1, {'@': 181}), 10: (1, {'@': 181}), 15: (1, {'@': 181}), 16: (1, {'@': 181}), 27: (1, {'@': 181}), 11: (1, {'@': 181}), 33: (1, {'@': 181}), 32: (1, {'@': 181}), 36: (1, {'@': 181}), 42: (1, {'@': 181}), 37: (1, {'@': 181}), 43: (1, {'@': 181}), 38: (1, {'@': 181}), 40: (1, {'@': 181}), 44: (1, {'@': 181}), 41: (1, {'@': 181}), 39: (1, {'@': 181}), 45: (1, {'@': 181}), 51: (1, {'@': 181}), 46: (1, {'@': 181}), 47: (1, {'@': 181}), 48: (1, {'@': 181})}, 29: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 26: (0, 50), 12: (0, 216), 13: (0, 73), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 31: (0, 184), 23: (0, 19), 25: (0, 176), 27: (0, 87), 28: (0, 156), 29: (0, 91), 30: (0, 166), 63: (0, 142), 32: (0, 173), 33: (0, 97), 34: (0, 146), 36: (0, 198)}, 30: {62: (0, 106)}, 31: {37: (1, {'@': 74}), 38: (1, {'@': 74}), 12: (1, {'@': 74}), 24: (1, {'@': 74}), 28: (1, {'@': 74}), 34: (1, {'@': 74}), 19: (1, {'@': 74}), 9: (1, {'@': 74}), 15: (1, {'@': 74}), 33: (1, {'@': 74}), 32: (1, {'@': 74}), 36: (1, {'@': 74}), 25: (1, {'@': 74}), 6: (1, {'@': 74}), 14: (1, {'@': 74}), 40: (1, {'@': 74}), 30: (1, {'@': 74}), 29: (1, {'@': 74}), 10: (1, {'@': 74}), 16: (1, {'@': 74}), 41: (1, {'@': 74}), 27: (1, {'@': 74}), 11: (1, {'@': 74})}, 32: {64: (1, {'@': 196}), 37: (1, {'@': 196})}, 33: {51: (1, {'@': 200}), 25: (1, {'@': 200}), 6: (1, {'@': 200}), 14: (1, {'@': 200}), 27: (1, {'@': 200}), 30: (1, {'@': 200}), 12: (1, {'@': 200}), 11: (1, {'@': 200}), 24: (1, {'@': 200}), 29: (1, {'@': 200}), 32: (1, {'@': 200}), 9: (1, {'@': 200}), 36: (1, {'@': 200})}, 34: {9: (0, 134), 6: (0, 167), 12: (0, 164), 27: (0, 171), 30: (0, 170), 36: (0, 238), 32: (0, 140), 25: (1, {'@': 97}), 14: (1, {'@': 97}), 24: (1, {'@': 97}), 29: (1, {'@': 97}), 28: (1, {'@': 97}), 34: (1, {'@': 97}), 19: (1, {'@': 97}), 8: (1, {'@': 97}), 10: (1, {'@': 97}), 15: (1, {'@': 97}), 16: (1, {'@': 97}), 11: (1, {'@': 97}), 33: (1, {'@': 97}), 42: (1, {'@': 97}), 37: (1, {'@': 97}), 43: (1, {'@': 97}), 40: (1, {'@': 97}), 38: (1, {'@': 97}), 44: (1, {'@': 97}), 41: (1, {'@': 97}), 39: (1, {'@': 97}), 45: (1, {'@': 97}), 51: (1, {'@': 97}), 46: (1, {'@': 97}), 47: (1, {'@': 97}), 48: (1, {'@': 97})}, 35: {53: (0, 88), 65: (0, 137), 37: (1, {'@': 84}), 25: (1, {'@': 84}), 6: (1, {'@': 84}), 14: (1, {'@': 84}), 40: (1, {'@': 84}), 30: (1, {'@': 84}), 38: (1, {'@': 84}), 12: (1, {'@': 84}), 24: (1, {'@': 84}), 28: (1, {'@': 84}), 34: (1, {'@': 84}), 29: (1, {'@': 84}), 19: (1, {'@': 84}), 9: (1, {'@': 84}), 10: (1, {'@': 84}), 15: (1, {'@': 84}), 16: (1, {'@': 84}), 41: (1, {'@': 84}), 27: (1, {'@': 84}), 11: (1, {'@': 84}), 33: (1, {'@': 84}), 32: (1, {'@': 84}), 36: (1, {'@': 84})}, 36: {46: (0, 143), 66: (0, 193), 67: (0, 177)}, 37: {25: (1, {'@': 58}), 6: (1, {'@': 58}), 14: (1, {'@': 58}), 30: (1, {'@': 58}), 12: (1, {'@': 58}), 24: (1, {'@': 58}), 29: (1, {'@': 58}), 28: (1, {'@': 58}), 34: (1, {'@': 58}), 19: (1, {'@': 58}), 8: (1, {'@': 58}), 9: (1, {'@': 58}), 10: (1, {'@': 58}), 15: (1, {'@': 58}), 16: (1, {'@': 58}), 27: (1, {'@': 58}), 11: (1, {'@': 58}), 33: (1, {'@': 58}), 32: (1, {'@': 58}), 36: (1, {'@': 58}), 42: (1, {'@': 58}), 37: (1, {'@': 58}), 43: (1, {'@': 58}), 40: (1, {'@': 58}), 38: (1, {'@': 58}), 44: (1, {'@': 58}), 41: (1, {'@': 58}), 39: (1, {'@': 58}), 45: (1, {'@': 58}), 46: (1, {'@': 58}), 47: (1, {'@': 58}), 48: (1, {'@': 58})}, 38: {12: (1, {'@': 177}), 24: (1, {'@': 177}), 28: (1, {'@': 177}), 34: (1, {'@': 177}), 19: (1, {'@': 177}), 9: (1, {'@': 177}), 15: (1, {'@': 177}), 33: (1, {'@': 177}), 32: (1, {'@': 177}), 36: (1, {'@': 177}), 25: (1, {'@': 177}), 6: (1, {'@': 177}), 14: (1, {'@': 177}), 30: (1, {'@': 177}), 29: (1, {'@': 177}), 10: (1, {'@': 177}), 16: (1, {'@': 177}), 27: (1, {'@': 177}), 11: (1, {'@': 177})}, 39: {68: (0, 188)}, 40: {37: (1, {'@': 194}), 12: (1, {'@': 194}), 24: (1, {'@': 194}), 38: (1, {'@': 194}), 28: (1, {'@': 194}), 34: (1, {'@': 194}), 19: (1, {'@': 194}), 9: (1, {'@': 194}), 15: (1, {'@': 194}), 33: (1, {'@': 194}), 32: (1, {'@': 194}), 36: (1, {'@': 194}), 25: (1, {'@': 194}), 6: (1, {'@': 194}), 14: (1, {'@': 194}), 40: (1, {'@': 194}), 30: (1, {'@': 194}), 29: (1, {'@': 194}), 10: (1, {'@': 194}), 16: (1, {'@': 194}), 46: (1, {'@': 194}), 41: (1, {'@': 194}), 27: (1, {'@': 194}), 11: (1, {'@': 194})}, 41: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 58: (0, 129), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 26: (0, 63), 38: (0, 131), 12: (0, 216), 13: (0, 73), 15: (0, 13), 14: (0, 29), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 40: (0, 35), 21: (0, 16), 22: (0, 211), 23: (0, 19), 37: (0, 69), 24: (0, 141), 25: (0, 176), 27: (0, 87), 28: (0, 156), 29: (0, 91), 30: (0, 166), 69: (0, 213), 32: (0, 173), 33: (0, 97), 34: (0, 146), 5: (0, 102), 31: (0, 154), 35: (0, 10), 36: (0, 198), 41: (1, {'@': 79})}, 42: {70: (0, 43)}, 43: {0: (0, 111), 71: (0, 21), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 15: (0, 13), 14: (0, 29), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 5: (0, 83), 26: (0, 85), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 31: (0, 8), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 44: {72: (0, 138), 60: (1, {'@': 233}), 61: (1, {'@': 233}), 62: (1, {'@': 233})}, 45: {37: (1, {'@': 136}), 38: (1, {'@': 136}), 12: (1, {'@': 136}), 24: (1, {'@': 136}), 28: (1, {'@': 136}), 34: (1, {'@': 136}), 19: (1, {'@': 136}), 9: (1, {'@': 136}), 15: (1, {'@': 136}), 33: (1, {'@': 136}), 32: (1, {'@': 136}), 36: (1, {'@': 136}), 25: (1, {'@': 136}), 6: (1, {'@': 136}), 14: (1, {'@': 136}), 40: (1, {'@': 136}), 30: (1, {'@': 136}), 29: (1, {'@': 136}), 10: (1, {'@': 136}), 16: (1, {'@': 136}), 41: (1, {'@': 136}), 27: (1, {'@': 136}), 11: (1, {'@': 136})}, 46: {37: (1, {'@': 128}), 25: (1, {'@': 128}), 43: (1, {'@': 128}), 6: (1, {'@': 128}), 14: (1, {'@': 128}), 40: (1, {'@': 128}), 30: (1, {'@': 128}), 38: (1, {'@': 128}), 12: (1, {'@': 128}), 24: (1, {'@': 128}), 28: (1, {'@': 128}), 34: (1, {'@': 128}), 29: (1, {'@': 128}), 19: (1, {'@': 128}), 9: (1, {'@': 128}), 10: (1, {'@': 128}), 15: (1, {'@': 128}), 16: (1, {'@': 128}), 44: (1, {'@': 128}), 41: (1, {'@': 128}), 27: (1, {'@': 128}), 11: (1, {'@': 128}), 33: (1, {'@': 128}), 32: (1, {'@': 128}), 36: (1, {'@': 128})}, 47: {25: (1, {'@': 67}), 6: (1, {'@': 67}), 14: (1, {'@': 67}), 30: (1, {'@': 67}), 12: (1, {'@': 67}), 24: (1, {'@': 67}), 29: (1, {'@': 67}), 28: (1, {'@': 67}), 34: (1, {'@': 67}), 19: (1, {'@': 67}), 8: (1, {'@': 67}), 9: (1, {'@': 67}), 10: (1, {'@': 67}), 15: (1, {'@': 67}), 16: (1, {'@': 67}), 27: (1, {'@': 67}), 11: (1, {'@': 67}), 33: (1, {'@': 67}), 32: (1, {'@': 67}), 36: (1, {'@': 67}), 42: (1, {'@': 67}), 37: (1, {'@': 67}), 43: (1, {'@': 67}), 40: (1, {'@': 67}), 38: (1, {'@': 67}), 44: (1, {'@': 67}), 41: (1, {'@': 67}), 39: (1, {'@': 67}), 45: (1, {'@': 67}), 46: (1, {'@': 67}), 47: (1, {'@': 67}), 48: (1, {'@': 67})}, 48: {37: (1, {'@': 171}), 12: (1, {'@': 171}), 24: (1, {'@': 171}), 38: (1, {'@': 171}), 28: (1, {'@': 171}), 34: (1, {'@': 171}), 19: (1, {'@': 171}), 9: (1, {'@': 171}), 15: (1, {'@': 171}), 39: (1, {'@': 171}), 33: (1, {'@': 171}), 32: (1, {'@': 171}), 36: (1, {'@': 171}), 25: (1, {'@': 171}), 6: (1, {'@': 171}), 14: (1, {'@': 171}), 40: (1, {'@': 171}), 30: (1, {'@': 171}), 29: (1, {'@': 171}), 10: (1, {'@': 171}), 16: (1, {'@': 171}), 41: (1, {'@': 171}), 27: (1, {'@': 171}), 11: (1, {'@': 171})}, 49: {73: (0, 57)}, 50: {15: (1, {'@': 173}), 16: (1, {'@': 173}), 25: (1, {'@': 173}), 6: (1, {'@': 173}), 14: (1, {'@': 173}), 27: (1, {'@': 173}), 30: (1, {'@': 173}), 12: (1, {'@': 173}), 9: (1, {'@': 173}), 11: (1, {'@': 173}), 28: (1, {'@': 173}), 29: (1, {'@': 173}), 32: (1, {'@': 173}), 33: (1, {'@': 173}), 19: (1, {'@': 173}), 34: (1, {'@': 173}), 10: (1, {'@': 173}), 36: (1, {'@': 173}), 24: (1, {'@': 173})}, 51: {38: (0, 58)}, 52: {60: (1, {'@': 230}), 61: (1, {'@': 230}), 62: (1, {'@': 230})}, 53: {51: (1, {'@': 201}), 25: (1, {'@': 201}), 6: (1, {'@': 201}), 14: (1, {'@': 201}), 27: (1, {'@': 201}), 30: (1, {'@': 201}), 12: (1, {'@': 201}), 11: (1, {'@': 201}), 24: (1, {'@': 201}), 29: (1, {'@': 201}), 32: (1, {'@': 201}), 9: (1, {'@': 201}), 36: (1, {'@': 201})}, 54: {42: (1, {'@': 131}), 12: (1, {'@': 131}), 24: (1, {'@': 131}), 28: (1, {'@': 131}), 34: (1, {'@': 131}), 19: (1, {'@': 131}), 9: (1, {'@': 131}), 15: (1, {'@': 131}), 33: (1, {'@': 131}), 32: (1, {'@': 131}), 36: (1, {'@': 131}), 25: (1, {'@': 131}), 6: (1, {'@': 131}), 14: (1, {'@': 131}), 30: (1, {'@': 131}), 29: (1, {'@': 131}), 10: (1, {'@': 131}), 16: (1, {'@': 131}), 27: (1, {'@': 131}), 11: (1, {'@': 131}), 45: (1, {'@': 131}), 8: (1, {'@': 131}), 46: (1, {'@': 131}), 47: (1, {'@': 131})}, 55: {42: (1, {'@': 133}), 12: (1, {'@': 133}), 24: (1, {'@': 133}), 28: (1, {'@': 133}), 34: (1, {'@': 133}), 19: (1, {'@': 133}), 9: (1, {'@': 133}), 15: (1, {'@': 133}), 33: (1, {'@': 133}), 32: (1, {'@': 133}), 36: (1, {'@': 133}), 25: (1, {'@': 133}), 6: (1, {'@': 133}), 14: (1, {'@': 133}), 30: (1, {'@': 133}), 29: (1, {'@': 133}), 10: (1, {'@': 133}), 16: (1, {'@': 133}), 27: (1, {'@': 133}), 11: (1, {'@': 133}), 45: (1, {'@': 133}), 8: (1, {'@': 133}), 46: (1, {'@': 133}), 47: (1, {'@': 133})}, 56: {25: (1, {'@': 56}), 6: (1, {'@': 56}), 14: (1, {'@': 56}), 30: (1, {'@': 56}), 12: (1, {'@': 56}), 24: (1, {'@': 56}), 29: (1, {'@': 56}), 28: (1, {'@': 56}), 34: (1, {'@': 56}), 19: (1, {'@': 56}), 8: (1, {'@': 56}), 9: (1, {'@': 56}), 10: (1, {'@': 56}), 15: (1, {'@': 56}), 16: (1, {'@': 56}), 27: (1, {'@': 56}), 11: (1, {'@': 56}), 33: (1, {'@': 56}), 32: (1, {'@': 56}), 36: (1, {'@': 56}), 42: (1, {'@': 56}), 37: (1, {'@': 56}), 43: (1, {'@': 56}), 40: (1, {'@': 56}), 38: (1, {'@': 56}), 44: (1, {'@': 56}), 41: (1, {'@': 56}), 39: (1, {'@': 56}), 45: (1, {'@': 56}), 46: (1, {'@': 56}), 47: (1, {'@': 56}), 48: (1, {'@': 56})}, 57: {54: (0, 2)}, 58: {37: (1, {'@': 100}), 25: (1, {'@': 100}), 43: (1, {'@': 100}), 6: (1, {'@': 100}), 14: (1, {'@': 100}), 40: (1, {'@': 100}), 30: (1, {'@': 100}), 38: (1, {'@': 100}), 12: (1, {'@': 100}), 24: (1, {'@': 100}), 28: (1, {'@': 100}), 34: (1, {'@': 100}), 29: (1, {'@': 100}), 19: (1, {'@': 100}), 9: (1, {'@': 100}), 10: (1, {'@': 100}), 15: (1, {'@': 100}), 16: (1, {'@': 100}), 44: (1, {'@': 100}), 41: (1, {'@': 100}), 27: (1, {'@': 100}), 11: (1, {'@': 100}), 33: (1, {'@': 100}), 32: (1, {'@': 100}), 36: (1, {'@': 100})}, 59: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 5: (0, 55), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 26: (0, 93), 27: (0, 87), 45: (0, 56), 28: (0, 156), 29: (0, 91), 30: (0, 166), 31: (0, 80), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 60: {12: (1, {'@': 237}), 24: (1, {'@': 237}), 28: (1, {'@': 237}), 34: (1, {'@': 237}), 19: (1, {'@': 237}), 74: (1, {'@': 237}), 9: (1, {'@': 237}), 15: (1, {'@': 237}), 33: (1, {'@': 237}), 32: (1, {'@': 237}), 36: (1, {'@': 237}), 25: (1, {'@': 237}), 6: (1, {'@': 237}), 14: (1, {'@': 237}), 30: (1, {'@': 237}), 29: (1, {'@': 237}), 10: (1, {'@': 237}), 16: (1, {'@': 237}), 27: (1, {'@': 237}), 11: (1, {'@': 237})}, 61: {25: (1, {'@': 93}), 6: (1, {'@': 93}), 14: (1, {'@': 93}), 30: (1, {'@': 93}), 12: (1, {'@': 93}), 24: (1, {'@': 93}), 29: (1, {'@': 93}), 28: (1, {'@': 93}), 34: (1, {'@': 93}), 19: (1, {'@': 93}), 8: (1, {'@': 93}), 9: (1, {'@': 93}), 10: (1, {'@': 93}), 15: (1, {'@': 93}), 16: (1, {'@': 93}), 27: (1, {'@': 93}), 11: (1, {'@': 93}), 33: (1, {'@': 93}), 32: (1, {'@': 93}), 36: (1, {'@': 93}), 42: (1, {'@': 93}), 37: (1, {'@': 93}), 43: (1, {'@': 93}), 40: (1, {'@': 93}), 38: (1, {'@': 93}), 44: (1, {'@': 93}), 41: (1, {'@': 93}), 39: (1, {'@': 93}), 45: (1, {'@': 93}), 51: (1, {'@': 93}), 46: (1, {'@': 93}), 47: (1, {'@': 93}), 48: (1, {'@': 93})}, 62: {37: (1, {'@': 217}), 12: (1, {'@': 217}), 24: (1, {'@': 217}), 38: (1, {'@': 217}), 28: (1, {'@': 217}), 34: (1, {'@': 217}), 19: (1, {'@': 217}), 9: (1, {'@': 217}), 15: (1, {'@': 217}), 33: (1, {'@': 217}), 32: (1, {'@': 217}), 36: (1, {'@': 217}), 25: (1, {'@': 217}), 6: (1, {'@': 217}), 14: (1, {'@': 217}), 40: (1, {'@': 217}), 30: (1, {'@': 217}), 29: (1, {'@': 217}), 10: (1, {'@': 217}), 16: (1, {'@': 217}), 41: (1, {'@': 217}), 27: (1, {'@': 217}), 11: (1, {'@': 217})}, 63: {37: (1, {'@': 146}), 38: (1, {'@': 146}), 12: (1, {'@': 146}), 24: (1, {'@': 146}), 28: (1, {'@': 146}), 34: (1, {'@': 146}), 19: (1, {'@': 146}), 9: (1, {'@': 146}), 15: (1, {'@': 146}), 33: (1, {'@': 146}), 32: (1, {'@': 146}), 36: (1, {'@': 146}), 25: (1, {'@': 146}), 6: (1, {'@': 146}), 14: (1, {'@': 146}), 40: (1, {'@': 146}), 30: (1, {'@': 146}), 29: (1, {'@': 146}), 10: (1, {'@': 146}), 16: (1, {'@': 146}), 41: (1, {'@': 146}), 27: (1, {'@': 146}), 11: (1, {'@': 146})}, 64: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 26: (0, 17), 5: (0, 48), 27: (0, 87), 28: (0, 156), 29: (0, 91), 31: (0, 239), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198), 37: (1, {'@': 90}), 40: (1, {'@': 90}), 38: (1, {'@': 90}), 41: (1, {'@': 90}), 39: (1, {'@': 90})}, 65: {37: (1, {'@': 75}), 38: (1, {'@': 75}), 12: (1, {'@': 75}), 24: (1, {'@': 75}), 28: (1, {'@': 75}), 34: (1, {'@': 75}), 19: (1, {'@': 75}), 9: (1, {'@': 75}), 15: (1, {'@': 75}), 33: (1, {'@': 75}), 32: (1, {'@': 75}), 36: (1, {'@': 75}), 25: (1, {'@': 75}), 6: (1, {'@': 75}), 14: (1, {'@': 75}), 40: (1, {'@': 75}), 30: (1, {'@': 75}), 29: (1, {'@': 75}), 10: (1, {'@': 75}), 16: (1, {'@': 75}), 41: (1, {'@': 75}), 27: (1, {'@': 75}), 11: (1, {'@': 75})}, 66: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 58: (0, 129), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 26: (0, 63), 38: (0, 131), 12: (0, 216), 13: (0, 73), 15: (0, 13), 14: (0, 29), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 40: (0, 35), 21: (0, 16), 22: (0, 211), 23: (0, 19), 37: (0, 69), 24: (0, 141), 25: (0, 176), 27: (0, 87), 28: (0, 156), 29: (0, 91), 30: (0, 166), 69: (0, 213), 32: (0, 173), 33: (0, 97), 34: (0, 146), 5: (0, 102), 31: (0, 154), 35: (0, 10), 36: (0, 198), 41: (1, {'@': 81})}, 67: {37: (1, {'@': 99})}, 68: {0: (0, 111), 58: (0, 95), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 31: (0, 158), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 75: (0, 20), 38: (0, 131), 11: (0, 152), 12: (0, 216), 13: (0, 73), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 44: (0, 123), 20: (0, 82), 21: (0, 16), 56: (0, 121), 23: (0, 19), 37: (0, 92), 25: (0, 176), 27: (0, 87), 55: (0, 5), 28: (0, 156), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 57: (0, 109), 43: (0, 163), 36: (0, 198), 14: (1, {'@': 123}), 40: (1, {'@': 123}), 24: (1, {'@': 123}), 29: (1, {'@': 123}), 41: (1, {'@': 123})}, 69: {37: (1, {'@': 147}), 38: (1, {'@': 147}), 12: (1, {'@': 147}), 24: (1, {'@': 147}), 28: (1, {'@': 147}), 34: (1, {'@': 147}), 19: (1, {'@': 147}), 9: (1, {'@': 147}), 15: (1, {'@': 147}), 33: (1, {'@': 147}), 32: (1, {'@': 147}), 36: (1, {'@': 147}), 25: (1, {'@': 147}), 6: (1, {'@': 147}), 14: (1, {'@': 147}), 40: (1, {'@': 147}), 30: (1, {'@': 147}), 29: (1, {'@': 147}), 10: (1, {'@': 147}), 16: (1, {'@': 147}), 41: (1, {'@': 147}), 27: (1, {'@': 147}), 11: (1, {'@': 147})}, 70: {37: (1, {'@': 127}), 25: (1, {'@': 127}), 43: (1, {'@': 127}), 6: (1, {'@': 127}), 14: (1, {'@': 127}), 40: (1, {'@': 127}), 30: (1, {'@': 127}), 38: (1, {'@': 127}), 12: (1, {'@': 127}), 24: (1, {'@': 127}), 28: (1, {'@': 127}), 34: (1, {'@': 127}), 29: (1, {'@': 127}), 19: (1, {'@': 127}), 9: (1, {'@': 127}), 10: (1, {'@': 127}), 15: (1, {'@': 127}), 16: (1, {'@': 127}), 44: (1, {'@': 127}), 41: (1, {'@': 127}), 27: (1, {'@': 127}), 11: (1, {'@': 127}), 33: (1, {'@': 127}), 32: (1, {'@': 127}), 36: (1, {'@': 127})}, 71: {25: (1, {'@': 180}), 6: (1, {'@': 180}), 14: (1, {'@': 180}), 30: (1, {'@': 180}), 12: (1, {'@': 180}), 24: (1, {'@': 180}), 29: (1, {'@': 180}), 28: (1, {'@': 180}), 34: (1, {'@': 180}), 19: (1, {'@': 180}), 8: (1, {'@': 180}), 9: (1, {'@': 180}), 10: (1, {'@': 180}), 15: (1, {'@': 180}), 16: (1, {'@': 180}), 27: (1, {'@': 180}), 11: (1, {'@': 180}), 33: (1, {'@': 180}), 32: (1, {'@': 180}), 36: (1, {'@': 180}), 42: (1, {'@': 180}), 37: (1, {'@': 180}), 43: (1, {'@': 180}), 38: (1, {'@': 180}), 40: (1, {'@': 180}), 44: (1, {'@': 180}), 41: (1, {'@': 180}), 39: (1, {'@': 180}), 45: (1, {'@': 180}), 51: (1, {'@': 180}), 46: (1, {'@': 180}), 47: (1, {'@': 180}), 48: (1, {'@': 180})}, 72: {0: (0, 111), 29: (0, 208), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 31: (0, 98), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 15: (0, 13), 14: (0, 29), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 5: (0, 221), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 28: (0, 156), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 73: {25: (1, {'@': 65}), 6: (1, {'@': 65}), 14: (1, {'@': 65}), 30: (1, {'@': 65}), 12: (1, {'@': 65}), 24: (1, {'@': 65}), 29: (1, {'@': 65}), 28: (1, {'@': 65}), 34: (1, {'@': 65}), 19: (1, {'@': 65}), 8: (1, {'@': 65}), 9: (1, {'@': 65}), 10: (1, {'@': 65}), 15: (1, {'@': 65}), 16: (1, {'@': 65}), 27: (1, {'@': 65}), 11: (1, {'@': 65}), 33: (1, {'@': 65}), 32: (1, {'@': 65}), 36: (1, {'@': 65}), 42: (1, {'@': 65}), 37: (1, {'@': 65}), 43: (1, {'@': 65}), 40: (1, {'@': 65}), 38: (1, {'@': 65}), 44: (1, {'@': 65}), 41: (1, {'@': 65}), 39: (1, {'@': 65}), 45: (1, {'@': 65}), 46: (1, {'@': 65}), 47: (1, {'@': 65}), 48: (1, {'@': 65})}, 74: {46: (0, 169)}, 75: {52: (0, 59), 0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 26: (0, 54), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 31: (0, 242), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 5: (0, 130), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 76: {48: (1, {'@': 160}), 37: (1, {'@': 160}), 25: (1, {'@': 160}), 6: (1, {'@': 160}), 14: (1, {'@': 160}), 40: (1, {'@': 160}), 30: (1, {'@': 160}), 38: (1, {'@': 160}), 12: (1, {'@': 160}), 24: (1, {'@': 160}), 28: (1, {'@': 160}), 34: (1, {'@': 160}), 29: (1, {'@': 160}), 19: (1, {'@': 160}), 9: (1, {'@': 160}), 10: (1, {'@': 160}), 15: (1, {'@': 160}), 16: (1, {'@': 160}), 41: (1, {'@': 160}), 27: (1, {'@': 160}), 11: (1, {'@': 160}), 33: (1, {'@': 160}), 32: (1, {'@': 160}), 36: (1, {'@': 160})}, 77: {48: (1, {'@': 154}), 37: (1, {'@': 154}), 12: (1, {'@': 154}), 24: (1, {'@': 154}), 38: (1, {'@': 154}), 28: (1, {'@': 154}), 34: (1, {'@': 154}), 19: (1, {'@': 154}), 9: (1, {'@': 154}), 15: (1, {'@': 154}), 33: (1, {'@': 154}), 32: (1, {'@': 154}), 36: (1, {'@': 154}), 25: (1, {'@': 154}), 6: (1, {'@': 154}), 14: (1, {'@': 154}), 40: (1, {'@': 154}), 30: (1, {'@': 154}), 29: (1, {'@': 154}), 10: (1, {'@': 154}), 16: (1, {'@': 154}), 41: (1, {'@': 154}), 27: (1, {'@': 154}), 11: (1, {'@': 154})}, 78: {25: (1, {'@': 109}), 6: (1, {'@': 109}), 14: (1, {'@': 109}), 30: (1, {'@': 109}), 12: (1, {'@': 109}), 24: (1, {'@': 109}), 29: (1, {'@': 109}), 28: (1, {'@': 109}), 34: (1, {'@': 109}), 19: (1, {'@': 109}), 8: (1, {'@': 109}), 9: (1, {'@': 109}), 10: (1, {'@': 109}), 15: (1, {'@': 109}), 16: (1, {'@': 109}), 27: (1, {'@': 109}), 11: (1, {'@': 109}), 33: (1, {'@': 109}), 32: (1, {'@': 109}), 36: (1, {'@': 109}), 42: (1, {'@': 109}), 37: (1, {'@': 109}), 43: (1, {'@': 109}), 40: (1, {'@': 109}), 38: (1, {'@': 109}), 44: (1, {'@': 109}), 41: (1, {'@': 109}), 39: (1, {'@': 109}), 45: (1, {'@': 109}), 51: (1, {'@': 109}), 46: (1, {'@': 109}), 47: (1, {'@': 109}), 48: (1, {'@': 109})}, 79: {37: (0, 96)}, 80: {42: (1, {'@': 135}), 12: (1, {'@': 135}), 24: (1, {'@': 135}), 28: (1, {'@': 135}), 34: (1, {'@': 135}), 19: (1, {'@': 135}), 9: (1, {'@': 135}), 15: (1, {'@': 135}), 33: (1, {'@': 135}), 32: (1, {'@': 135}), 36: (1, {'@': 135}), 25: (1, {'@': 135}), 6: (1, {'@': 135}), 14: (1, {'@': 135}), 30: (1, {'@': 135}), 29: (1, {'@': 135}), 10: (1, {'@': 135}), 16: (1, {'@': 135}), 27: (1, {'@': 135}), 11: (1, {'@': 135}), 45: (1, {'@': 135}), 8: (1, {'@': 135}), 46: (1, {'@': 135}), 47: (1, {'@': 135})}, 81: {37: (1, {'@': 101}), 25: (1, {'@': 101}), 43: (1, {'@': 101}), 6: (1, {'@': 101}), 14: (1, {'@': 101}), 40: (1, {'@': 101}), 30: (1, {'@': 101}), 38: (1, {'@': 101}), 12: (1, {'@': 101}), 24: (1, {'@': 101}), 28: (1, {'@': 101}), 34: (1, {'@': 101}), 29: (1, {'@': 101}), 19: (1, {'@': 101}), 9: (1, {'@': 101}), 10: (1, {'@': 101}), 15: (1, {'@': 101}), 16: (1, {'@': 101}), 44: (1, {'@': 101}), 41: (1, {'@': 101}), 27: (1, {'@': 101}), 11: (1, {'@': 101}), 33: (1, {'@': 101}), 32: (1, {'@': 101}), 36: (1, {'@': 101})}, 82: {25: (1, {'@': 66}), 6: (1, {'@': 66}), 14: (1, {'@': 66}), 30: (1, {'@': 66}), 12: (1, {'@': 66}), 24: (1, {'@': 66}), 29: (1, {'@': 66}), 28: (1, {'@': 66}), 34: (1, {'@': 66}), 19: (1, {'@': 66}), 8: (1, {'@': 66}), 9: (1, {'@': 66}), 10: (1, {'@': 66}), 15: (1, {'@': 66}), 16: (1, {'@': 66}), 27: (1, {'@': 66}), 11: (1, {'@': 66}), 33: (1, {'@': 66}), 32: (1, {'@': 66}), 36: (1, {'@': 66}), 42: (1, {'@': 66}), 37: (1, {'@': 66}), 43: (1, {'@': 66}), 40: (1, {'@': 66}), 38: (1, {'@': 66}), 44: (1, {'@': 66}), 41: (1, {'@': 66}), 39: (1, {'@': 66}), 45: (1, {'@': 66}), 46: (1, {'@': 66}), 47: (1, {'@': 66}), 48: (1, {'@': 66})}, 83: {37: (1, {'@': 215}), 12: (1, {'@': 215}), 24: (1, {'@': 215}), 38: (1, {'@': 215}), 28: (1, {'@': 215}), 34: (1, {'@': 215}), 19: (1, {'@': 215}), 9: (1, {'@': 215}), 15: (1, {'@': 215}), 33: (1, {'@': 215}), 32: (1, {'@': 215}), 36: (1, {'@': 215}), 25: (1, {'@': 215}), 6: (1, {'@': 215}), 14: (1, {'@': 215}), 40: (1, {'@': 215}), 30: (1, {'@': 215}), 29: (1, {'@': 215}), 10: (1, {'@': 215}), 16: (1, {'@': 215}), 41: (1, {'@': 215}), 27: (1, {'@': 215}), 11: (1, {'@': 215})}, 84: {37: (1, {'@': 167}), 12: (1, {'@': 167}), 24: (1, {'@': 167}), 38: (1, {'@': 167}), 28: (1, {'@': 167}), 34: (1, {'@': 167}), 19: (1, {'@': 167}), 9: (1, {'@': 167}), 15: (1, {'@': 167}), 39: (1, {'@': 167}), 33: (1, {'@': 167}), 32: (1, {'@': 167}), 36: (1, {'@': 167}), 25: (1, {'@': 167}), 6: (1, {'@': 167}), 14: (1, {'@': 167}), 40: (1, {'@': 167}), 30: (1, {'@': 167}), 29: (1, {'@': 167}), 10: (1, {'@': 167}), 16: (1, {'@': 167}), 41: (1, {'@': 167}), 27: (1, {'@': 167}), 11: (1, {'@': 167})}, 85: {37: (1, {'@': 216}), 12: (1, {'@': 216}), 24: (1, {'@': 216}), 38: (1, {'@': 216}), 28: (1, {'@': 216}), 34: (1, {'@': 216}), 19: (1, {'@': 216}), 9: (1, {'@': 216}), 15: (1, {'@': 216}), 33: (1, {'@': 216}), 32: (1, {'@': 216}), 36: (1, {'@': 216}), 25: (1, {'@': 216}), 6: (1, {'@': 216}), 14: (1, {'@': 216}), 40: (1, {'@': 216}), 30: (1, {'@': 216}), 29: (1, {'@': 216}), 10: (1, {'@': 216}), 16: (1, {'@': 216}), 41: (1, {'@': 216}), 27: (1, {'@': 216}), 11: (1, {'@': 216})}, 86: {37: (1, {'@': 73}), 38: (1, {'@': 73}), 12: (1, {'@': 73}), 24: (1, {'@': 73}), 28: (1, {'@': 73}), 34: (1, {'@': 73}), 19: (1, {'@': 73}), 9: (1, {'@': 73}), 15: (1, {'@': 73}), 33: (1, {'@': 73}), 32: (1, {'@': 73}), 36: (1, {'@': 73}), 25: (1, {'@': 73}), 6: (1, {'@': 73}), 14: (1, {'@': 73}), 40: (1, {'@': 73}), 30: (1, {'@': 73}), 29: (1, {'@': 73}), 10: (1, {'@': 73}), 16: (1, {'@': 73}), 41: (1, {'@': 73}), 27: (1, {'@': 73}), 11: (1, {'@': 73})}, 87: {25: (1, {'@': 186}), 6: (1, {'@': 186}), 14: (1, {'@': 186}), 30: (1, {'@': 186}), 12: (1, {'@': 186}), 24: (1, {'@': 186}), 29: (1, {'@': 186}), 28: (1, {'@': 186}), 34: (1, {'@': 186}), 19: (1, {'@': 186}), 8: (1, {'@': 186}), 9: (1, {'@': 186}), 10: (1, {'@': 186}), 15: (1, {'@': 186}), 16: (1, {'@': 186}), 27: (1, {'@': 186}), 11: (1, {'@': 186}), 33: (1, {'@': 186}), 32: (1, {'@': 186}), 36: (1, {'@': 186}), 42: (1, {'@': 186}), 37: (1, {'@': 186}), 43: (1, {'@': 186}), 38: (1, {'@': 186}), 40: (1, {'@': 186}), 44: (1, {'@': 186}), 41: (1, {'@': 186}), 39: (1, {'@': 186}), 45: (1, {'@': 186}), 51: (1, {'@': 186}), 46: (1, {'@': 186}), 47: (1, {'@': 186}), 48: (1, {'@': 186})}, 88: {37: (1, {'@': 148}), 38: (1, {'@': 148}), 12: (1, {'@': 148}), 24: (1, {'@': 148}), 28: (1, {'@': 148}), 34: (1, {'@': 148}), 19: (1, {'@': 148}), 9: (1, {'@': 148}), 15: (1, {'@': 148}), 33: (1, {'@': 148}), 32: (1, {'@': 148}), 36: (1, {'@': 148}), 53: (1, {'@': 148}), 25: (1, {'@': 148}), 6: (1, {'@': 148}), 14: (1, {'@': 148}), 40: (1, {'@': 148}), 30: (1, {'@': 148}), 29: (1, {'@': 148}), 10: (1, {'@': 148}), 16: (1, {'@': 148}), 41: (1, {'@': 148}), 27: (1, {'@': 148}), 11: (1, {'@': 148})}, 89: {37: (1, {'@': 141}), 38: (1, {'@': 141}), 12: (1, {'@': 141}), 24: (1, {'@': 141}), 28: (1, {'@': 141}), 34: (1, {'@': 141}), 19: (1, {'@': 141}), 9: (1, {'@': 141}), 15: (1, {'@': 141}), 33: (1, {'@': 141}), 32: (1, {'@': 141}), 36: (1, {'@': 141}), 25: (1, {'@': 141}), 6: (1, {'@': 141}), 14: (1, {'@': 141}), 40: (1, {'@': 141}), 30: (1, {'@': 141}), 29: (1, {'@': 141}), 10: (1, {'@': 141}), 16: (1, {'@': 141}), 41: (1, {'@': 141}), 27: (1, {'@': 141}), 11: (1, {'@': 141})}, 90: {12: (1, {'@': 176}), 24: (1, {'@': 176}), 28: (1, {'@': 176}), 34: (1, {'@': 176}), 19: (1, {'@': 176}), 9: (1, {'@': 176}), 15: (1, {'@': 176}), 33: (1, {'@': 176}), 32: (1, {'@': 176}), 36: (1, {'@': 176}), 25: (1, {'@': 176}), 6: (1, {'@': 176}), 14: (1, {'@': 176}), 30: (1, {'@': 176}), 29: (1, {'@': 176}), 10: (1, {'@': 176}), 16: (1, {'@': 176}), 27: (1, {'@': 176}), 11: (1, {'@': 176})}, 91: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 15: (0, 13), 14: (0, 29), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 76: (0, 72), 20: (0, 82), 21: (0, 16), 22: (0, 211), 5: (0, 38), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 28: (0, 156), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 31: (0, 90), 35: (0, 10), 36: (0, 198)}, 92: {37: (1, {'@': 222}), 43: (1, {'@': 222}), 38: (1, {'@': 222}), 12: (1, {'@': 222}), 24: (1, {'@': 222}), 28: (1, {'@': 222}), 34: (1, {'@': 222}), 19: (1, {'@': 222}), 9: (1, {'@': 222}), 15: (1, {'@': 222}), 33: (1, {'@': 222}), 32: (1, {'@': 222}), 36: (1, {'@': 222}), 25: (1, {'@': 222}), 6: (1, {'@': 222}), 14: (1, {'@': 222}), 40: (1, {'@': 222}), 30: (1, {'@': 222}), 29: (1, {'@': 222}), 10: (1, {'@': 222}), 16: (1, {'@': 222}), 44: (1, {'@': 222}), 41: (1, {'@': 222}), 27: (1, {'@': 222}), 11: (1, {'@': 222})}, 93: {42: (1, {'@': 134}), 12: (1, {'@': 134}), 24: (1, {'@': 134}), 28: (1, {'@': 134}), 34: (1, {'@': 134}), 19: (1, {'@': 134}), 9: (1, {'@': 134}), 15: (1, {'@': 134}), 33: (1, {'@': 134}), 32: (1, {'@': 134}), 36: (1, {'@': 134}), 25: (1, {'@': 134}), 6: (1, {'@': 134}), 14: (1, {'@': 134}), 30: (1, {'@': 134}), 29: (1, {'@': 134}), 10: (1, {'@': 134}), 16: (1, {'@': 134}), 27: (1, {'@': 134}), 11: (1, {'@': 134}), 45: (1, {'@': 134}), 8: (1, {'@': 134}), 46: (1, {'@': 134}), 47: (1, {'@': 134})}, 94: {64: (0, 241), 37: (0, 172)}, 95: {37: (1, {'@': 221}), 43: (1, {'@': 221}), 38: (1, {'@': 221}), 12: (1, {'@': 221}), 24: (1, {'@': 221}), 28: (1, {'@': 221}), 34: (1, {'@': 221}), 19: (1, {'@': 221}), 9: (1, {'@': 221}), 15: (1, {'@': 221}), 33: (1, {'@': 221}), 32: (1, {'@': 221}), 36: (1, {'@': 221}), 25: (1, {'@': 221}), 6: (1, {'@': 221}), 14: (1, {'@': 221}), 40: (1, {'@': 221}), 30: (1, {'@': 221}), 29: (1, {'@': 221}), 10: (1, {'@': 221}), 16: (1, {'@': 221}), 44: (1, {'@': 221}), 41: (1, {'@': 221}), 27: (1, {'@': 221}), 11: (1, {'@': 221})}, 96: {77: (0, 240), 78: (0, 51)}, 97: {0: (0, 111), 52: (0, 0), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 26: (0, 54), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 31: (0, 242), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 5: (0, 130), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 98: {12: (1, {'@': 178}), 24: (1, {'@': 178}), 28: (1, {'@': 178}), 34: (1, {'@': 178}), 19: (1, {'@': 178}), 9: (1, {'@': 178}), 15: (1, {'@': 178}), 33: (1, {'@': 178}), 32: (1, {'@': 178}), 36: (1, {'@': 178}), 25: (1, {'@': 178}), 6: (1, {'@': 178}), 14: (1, {'@': 178}), 30: (1, {'@': 178}), 29: (1, {'@': 178}), 10: (1, {'@': 178}), 16: (1, {'@': 178}), 27: (1, {'@': 178}), 11: (1, {'@': 178})}, 99: {79: (0, 94), 64: (0, 232)}, 100: {38: (0, 81)}, 101: {48: (1, {'@': 156}), 37: (1, {'@': 156}), 12: (1, {'@': 156}), 24: (1, {'@': 156}), 38: (1, {'@': 156}), 28: (1, {'@': 156}), 34: (1, {'@': 156}), 19: (1, {'@': 156}), 9: (1, {'@': 156}), 15: (1, {'@': 156}), 33: (1, {'@': 156}), 32: (1, {'@': 156}), 36: (1, {'@': 156}), 25: (1, {'@': 156}), 6: (1, {'@': 156}), 14: (1, {'@': 156}), 40: (1, {'@': 156}), 30: (1, {'@': 156}), 29: (1, {'@': 156}), 10: (1, {'@': 156}), 16: (1, {'@': 156}), 41: (1, {'@': 156}), 27: (1, {'@': 156}), 11: (1, {'@': 156})}, 102: {37: (1, {'@': 145}), 38: (1, {'@': 145}), 12: (1, {'@': 145}), 24: (1, {'@': 145}), 28: (1, {'@': 145}), 34: (1, {'@': 145}), 19: (1, {'@': 145}), 9: (1, {'@': 145}), 15: (1, {'@': 145}), 33: (1, {'@': 145}), 32: (1, {'@': 145}), 36: (1, {'@': 145}), 25: (1, {'@': 145}), 6: (1, {'@': 145}), 14: (1, {'@': 145}), 40: (1, {'@': 145}), 30: (1, {'@': 145}), 29: (1, {'@': 145}), 10: (1, {'@': 145}), 16: (1, {'@': 145}), 41: (1, {'@': 145}), 27: (1, {'@': 145}), 11: (1, {'@': 145})}, 103: {80: (0, 206), 48: (0, 179), 37: (1, {'@': 88}), 25: (1, {'@': 88}), 6: (1, {'@': 88}), 14: (1, {'@': 88}), 40: (1, {'@': 88}), 30: (1, {'@': 88}), 38: (1, {'@': 88}), 12: (1, {'@': 88}), 24: (1, {'@': 88}), 28: (1, {'@': 88}), 34: (1, {'@': 88}), 29: (1, {'@': 88}), 19: (1, {'@': 88}), 9: (1, {'@': 88}), 10: (1, {'@': 88}), 15: (1, {'@': 88}), 16: (1, {'@': 88}), 41: (1, {'@': 88}), 27: (1, {'@': 88}), 11: (1, {'@': 88}), 33: (1, {'@': 88}), 32: (1, {'@': 88}), 36: (1, {'@': 88})}, 104: {25: (1, {'@': 108}), 6: (1, {'@': 108}), 14: (1, {'@': 108}), 30: (1, {'@': 108}), 12: (1, {'@': 108}), 24: (1, {'@': 108}), 29: (1, {'@': 108}), 28: (1, {'@': 108}), 34: (1, {'@': 108}), 19: (1, {'@': 108}), 8: (1, {'@': 108}), 9: (1, {'@': 108}), 10: (1, {'@': 108}), 15: (1, {'@': 108}), 16: (1, {'@': 108}), 27: (1, {'@': 108}), 11: (1, {'@': 108}), 33: (1, {'@': 108}), 32: (1, {'@': 108}), 36: (1, {'@': 108}), 42: (1, {'@': 108}), 37: (1, {'@': 108}), 43: (1, {'@': 108}), 40: (1, {'@': 108}), 38: (1, {'@': 108}), 44: (1, {'@': 108}), 41: (1, {'@': 108}), 39: (1, {'@': 108}), 45: (1, {'@': 108}), 51: (1, {'@': 108}), 46: (1, {'@': 108}), 47: (1, {'@': 108}), 48: (1, {'@': 108})}, 105: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 31: (0, 165), 13: (0, 73), 59: (0, 205), 15: (0, 13), 14: (0, 29), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 5: (0, 1), 26: (0, 84), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 74: (0, 60), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 106: {72: (0, 192), 60: (1, {'@': 229}), 61: (1, {'@': 229}), 62: (1, {'@': 229})}, 107: {25: (1, {'@': 119}), 6: (1, {'@': 119}), 14: (1, {'@': 119}), 30: (1, {'@': 119}), 12: (1, {'@': 119}), 24: (1, {'@': 119}), 29: (1, {'@': 119}), 28: (1, {'@': 119}), 34: (1, {'@': 119}), 19: (1, {'@': 119}), 8: (1, {'@': 119}), 9: (1, {'@': 119}), 10: (1, {'@': 119}), 15: (1, {'@': 119}), 16: (1, {'@': 119}), 27: (1, {'@': 119}), 11: (1, {'@': 119}), 33: (1, {'@': 119}), 32: (1, {'@': 119}), 36: (1, {'@': 119}), 42: (1, {'@': 119}), 37: (1, {'@': 119}), 43: (1, {'@': 119}), 40: (1, {'@': 119}), 38: (1, {'@': 119}), 44: (1, {'@': 119}), 41: (1, {'@': 119}), 39: (1, {'@': 119}), 45: (1, {'@': 119}), 46: (1, {'@': 119}), 47: (1, {'@': 119}), 48: (1, {'@': 119})}, 108: {37: (1, {'@': 126}), 25: (1, {'@': 126}), 43: (1, {'@': 126}), 6: (1, {'@': 126}), 14: (1, {'@': 126}), 40: (1, {'@': 126}), 30: (1, {'@': 126}), 38: (1, {'@': 126}), 12: (1, {'@': 126}), 24: (1, {'@': 126}), 28: (1, {'@': 126}), 34: (1, {'@': 126}), 29: (1, {'@': 126}), 19: (1, {'@': 126}), 9: (1, {'@': 126}), 10: (1, {'@': 126}), 15: (1, {'@': 126}), 16: (1, {'@': 126}), 44: (1, {'@': 126}), 41: (1, {'@': 126}), 27: (1, {'@': 126}), 11: (1, {'@': 126}), 33: (1, {'@': 126}), 32: (1, {'@': 126}), 36: (1, {'@': 126})}, 109: {37: (1, {'@': 124}), 25: (1, {'@': 124}), 43: (1, {'@': 124}), 6: (1, {'@': 124}), 14: (1, {'@': 124}), 40: (1, {'@': 124}), 30: (1, {'@': 124}), 38: (1, {'@': 124}), 12: (1, {'@': 124}), 24: (1, {'@': 124}), 28: (1, {'@': 124}), 34: (1, {'@': 124}), 29: (1, {'@': 124}), 19: (1, {'@': 124}), 9: (1, {'@': 124}), 10: (1, {'@': 124}), 15: (1, {'@': 124}), 16: (1, {'@': 124}), 44: (1, {'@': 124}), 41: (1, {'@': 124}), 27: (1, {'@': 124}), 11: (1, {'@': 124}), 33: (1, {'@': 124}), 32: (1, {'@': 124}), 36: (1, {'@': 124})}, 110: {37: (1, {'@': 219}), 12: (1, {'@': 219}), 24: (1, {'@': 219}), 38: (1, {'@': 219}), 28: (1, {'@': 219}), 34: (1, {'@': 219}), 19: (1, {'@': 219}), 9: (1, {'@': 219}), 15: (1, {'@': 219}), 33: (1, {'@': 219}), 32: (1, {'@': 219}), 36: (1, {'@': 219}), 25: (1, {'@': 219}), 6: (1, {'@': 219}), 14: (1, {'@': 219}), 40: (1, {'@': 219}), 30: (1, {'@': 219}), 29: (1, {'@': 219}), 10: (1, {'@': 219}), 16: (1, {'@': 219}), 41: (1, {'@': 219}), 27: (1, {'@': 219}), 11: (1, {'@': 219})}, 111: {25: (1, {'@': 63}), 6: (1, {'@': 63}), 14: (1, {'@': 63}), 30: (1, {'@': 63}), 12: (1, {'@': 63}), 24: (1, {'@': 63}), 29: (1, {'@': 63}), 28: (1, {'@': 63}), 34: (1, {'@': 63}), 19: (1, {'@': 63}), 8: (1, {'@': 63}), 9: (1, {'@': 63}), 10: (1, {'@': 63}), 15: (1, {'@': 63}), 16: (1, {'@': 63}), 27: (1, {'@': 63}), 11: (1, {'@': 63}), 33: (1, {'@': 63}), 32: (1, {'@': 63}), 36: (1, {'@': 63}), 42: (1, {'@': 63}), 37: (1, {'@': 63}), 43: (1, {'@': 63}), 40: (1, {'@': 63}), 38: (1, {'@': 63}), 44: (1, {'@': 63}), 41: (1, {'@': 63}), 39: (1, {'@': 63}), 45: (1, {'@': 63}), 46: (1, {'@': 63}), 47: (1, {'@': 63}), 48: (1, {'@': 63})}, 112: {72: (0, 52), 60: (1, {'@': 231}), 61: (1, {'@': 231}), 62: (1, {'@': 231})}, 113: {25: (1, {'@': 64}), 6: (1, {'@': 64}), 14: (1, {'@': 64}), 30: (1, {'@': 64}), 12: (1, {'@': 64}), 24: (1, {'@': 64}), 29: (1, {'@': 64}), 28: (1, {'@': 64}), 34: (1, {'@': 64}), 19: (1, {'@': 64}), 8: (1, {'@': 64}), 9: (1, {'@': 64}), 10: (1, {'@': 64}), 15: (1, {'@': 64}), 16: (1, {'@': 64}), 27: (1, {'@': 64}), 11: (1, {'@': 64}), 33: (1, {'@': 64}), 32: (1, {'@': 64}), 36: (1, {'@': 64}), 42: (1, {'@': 64}), 37: (1, {'@': 64}), 43: (1, {'@': 64}), 40: (1, {'@': 64}), 38: (1, {'@': 64}), 44: (1, {'@': 64}), 41: (1, {'@': 64}), 39: (1, {'@': 64}), 45: (1, {'@': 64}), 46: (1, {'@': 64}), 47: (1, {'@': 64}), 48: (1, {'@': 64})}, 114: {37: (0, 181), 25: (1, {'@': 165}), 6: (1, {'@': 165}), 14: (1, {'@': 165}), 40: (1, {'@': 165}), 30: (1, {'@': 165}), 38: (1, {'@': 165}), 12: (1, {'@': 165}), 24: (1, {'@': 165}), 28: (1, {'@': 165}), 34: (1, {'@': 165}), 29: (1, {'@': 165}), 19: (1, {'@': 165}), 9: (1, {'@': 165}), 10: (1, {'@': 165}), 15: (1, {'@': 165}), 16: (1, {'@': 165}), 41: (1, {'@': 165}), 39: (1, {'@': 165}), 27: (1, {'@': 165}), 11: (1, {'@': 165}), 33: (1, {'@': 165}), 32: (1, {'@': 165}), 36: (1, {'@': 165})}, 115: {81: (0, 207), 82: (0, 209)}, 116: {25: (1, {'@': 91})}, 117: {15: (1, {'@': 174}), 16: (1, {'@': 174}), 25: (1, {'@': 174}), 6: (1, {'@': 174}), 14: (1, {'@': 174}), 27: (1, {'@': 174}), 30: (1, {'@': 174}), 12: (1, {'@': 174}), 9: (1, {'@': 174}), 11: (1, {'@': 174}), 28: (1, {'@': 174}), 29: (1, {'@': 174}), 32: (1, {'@': 174}), 33: (1, {'@': 174}), 19: (1, {'@': 174}), 34: (1, {'@': 174}), 10: (1, {'@': 174}), 36: (1, {'@': 174}), 24: (1, {'@': 174})}, 118: {25: (1, {'@': 113}), 6: (1, {'@': 113}), 14: (1, {'@': 113}), 30: (1, {'@': 113}), 12: (1, {'@': 113}), 24: (1, {'@': 113}), 29: (1, {'@': 113}), 28: (1, {'@': 113}), 34: (1, {'@': 113}), 19: (1, {'@': 113}), 8: (1, {'@': 113}), 9: (1, {'@': 113}), 10: (1, {'@': 113}), 15: (1, {'@': 113}), 16: (1, {'@': 113}), 27: (1, {'@': 113}), 11: (1, {'@': 113}), 33: (1, {'@': 113}), 32: (1, {'@': 113}), 36: (1, {'@': 113}), 42: (1, {'@': 113}), 37: (1, {'@': 113}), 43: (1, {'@': 113}), 40: (1, {'@': 113}), 38: (1, {'@': 113}), 44: (1, {'@': 113}), 41: (1, {'@': 113}), 39: (1, {'@': 113}), 45: (1, {'@': 113}), 46: (1, {'@': 113}), 47: (1, {'@': 113}), 48: (1, {'@': 113})}, 119: {25: (1, {'@': 61}), 6: (1, {'@': 61}), 14: (1, {'@': 61}), 30: (1, {'@': 61}), 12: (1, {'@': 61}), 24: (1, {'@': 61}), 29: (1, {'@': 61}), 28: (1, {'@': 61}), 34: (1, {'@': 61}), 19: (1, {'@': 61}), 8: (1, {'@': 61}), 9: (1, {'@': 61}), 10: (1, {'@': 61}), 15: (1, {'@': 61}), 16: (1, {'@': 61}), 27: (1, {'@': 61}), 11: (1, {'@': 61}), 33: (1, {'@': 61}), 32: (1, {'@': 61}), 36: (1, {'@': 61}), 42: (1, {'@': 61}), 37: (1, {'@': 61}), 43: (1, {'@': 61}), 40: (1, {'@': 61}), 38: (1, {'@': 61}), 44: (1, {'@': 61}), 41: (1, {'@': 61}), 39: (1, {'@': 61}), 45: (1, {'@': 61}), 46: (1, {'@': 61}), 47: (1, {'@': 61}), 48: (1, {'@': 61})}, 120: {25: (0, 214)}, 121: {37: (1, {'@': 223}), 43: (1, {'@': 223}), 38: (1, {'@': 223}), 12: (1, {'@': 223}), 24: (1, {'@': 223}), 28: (1, {'@': 223}), 34: (1, {'@': 223}), 19: (1, {'@': 223}), 9: (1, {'@': 223}), 15: (1, {'@': 223}), 33: (1, {'@': 223}), 32: (1, {'@': 223}), 36: (1, {'@': 223}), 25: (1, {'@': 223}), 6: (1, {'@': 223}), 14: (1, {'@': 223}), 40: (1, {'@': 223}), 30: (1, {'@': 223}), 29: (1, {'@': 223}), 10: (1, {'@': 223}), 16: (1, {'@': 223}), 44: (1, {'@': 223}), 41: (1, {'@': 223}), 27: (1, {'@': 223}), 11: (1, {'@': 223})}, 122: {25: (1, {'@': 111}), 6: (1, {'@': 111}), 14: (1, {'@': 111}), 30: (1, {'@': 111}), 12: (1, {'@': 111}), 24: (1, {'@': 111}), 29: (1, {'@': 111}), 28: (1, {'@': 111}), 34: (1, {'@': 111}), 19: (1, {'@': 111}), 8: (1, {'@': 111}), 9: (1, {'@': 111}), 10: (1, {'@': 111}), 15: (1, {'@': 111}), 16: (1, {'@': 111}), 27: (1, {'@': 111}), 11: (1, {'@': 111}), 33: (1, {'@': 111}), 32: (1, {'@': 111}), 36: (1, {'@': 111}), 42: (1, {'@': 111}), 37: (1, {'@': 111}), 43: (1, {'@': 111}), 40: (1, {'@': 111}), 38: (1, {'@': 111}), 44: (1, {'@': 111}), 41: (1, {'@': 111}), 39: (1, {'@': 111}), 45: (1, {'@': 111}), 46: (1, {'@': 111}), 47: (1, {'@': 111}), 48: (1, {'@': 111})}, 123: {83: (0, 147)}, 124: {48: (1, {'@': 151}), 37: (1, {'@': 151}), 12: (1, {'@': 151}), 24: (1, {'@': 151}), 38: (1, {'@': 151}), 28: (1, {'@': 151}), 34: (1, {'@': 151}), 19: (1, {'@': 151}), 9: (1, {'@': 151}), 15: (1, {'@': 151}), 33: (1, {'@': 151}), 32: (1, {'@': 151}), 36: (1, {'@': 151}), 25: (1, {'@': 151}), 6: (1, {'@': 151}), 14: (1, {'@': 151}), 40: (1, {'@': 151}), 30: (1, {'@': 151}), 29: (1, {'@': 151}), 10: (1, {'@': 151}), 16: (1, {'@': 151}), 41: (1, {'@': 151}), 27: (1, {'@': 151}), 11: (1, {'@': 151})}, 125: {25: (1, {'@': 114}), 6: (1, {'@': 114}), 14: (1, {'@': 114}), 30: (1, {'@': 114}), 12: (1, {'@': 114}), 24: (1, {'@': 114}), 29: (1, {'@': 114}), 28: (1, {'@': 114}), 34: (1, {'@': 114}), 19: (1, {'@': 114}), 8: (1, {'@': 114}), 9: (1, {'@': 114}), 10: (1, {'@': 114}), 15: (1, {'@': 114}), 16: (1, {'@': 114}), 27: (1, {'@': 114}), 11: (1, {'@': 114}), 33: (1, {'@': 114}), 32: (1, {'@': 114}), 36: (1, {'@': 114}), 42: (1, {'@': 114}), 37: (1, {'@': 114}), 43: (1, {'@': 114}), 40: (1, {'@': 114}), 38: (1, {'@': 114}), 44: (1, {'@': 114}), 41: (1, {'@': 114}), 39: (1, {'@': 114}), 45: (1, {'@': 114}), 46: (1, {'@': 114}), 47: (1, {'@': 114}), 48: (1, {'@': 114})}, 126: {0: (0, 111), 84: (0, 41), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 5: (0, 27), 38: (0, 131), 11: (0, 152), 58: (0, 24), 12: (0, 216), 13: (0, 73), 15: (0, 13), 14: (0, 29), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 40: (0, 35), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 26: (0, 194), 37: (0, 89), 27: (0, 87), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 31: (0, 175), 33: (0, 97), 69: (0, 45), 34: (0, 146), 35: (0, 10), 36: (0, 198), 41: (1, {'@': 80})}, 127: {48: (1, {'@': 150}), 37: (1, {'@': 150}), 12: (1, {'@': 150}), 24: (1, {'@': 150}), 38: (1, {'@': 150}), 28: (1, {'@': 150}), 34: (1, {'@': 150}), 19: (1, {'@': 150}), 9: (1, {'@': 150}), 15: (1, {'@': 150}), 33: (1, {'@': 150}), 32: (1, {'@': 150}), 36: (1, {'@': 150}), 25: (1, {'@': 150}), 6: (1, {'@': 150}), 14: (1, {'@': 150}), 40: (1, {'@': 150}), 30: (1, {'@': 150}), 29: (1, {'@': 150}), 10: (1, {'@': 150}), 16: (1, {'@': 150}), 41: (1, {'@': 150}), 27: (1, {'@': 150}), 11: (1, {'@': 150})}, 128: {}, 129: {37: (1, {'@': 143}), 38: (1, {'@': 143}), 12: (1, {'@': 143}), 24: (1, {'@': 143}), 28: (1, {'@': 143}), 34: (1, {'@': 143}), 19: (1, {'@': 143}), 9: (1, {'@': 143}), 15: (1, {'@': 143}), 33: (1, {'@': 143}), 32: (1, {'@': 143}), 36: (1, {'@': 143}), 25: (1, {'@': 143}), 6: (1, {'@': 143}), 14: (1, {'@': 143}), 40: (1, {'@': 143}), 30: (1, {'@': 143}), 29: (1, {'@': 143}), 10: (1, {'@': 143}), 16: (1, {'@': 143}), 41: (1, {'@': 143}), 27: (1, {'@': 143}), 11: (1, {'@': 143})}, 130: {42: (1, {'@': 130}), 12: (1, {'@': 130}), 24: (1, {'@': 130}), 28: (1, {'@': 130}), 34: (1, {'@': 130}), 19: (1, {'@': 130}), 9: (1, {'@': 130}), 15: (1, {'@': 130}), 33: (1, {'@': 130}), 32: (1, {'@': 130}), 36: (1, {'@': 130}), 25: (1, {'@': 130}), 6: (1, {'@': 130}), 14: (1, {'@': 130}), 30: (1, {'@': 130}), 29: (1, {'@': 130}), 10: (1, {'@': 130}), 16: (1, {'@': 130}), 27: (1, {'@': 130}), 11: (1, {'@': 130}), 45: (1, {'@': 130}), 8: (1, {'@': 130}), 46: (1, {'@': 130}), 47: (1, {'@': 130})}, 131: {85: (0, 67), 37: (0, 244), 86: (0, 79)}, 132: {62: (0, 44)}, 133: {87: (0, 31), 1: (0, 34), 4: (0, 47), 88: (0, 65), 84: (0, 66), 58: (0, 195), 69: (0, 189), 46: (0, 143), 14: (0, 29), 40: (0, 35), 22: (0, 211), 23: (0, 19), 89: (0, 215), 24: (0, 141), 25: (0, 176), 26: (0, 194), 10: (0, 139), 90: (0, 190), 11: (0, 152), 34: (0, 146), 91: (0, 233), 0: (0, 111), 39: (0, 23), 9: (0, 71), 5: (0, 27), 13: (0, 73), 16: (0, 75), 17: (0, 119), 18: (0, 113), 44: (0, 123), 92: (0, 126), 38: (0, 131), 28: (0, 156), 93: (0, 128), 56: (0, 68), 35: (0, 10), 94: (0, 105), 2: (0, 144), 3: (0, 15), 95: (0, 228), 12: (0, 216), 67: (0, 249), 19: (0, 3), 96: (0, 250), 55: (0, 5), 33: (0, 97), 97: (0, 103), 80: (0, 217), 74: (0, 197), 6: (0, 28), 98: (0, 6), 7: (0, 11), 15: (0, 13), 20: (0, 82), 21: (0, 16), 99: (0, 86), 27: (0, 87), 37: (0, 89), 29: (0, 91), 30: (0, 166), 100: (0, 153), 32: (0, 173), 31: (0, 175), 48: (0, 179), 57: (0, 109), 43: (0, 163), 101: (0, 212), 36: (0, 198), 41: (1, {'@': 82})}, 134: {25: (1, {'@': 187}), 6: (1, {'@': 187}), 14: (1, {'@': 187}), 30: (1, {'@': 187}), 12: (1, {'@': 187}), 24: (1, {'@': 187}), 29: (1, {'@': 187}), 28: (1, {'@': 187}), 34: (1, {'@': 187}), 19: (1, {'@': 187}), 8: (1, {'@': 187}), 9: (1, {'@': 187}), 10: (1, {'@': 187}), 15: (1, {'@': 187}), 16: (1, {'@': 187}), 27: (1, {'@': 187}), 11: (1, {'@': 187}), 33: (1, {'@': 187}), 32: (1, {'@': 187}), 36: (1, {'@': 187}), 42: (1, {'@': 187}), 37: (1, {'@': 187}), 43: (1, {'@': 187}), 38: (1, {'@': 187}), 40: (1, {'@': 187}), 44: (1, {'@': 187}), 41: (1, {'@': 187}), 39: (1, {'@': 187}), 45: (1, {'@': 187}), 51: (1, {'@': 187}), 46: (1, {'@': 187}), 47: (1, {'@': 187}), 48: (1, {'@': 187})}, 135: {46: (0, 40)}, 136: {37: (1, {'@': 199}), 25: (1, {'@': 199}), 6: (1, {'@': 199}), 14: (1, {'@': 199}), 40: (1, {'@': 199}), 30: (1, {'@': 199}), 38: (1, {'@': 199}), 12: (1, {'@': 199}), 24: (1, {'@': 199}), 28: (1, {'@': 199}), 34: (1, {'@': 199}), 29: (1, {'@': 199}), 19: (1, {'@': 199}), 9: (1, {'@': 199}), 10: (1, {'@': 199}), 15: (1, {'@': 199}), 16: (1, {'@': 199}), 46: (1, {'@': 199}), 41: (1, {'@': 199}), 27: (1, {'@': 199}), 11: (1, {'@': 199}), 33: (1, {'@': 199}), 32: (1, {'@': 199}), 36: (1, {'@': 199})}, 137: {53: (0, 14), 37: (1, {'@': 83}), 25: (1, {'@': 83}), 6: (1, {'@': 83}), 14: (1, {'@': 83}), 40: (1, {'@': 83}), 30: (1, {'@': 83}), 38: (1, {'@': 83}), 12: (1, {'@': 83}), 24: (1, {'@': 83}), 28: (1, {'@': 83}), 34: (1, {'@': 83}), 29: (1, {'@': 83}), 19: (1, {'@': 83}), 9: (1, {'@': 83}), 10: (1, {'@': 83}), 15: (1, {'@': 83}), 16: (1, {'@': 83}), 41: (1, {'@': 83}), 27: (1, {'@': 83}), 11: (1, {'@': 83}), 33: (1, {'@': 83}), 32: (1, {'@': 83}), 36: (1, {'@': 83})}, 138: {60: (1, {'@': 232}), 61: (1, {'@': 232}), 62: (1, {'@': 232})}, 139: {1: (0, 34), 6: (0, 28), 102: (0, 230), 9: (0, 71), 11: (0, 152), 26: (0, 145), 0: (0, 33), 12: (0, 216), 5: (0, 231), 14: (0, 29), 22: (0, 211), 24: (0, 141), 25: (0, 176), 18: (0, 243), 27: (0, 87), 51: (0, 155), 23: (0, 53), 29: (0, 91), 30: (0, 166), 32: (0, 173), 35: (0, 10), 36: (0, 198)}, 140: {25: (1, {'@': 189}), 6: (1, {'@': 189}), 14: (1, {'@': 189}), 30: (1, {'@': 189}), 12: (1, {'@': 189}), 24: (1, {'@': 189}), 29: (1, {'@': 189}), 28: (1, {'@': 189}), 34: (1, {'@': 189}), 19: (1, {'@': 189}), 8: (1, {'@': 189}), 9: (1, {'@': 189}), 10: (1, {'@': 189}), 15: (1, {'@': 189}), 16: (1, {'@': 189}), 27: (1, {'@': 189}), 11: (1, {'@': 189}), 33: (1, {'@': 189}), 32: (1, {'@': 189}), 36: (1, {'@': 189}), 42: (1, {'@': 189}), 37: (1, {'@': 189}), 43: (1, {'@': 189}), 38: (1, {'@': 189}), 40: (1, {'@': 189}), 44: (1, {'@': 189}), 41: (1, {'@': 189}), 39: (1, {'@': 189}), 45: (1, {'@': 189}), 51: (1, {'@': 189}), 46: (1, {'@': 189}), 47: (1, {'@': 189}), 48: (1, {'@': 189})}, 141: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 63: (0, 148), 11: (0, 152), 26: (0, 50), 12: (0, 216), 13: (0, 73), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 31: (0, 184), 23: (0, 19), 25: (0, 176), 27: (0, 87), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 36: (0, 198)}, 142: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 26: (0, 245), 20: (0, 82), 21: (0, 16), 23: (0, 19), 25: (0, 176), 27: (0, 87), 31: (0, 117), 14: (0, 222), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 36: (0, 198)}, 143: {0: (0, 111), 52: (0, 224), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 26: (0, 54), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 31: (0, 242), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 103: (0, 235), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 5: (0, 130), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 104: (0, 135), 35: (0, 10), 36: (0, 198)}, 144: {25: (1, {'@': 62}), 6: (1, {'@': 62}), 14: (1, {'@': 62}), 30: (1, {'@': 62}), 12: (1, {'@': 62}), 24: (1, {'@': 62}), 29: (1, {'@': 62}), 28: (1, {'@': 62}), 34: (1, {'@': 62}), 19: (1, {'@': 62}), 8: (1, {'@': 62}), 9: (1, {'@': 62}), 10: (1, {'@': 62}), 15: (1, {'@': 62}), 16: (1, {'@': 62}), 27: (1, {'@': 62}), 11: (1, {'@': 62}), 33: (1, {'@': 62}), 32: (1, {'@': 62}), 36: (1, {'@': 62}), 42: (1, {'@': 62}), 37: (1, {'@': 62}), 43: (1, {'@': 62}), 40: (1, {'@': 62}), 38: (1, {'@': 62}), 44: (1, {'@': 62}), 41: (1, {'@': 62}), 39: (1, {'@': 62}), 45: (1, {'@': 62}), 46: (1, {'@': 62}), 47: (1, {'@': 62}), 48: (1, {'@': 62})}, 145: {51: (1, {'@': 204}), 25: (1, {'@': 204}), 6: (1, {'@': 204}), 14: (1, {'@': 204}), 27: (1, {'@': 204}), 30: (1, {'@': 204}), 12: (1, {'@': 204}), 11: (1, {'@': 204}), 24: (1, {'@': 204}), 29: (1, {'@': 204}), 32: (1, {'@': 204}), 9: (1, {'@': 204}), 36: (1, {'@': 204})}, 146: {0: (0, 111), 52: (0, 168), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 26: (0, 54), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 31: (0, 242), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 5: (0, 130), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 147: {60: (0, 30), 105: (0, 201), 62: (0, 112), 61: (0, 70)}, 148: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 26: (0, 245), 20: (0, 82), 21: (0, 16), 23: (0, 19), 25: (0, 176), 27: (0, 87), 31: (0, 117), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 24: (0, 237), 36: (0, 198)}, 149: {0: (0, 111), 58: (0, 95), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 31: (0, 158), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 75: (0, 196), 38: (0, 131), 11: (0, 152), 12: (0, 216), 13: (0, 73), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 44: (0, 123), 20: (0, 82), 21: (0, 16), 56: (0, 121), 23: (0, 19), 37: (0, 92), 25: (0, 176), 27: (0, 87), 55: (0, 5), 28: (0, 156), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 57: (0, 109), 43: (0, 163), 36: (0, 198), 14: (1, {'@': 121}), 40: (1, {'@': 121}), 24: (1, {'@': 121}), 29: (1, {'@': 121}), 41: (1, {'@': 121})}, 150: {81: (0, 122)}, 151: {72: (0, 26), 60: (1, {'@': 235}), 61: (1, {'@': 235}), 62: (1, {'@': 235})}, 152: {106: (0, 12), 51: (0, 115)}, 153: {37: (0, 159), 25: (1, {'@': 211}), 6: (1, {'@': 211}), 14: (1, {'@': 211}), 40: (1, {'@': 211}), 30: (1, {'@': 211}), 38: (1, {'@': 211}), 12: (1, {'@': 211}), 24: (1, {'@': 211}), 28: (1, {'@': 211}), 34: (1, {'@': 211}), 29: (1, {'@': 211}), 19: (1, {'@': 211}), 9: (1, {'@': 211}), 10: (1, {'@': 211}), 15: (1, {'@': 211}), 16: (1, {'@': 211}), 41: (1, {'@': 211}), 27: (1, {'@': 211}), 11: (1, {'@': 211}), 33: (1, {'@': 211}), 32: (1, {'@': 211}), 36: (1, {'@': 211})}, 154: {37: (1, {'@': 144}), 38: (1, {'@': 144}), 12: (1, {'@': 144}), 24: (1, {'@': 144}), 28: (1, {'@': 144}), 34: (1, {'@': 144}), 19: (1, {'@': 144}), 9: (1, {'@': 144}), 15: (1, {'@': 144}), 33: (1, {'@': 144}), 32: (1, {'@': 144}), 36: (1, {'@': 144}), 25: (1, {'@': 144}), 6: (1, {'@': 144}), 14: (1, {'@': 144}), 40: (1, {'@': 144}), 30: (1, {'@': 144}), 29: (1, {'@': 144}), 10: (1, {'@': 144}), 16: (1, {'@': 144}), 41: (1, {'@': 144}), 27: (1, {'@': 144}), 11: (1, {'@': 144})}, 155: {81: (0, 125), 82: (0, 174)}, 156: {107: (0, 4), 108: (0, 74)}, 157: {49: (0, 42)}, 158: {37: (1, {'@': 220}), 43: (1, {'@': 220}), 38: (1, {'@': 220}), 12: (1, {'@': 220}), 24: (1, {'@': 220}), 28: (1, {'@': 220}), 34: (1, {'@': 220}), 19: (1, {'@': 220}), 9: (1, {'@': 220}), 15: (1, {'@': 220}), 33: (1, {'@': 220}), 32: (1, {'@': 220}), 36: (1, {'@': 220}), 25: (1, {'@': 220}), 6: (1, {'@': 220}), 14: (1, {'@': 220}), 40: (1, {'@': 220}), 30: (1, {'@': 220}), 29: (1, {'@': 220}), 10: (1, {'@': 220}), 16: (1, {'@': 220}), 44: (1, {'@': 220}), 41: (1, {'@': 220}), 27: (1, {'@': 220}), 11: (1, {'@': 220})}, 159: {37: (1, {'@': 210}), 25: (1, {'@': 210}), 6: (1, {'@': 210}), 14: (1, {'@': 210}), 40: (1, {'@': 210}), 30: (1, {'@': 210}), 38: (1, {'@': 210}), 12: (1, {'@': 210}), 24: (1, {'@': 210}), 28: (1, {'@': 210}), 34: (1, {'@': 210}), 29: (1, {'@': 210}), 19: (1, {'@': 210}), 9: (1, {'@': 210}), 10: (1, {'@': 210}), 15: (1, {'@': 210}), 16: (1, {'@': 210}), 41: (1, {'@': 210}), 27: (1, {'@': 210}), 11: (1, {'@': 210}), 33: (1, {'@': 210}), 32: (1, {'@': 210}), 36: (1, {'@': 210})}, 160: {37: (1, {'@': 162}), 25: (1, {'@': 162}), 6: (1, {'@': 162}), 14: (1, {'@': 162}), 40: (1, {'@': 162}), 30: (1, {'@': 162}), 38: (1, {'@': 162}), 12: (1, {'@': 162}), 24: (1, {'@': 162}), 28: (1, {'@': 162}), 34: (1, {'@': 162}), 29: (1, {'@': 162}), 19: (1, {'@': 162}), 9: (1, {'@': 162}), 10: (1, {'@': 162}), 15: (1, {'@': 162}), 16: (1, {'@': 162}), 41: (1, {'@': 162}), 39: (1, {'@': 162}), 27: (1, {'@': 162}), 11: (1, {'@': 162}), 33: (1, {'@': 162}), 32: (1, {'@': 162}), 36: (1, {'@': 162})}, 161: {48: (1, {'@': 155}), 37: (1, {'@': 155}), 12: (1, {'@': 155}), 24: (1, {'@': 155}), 38: (1, {'@': 155}), 28: (1, {'@': 155}), 34: (1, {'@': 155}), 19: (1, {'@': 155}), 9: (1, {'@': 155}), 15: (1, {'@': 155}), 33: (1, {'@': 155}), 32: (1, {'@': 155}), 36: (1, {'@': 155}), 25: (1, {'@': 155}), 6: (1, {'@': 155}), 14: (1, {'@': 155}), 40: (1, {'@': 155}), 30: (1, {'@': 155}), 29: (1, {'@': 155}), 10: (1, {'@': 155}), 16: (1, {'@': 155}), 41: (1, {'@': 155}), 27: (1, {'@': 155}), 11: (1, {'@': 155})}, 162: {81: (0, 9)}, 163: {109: (0, 234)}, 164: {25: (1, {'@': 192}), 6: (1, {'@': 192}), 14: (1, {'@': 192}), 30: (1, {'@': 192}), 12: (1, {'@': 192}), 24: (1, {'@': 192}), 29: (1, {'@': 192}), 28: (1, {'@': 192}), 34: (1, {'@': 192}), 19: (1, {'@': 192}), 8: (1, {'@': 192}), 9: (1, {'@': 192}), 10: (1, {'@': 192}), 15: (1, {'@': 192}), 16: (1, {'@': 192}), 27: (1, {'@': 192}), 11: (1, {'@': 192}), 33: (1, {'@': 192}), 32: (1, {'@': 192}), 36: (1, {'@': 192}), 42: (1, {'@': 192}), 37: (1, {'@': 192}), 43: (1, {'@': 192}), 38: (1, {'@': 192}), 40: (1, {'@': 192}), 44: (1, {'@': 192}), 41: (1, {'@': 192}), 39: (1, {'@': 192}), 45: (1, {'@': 192}), 51: (1, {'@': 192}), 46: (1, {'@': 192}), 47: (1, {'@': 192}), 48: (1, {'@': 192})}, 165: {37: (1, {'@': 166}), 12: (1, {'@': 166}), 24: (1, {'@': 166}), 38: (1, {'@': 166}), 28: (1, {'@': 166}), 34: (1, {'@': 166}), 19: (1, {'@': 166}), 9: (1, {'@': 166}), 15: (1, {'@': 166}), 39: (1, {'@': 166}), 33: (1, {'@': 166}), 32: (1, {'@': 166}), 36: (1, {'@': 166}), 25: (1, {'@': 166}), 6: (1, {'@': 166}), 14: (1, {'@': 166}), 40: (1, {'@': 166}), 30: (1, {'@': 166}), 29: (1, {'@': 166}), 10: (1, {'@': 166}), 16: (1, {'@': 166}), 41: (1, {'@': 166}), 27: (1, {'@': 166}), 11: (1, {'@': 166})}, 166: {25: (1, {'@': 184}), 6: (1, {'@': 184}), 14: (1, {'@': 184}), 30: (1, {'@': 184}), 12: (1, {'@': 184}), 24: (1, {'@': 184}), 29: (1, {'@': 184}), 28: (1, {'@': 184}), 34: (1, {'@': 184}), 19: (1, {'@': 184}), 8: (1, {'@': 184}), 9: (1, {'@': 184}), 10: (1, {'@': 184}), 15: (1, {'@': 184}), 16: (1, {'@': 184}), 27: (1, {'@': 184}), 11: (1, {'@': 184}), 33: (1, {'@': 184}), 32: (1, {'@': 184}), 36: (1, {'@': 184}), 42: (1, {'@': 184}), 37: (1, {'@': 184}), 43: (1, {'@': 184}), 38: (1, {'@': 184}), 40: (1, {'@': 184}), 44: (1, {'@': 184}), 41: (1, {'@': 184}), 39: (1, {'@': 184}), 45: (1, {'@': 184}), 51: (1, {'@': 184}), 46: (1, {'@': 184}), 47: (1, {'@': 184}), 48: (1, {'@': 184})}, 167: {25: (1, {'@': 188}), 6: (1, {'@': 188}), 14: (1, {'@': 188}), 30: (1, {'@': 188}), 12: (1, {'@': 188}), 24: (1, {'@': 188}), 29: (1, {'@': 188}), 28: (1, {'@': 188}), 34: (1, {'@': 188}), 19: (1, {'@': 188}), 8: (1, {'@': 188}), 9: (1, {'@': 188}), 10: (1, {'@': 188}), 15: (1, {'@': 188}), 16: (1, {'@': 188}), 27: (1, {'@': 188}), 11: (1, {'@': 188}), 33: (1, {'@': 188}), 32: (1, {'@': 188}), 36: (1, {'@': 188}), 42: (1, {'@': 188}), 37: (1, {'@': 188}), 43: (1, {'@': 188}), 38: (1, {'@': 188}), 40: (1, {'@': 188}), 44: (1, {'@': 188}), 41: (1, {'@': 188}), 39: (1, {'@': 188}), 45: (1, {'@': 188}), 51: (1, {'@': 188}), 46: (1, {'@': 188}), 47: (1, {'@': 188}), 48: (1, {'@': 188})}, 168: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 5: (0, 55), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 47: (0, 37), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 26: (0, 93), 27: (0, 87), 28: (0, 156), 29: (0, 91), 30: (0, 166), 31: (0, 80), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198)}, 169: {73: (0, 18)}, 170: {25: (1, {'@': 191}), 6: (1, {'@': 191}), 14: (1, {'@': 191}), 30: (1, {'@': 191}), 12: (1, {'@': 191}), 24: (1, {'@': 191}), 29: (1, {'@': 191}), 28: (1, {'@': 191}), 34: (1, {'@': 191}), 19: (1, {'@': 191}), 8: (1, {'@': 191}), 9: (1, {'@': 191}), 10: (1, {'@': 191}), 15: (1, {'@': 191}), 16: (1, {'@': 191}), 27: (1, {'@': 191}), 11: (1, {'@': 191}), 33: (1, {'@': 191}), 32: (1, {'@': 191}), 36: (1, {'@': 191}), 42: (1, {'@': 191}), 37: (1, {'@': 191}), 43: (1, {'@': 191}), 38: (1, {'@': 191}), 40: (1, {'@': 191}), 44: (1, {'@': 191}), 41: (1, {'@': 191}), 39: (1, {'@': 191}), 45: (1, {'@': 191}), 51: (1, {'@': 191}), 46: (1, {'@': 191}), 47: (1, {'@': 191}), 48: (1, {'@': 191})}, 171: {25: (1, {'@': 193}), 6: (1, {'@': 193}), 14: (1, {'@': 193}), 30: (1, {'@': 193}), 12: (1, {'@': 193}), 24: (1, {'@': 193}), 29: (1, {'@': 193}), 28: (1, {'@': 193}), 34: (1, {'@': 193}), 19: (1, {'@': 193}), 8: (1, {'@': 193}), 9: (1, {'@': 193}), 10: (1, {'@': 193}), 15: (1, {'@': 193}), 16: (1, {'@': 193}), 27: (1, {'@': 193}), 11: (1, {'@': 193}), 33: (1, {'@': 193}), 32: (1, {'@': 193}), 36: (1, {'@': 193}), 42: (1, {'@': 193}), 37: (1, {'@': 193}), 43: (1, {'@': 193}), 38: (1, {'@': 193}), 40: (1, {'@': 193}), 44: (1, {'@': 193}), 41: (1, {'@': 193}), 39: (1, {'@': 193}), 45: (1, {'@': 193}), 51: (1, {'@': 193}), 46: (1, {'@': 193}), 47: (1, {'@': 193}), 48: (1, {'@': 193})}, 172: {46: (1, {'@': 105})}, 173: {25: (1, {'@': 182}), 6: (1, {'@': 182}), 14: (1, {'@': 182}), 30: (1, {'@': 182}), 12: (1, {'@': 182}), 24: (1, {'@': 182}), 29: (1, {'@': 182}), 28: (1, {'@': 182}), 34: (1, {'@': 182}), 19: (1, {'@': 182}), 8: (1, {'@': 182}), 9: (1, {'@': 182}), 10: (1, {'@': 182}), 15: (1, {'@': 182}), 16: (1, {'@': 182}), 27: (1, {'@': 182}), 11: (1, {'@': 182}), 33: (1, {'@': 182}), 32: (1, {'@': 182}), 36: (1, {'@': 182}), 42: (1, {'@': 182}), 37: (1, {'@': 182}), 43: (1, {'@': 182}), 38: (1, {'@': 182}), 40: (1, {'@': 182}), 44: (1, {'@': 182}), 41: (1, {'@': 182}), 39: (1, {'@': 182}), 45: (1, {'@': 182}), 51: (1, {'@': 182}), 46: (1, {'@': 182}), 47: (1, {'@': 182}), 48: (1, {'@': 182})}, 174: {81: (0, 118)}, 175: {37: (1, {'@': 138}), 38: (1, {'@': 138}), 12: (1, {'@': 138}), 24: (1, {'@': 138}), 28: (1, {'@': 138}), 34: (1, {'@': 138}), 19: (1, {'@': 138}), 9: (1, {'@': 138}), 15: (1, {'@': 138}), 33: (1, {'@': 138}), 32: (1, {'@': 138}), 36: (1, {'@': 138}), 25: (1, {'@': 138}), 6: (1, {'@': 138}), 14: (1, {'@': 138}), 40: (1, {'@': 138}), 30: (1, {'@': 138}), 29: (1, {'@': 138}), 10: (1, {'@': 138}), 16: (1, {'@': 138}), 41: (1, {'@': 138}), 27: (1, {'@': 138}), 11: (1, {'@': 138})}, 176: {110: (0, 120), 111: (0, 116), 25: (0, 61)}, 177: {37: (1, {'@': 198}), 25: (1, {'@': 198}), 6: (1, {'@': 198}), 14: (1, {'@': 198}), 40: (1, {'@': 198}), 30: (1, {'@': 198}), 38: (1, {'@': 198}), 12: (1, {'@': 198}), 24: (1, {'@': 198}), 28: (1, {'@': 198}), 34: (1, {'@': 198}), 29: (1, {'@': 198}), 19: (1, {'@': 198}), 9: (1, {'@': 198}), 10: (1, {'@': 198}), 15: (1, {'@': 198}), 16: (1, {'@': 198}), 46: (1, {'@': 198}), 41: (1, {'@': 198}), 27: (1, {'@': 198}), 11: (1, {'@': 198}), 33: (1, {'@': 198}), 32: (1, {'@': 198}), 36: (1, {'@': 198})}, 178: {64: (1, {'@': 197}), 37: (1, {'@': 197})}, 179: {0: (0, 111), 1: (0, 34), 5: (0, 124), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 112: (0, 199), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 80: (0, 127), 25: (0, 176), 27: (0, 87), 28: (0, 156), 29: (0, 91), 30: (0, 166), 26: (0, 236), 32: (0, 173), 48: (0, 179), 33: (0, 97), 34: (0, 146), 31: (0, 7), 35: (0, 10), 36: (0, 198)}, 180: {46: (0, 185)}, 181: {37: (1, {'@': 164}), 25: (1, {'@': 164}), 6: (1, {'@': 164}), 14: (1, {'@': 164}), 40: (1, {'@': 164}), 30: (1, {'@': 164}), 38: (1, {'@': 164}), 12: (1, {'@': 164}), 24: (1, {'@': 164}), 28: (1, {'@': 164}), 34: (1, {'@': 164}), 29: (1, {'@': 164}), 19: (1, {'@': 164}), 9: (1, {'@': 164}), 10: (1, {'@': 164}), 15: (1, {'@': 164}), 16: (1, {'@': 164}), 41: (1, {'@': 164}), 39: (1, {'@': 164}), 27: (1, {'@': 164}), 11: (1, {'@': 164}), 33: (1, {'@': 164}), 32: (1, {'@': 164}), 36: (1, {'@': 164})}, 182: {25: (1, {'@': 57}), 6: (1, {'@': 57}), 14: (1, {'@': 57}), 30: (1, {'@': 57}), 12: (1, {'@': 57}), 24: (1, {'@': 57}), 29: (1, {'@': 57}), 28: (1, {'@': 57}), 34: (1, {'@': 57}), 19: (1, {'@': 57}), 8: (1, {'@': 57}), 9: (1, {'@': 57}), 10: (1, {'@': 57}), 15: (1, {'@': 57}), 16: (1, {'@': 57}), 27: (1, {'@': 57}), 11: (1, {'@': 57}), 33: (1, {'@': 57}), 32: (1, {'@': 57}), 36: (1, {'@': 57}), 42: (1, {'@': 57}), 37: (1, {'@': 57}), 43: (1, {'@': 57}), 40: (1, {'@': 57}), 38: (1, {'@': 57}), 44: (1, {'@': 57}), 41: (1, {'@': 57}), 39: (1, {'@': 57}), 45: (1, {'@': 57}), 46: (1, {'@': 57}), 47: (1, {'@': 57}), 48: (1, {'@': 57})}, 183: {82: (0, 162), 81: (0, 104)}, 184: {15: (1, {'@': 172}), 16: (1, {'@': 172}), 25: (1, {'@': 172}), 6: (1, {'@': 172}), 14: (1, {'@': 172}), 27: (1, {'@': 172}), 30: (1, {'@': 172}), 12: (1, {'@': 172}), 9: (1, {'@': 172}), 11: (1, {'@': 172}), 28: (1, {'@': 172}), 29: (1, {'@': 172}), 32: (1, {'@': 172}), 33: (1, {'@': 172}), 19: (1, {'@': 172}), 34: (1, {'@': 172}), 10: (1, {'@': 172}), 36: (1, {'@': 172}), 24: (1, {'@': 172})}, 185: {37: (1, {'@': 195}), 12: (1, {'@': 195}), 24: (1, {'@': 195}), 38: (1, {'@': 195}), 28: (1, {'@': 195}), 34: (1, {'@': 195}), 19: (1, {'@': 195}), 9: (1, {'@': 195}), 15: (1, {'@': 195}), 33: (1, {'@': 195}), 32: (1, {'@': 195}), 36: (1, {'@': 195}), 25: (1, {'@': 195}), 6: (1, {'@': 195}), 14: (1, {'@': 195}), 40: (1, {'@': 195}), 30: (1, {'@': 195}), 29: (1, {'@': 195}), 10: (1, {'@': 195}), 16: (1, {'@': 195}), 46: (1, {'@': 195}), 41: (1, {'@': 195}), 27: (1, {'@': 195}), 11: (1, {'@': 195})}, 186: {25: (1, {'@': 112}), 6: (1, {'@': 112}), 14: (1, {'@': 112}), 30: (1, {'@': 112}), 12: (1, {'@': 112}), 24: (1, {'@': 112}), 29: (1, {'@': 112}), 28: (1, {'@': 112}), 34: (1, {'@': 112}), 19: (1, {'@': 112}), 8: (1, {'@': 112}), 9: (1, {'@': 112}), 10: (1, {'@': 112}), 15: (1, {'@': 112}), 16: (1, {'@': 112}), 27: (1, {'@': 112}), 11: (1, {'@': 112}), 33: (1, {'@': 112}), 32: (1, {'@': 112}), 36: (1, {'@': 112}), 42: (1, {'@': 112}), 37: (1, {'@': 112}), 43: (1, {'@': 112}), 40: (1, {'@': 112}), 38: (1, {'@': 112}), 44: (1, {'@': 112}), 41: (1, {'@': 112}), 39: (1, {'@': 112}), 45: (1, {'@': 112}), 46: (1, {'@': 112}), 47: (1, {'@': 112}), 48: (1, {'@': 112})}, 187: {51: (1, {'@': 206}), 25: (1, {'@': 206}), 6: (1, {'@': 206}), 14: (1, {'@': 206}), 27: (1, {'@': 206}), 30: (1, {'@': 206}), 12: (1, {'@': 206}), 11: (1, {'@': 206}), 24: (1, {'@': 206}), 29: (1, {'@': 206}), 32: (1, {'@': 206}), 9: (1, {'@': 206}), 36: (1, {'@': 206})}, 188: {25: (1, {'@': 115}), 6: (1, {'@': 115}), 14: (1, {'@': 115}), 30: (1, {'@': 115}), 12: (1, {'@': 115}), 24: (1, {'@': 115}), 29: (1, {'@': 115}), 28: (1, {'@': 115}), 34: (1, {'@': 115}), 19: (1, {'@': 115}), 8: (1, {'@': 115}), 9: (1, {'@': 115}), 10: (1, {'@': 115}), 15: (1, {'@': 115}), 16: (1, {'@': 115}), 27: (1, {'@': 115}), 11: (1, {'@': 115}), 33: (1, {'@': 115}), 32: (1, {'@': 115}), 36: (1, {'@': 115}), 42: (1, {'@': 115}), 37: (1, {'@': 115}), 43: (1, {'@': 115}), 40: (1, {'@': 115}), 38: (1, {'@': 115}), 44: (1, {'@': 115}), 41: (1, {'@': 115}), 39: (1, {'@': 115}), 45: (1, {'@': 115}), 46: (1, {'@': 115}), 47: (1, {'@': 115}), 48: (1, {'@': 115})}, 189: {37: (1, {'@': 78}), 38: (1, {'@': 78}), 12: (1, {'@': 78}), 24: (1, {'@': 78}), 28: (1, {'@': 78}), 34: (1, {'@': 78}), 19: (1, {'@': 78}), 9: (1, {'@': 78}), 15: (1, {'@': 78}), 33: (1, {'@': 78}), 32: (1, {'@': 78}), 36: (1, {'@': 78}), 25: (1, {'@': 78}), 6: (1, {'@': 78}), 14: (1, {'@': 78}), 40: (1, {'@': 78}), 30: (1, {'@': 78}), 29: (1, {'@': 78}), 10: (1, {'@': 78}), 16: (1, {'@': 78}), 41: (1, {'@': 78}), 27: (1, {'@': 78}), 11: (1, {'@': 78})}, 190: {100: (0, 203), 19: (0, 157), 37: (1, {'@': 116}), 25: (1, {'@': 116}), 6: (1, {'@': 116}), 14: (1, {'@': 116}), 40: (1, {'@': 116}), 30: (1, {'@': 116}), 38: (1, {'@': 116}), 12: (1, {'@': 116}), 24: (1, {'@': 116}), 28: (1, {'@': 116}), 34: (1, {'@': 116}), 29: (1, {'@': 116}), 9: (1, {'@': 116}), 10: (1, {'@': 116}), 15: (1, {'@': 116}), 16: (1, {'@': 116}), 41: (1, {'@': 116}), 27: (1, {'@': 116}), 11: (1, {'@': 116}), 33: (1, {'@': 116}), 32: (1, {'@': 116}), 36: (1, {'@': 116})}, 191: {37: (1, {'@': 225}), 43: (1, {'@': 225}), 38: (1, {'@': 225}), 12: (1, {'@': 225}), 24: (1, {'@': 225}), 28: (1, {'@': 225}), 34: (1, {'@': 225}), 19: (1, {'@': 225}), 9: (1, {'@': 225}), 15: (1, {'@': 225}), 33: (1, {'@': 225}), 32: (1, {'@': 225}), 36: (1, {'@': 225}), 25: (1, {'@': 225}), 6: (1, {'@': 225}), 14: (1, {'@': 225}), 40: (1, {'@': 225}), 30: (1, {'@': 225}), 29: (1, {'@': 225}), 10: (1, {'@': 225}), 16: (1, {'@': 225}), 44: (1, {'@': 225}), 41: (1, {'@': 225}), 27: (1, {'@': 225}), 11: (1, {'@': 225})}, 192: {60: (1, {'@': 228}), 61: (1, {'@': 228}), 62: (1, {'@': 228})}, 193: {46: (0, 143), 67: (0, 136), 37: (1, {'@': 106}), 25: (1, {'@': 106}), 6: (1, {'@': 106}), 14: (1, {'@': 106}), 40: (1, {'@': 106}), 30: (1, {'@': 106}), 38: (1, {'@': 106}), 12: (1, {'@': 106}), 24: (1, {'@': 106}), 28: (1, {'@': 106}), 34: (1, {'@': 106}), 29: (1, {'@': 106}), 19: (1, {'@': 106}), 9: (1, {'@': 106}), 10: (1, {'@': 106}), 15: (1, {'@': 106}), 16: (1, {'@': 106}), 41: (1, {'@': 106}), 27: (1, {'@': 106}), 11: (1, {'@': 106}), 33: (1, {'@': 106}), 32: (1, {'@': 106}), 36: (1, {'@': 106})}, 194: {37: (1, {'@': 140}), 38: (1, {'@': 140}), 12: (1, {'@': 140}), 24: (1, {'@': 140}), 28: (1, {'@': 140}), 34: (1, {'@': 140}), 19: (1, {'@': 140}), 9: (1, {'@': 140}), 15: (1, {'@': 140}), 33: (1, {'@': 140}), 32: (1, {'@': 140}), 36: (1, {'@': 140}), 25: (1, {'@': 140}), 6: (1, {'@': 140}), 14: (1, {'@': 140}), 40: (1, {'@': 140}), 30: (1, {'@': 140}), 29: (1, {'@': 140}), 10: (1, {'@': 140}), 16: (1, {'@': 140}), 41: (1, {'@': 140}), 27: (1, {'@': 140}), 11: (1, {'@': 140})}, 195: {37: (1, {'@': 71}), 38: (1, {'@': 71}), 12: (1, {'@': 71}), 24: (1, {'@': 71}), 28: (1, {'@': 71}), 34: (1, {'@': 71}), 19: (1, {'@': 71}), 9: (1, {'@': 71}), 15: (1, {'@': 71}), 33: (1, {'@': 71}), 32: (1, {'@': 71}), 36: (1, {'@': 71}), 25: (1, {'@': 71}), 6: (1, {'@': 71}), 14: (1, {'@': 71}), 40: (1, {'@': 71}), 30: (1, {'@': 71}), 29: (1, {'@': 71}), 10: (1, {'@': 71}), 16: (1, {'@': 71}), 41: (1, {'@': 71}), 27: (1, {'@': 71}), 11: (1, {'@': 71})}, 196: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 37: (0, 229), 9: (0, 71), 10: (0, 139), 11: (0, 152), 38: (0, 131), 12: (0, 216), 13: (0, 73), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 44: (0, 123), 20: (0, 82), 21: (0, 16), 23: (0, 19), 31: (0, 223), 25: (0, 176), 27: (0, 87), 55: (0, 5), 28: (0, 156), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 56: (0, 210), 57: (0, 109), 43: (0, 163), 58: (0, 191), 36: (0, 198), 14: (1, {'@': 120}), 40: (1, {'@': 120}), 24: (1, {'@': 120}), 29: (1, {'@': 120}), 41: (1, {'@': 120})}, 197: {12: (1, {'@': 236}), 24: (1, {'@': 236}), 28: (1, {'@': 236}), 34: (1, {'@': 236}), 19: (1, {'@': 236}), 74: (1, {'@': 236}), 9: (1, {'@': 236}), 15: (1, {'@': 236}), 33: (1, {'@': 236}), 32: (1, {'@': 236}), 36: (1, {'@': 236}), 25: (1, {'@': 236}), 6: (1, {'@': 236}), 14: (1, {'@': 236}), 30: (1, {'@': 236}), 29: (1, {'@': 236}), 10: (1, {'@': 236}), 16: (1, {'@': 236}), 27: (1, {'@': 236}), 11: (1, {'@': 236})}, 198: {25: (1, {'@': 183}), 6: (1, {'@': 183}), 14: (1, {'@': 183}), 30: (1, {'@': 183}), 12: (1, {'@': 183}), 24: (1, {'@': 183}), 29: (1, {'@': 183}), 28: (1, {'@': 183}), 34: (1, {'@': 183}), 19: (1, {'@': 183}), 8: (1, {'@': 183}), 9: (1, {'@': 183}), 10: (1, {'@': 183}), 15: (1, {'@': 183}), 16: (1, {'@': 183}), 27: (1, {'@': 183}), 11: (1, {'@': 183}), 33: (1, {'@': 183}), 32: (1, {'@': 183}), 36: (1, {'@': 183}), 42: (1, {'@': 183}), 37: (1, {'@': 183}), 43: (1, {'@': 183}), 38: (1, {'@': 183}), 40: (1, {'@': 183}), 44: (1, {'@': 183}), 41: (1, {'@': 183}), 39: (1, {'@': 183}), 45: (1, {'@': 183}), 51: (1, {'@': 183}), 46: (1, {'@': 183}), 47: (1, {'@': 183}), 48: (1, {'@': 183})}, 199: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 80: (0, 77), 13: (0, 73), 15: (0, 13), 14: (0, 29), 16: (0, 75), 17: (0, 119), 18: (0, 113), 26: (0, 101), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 31: (0, 247), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 48: (0, 179), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198), 5: (0, 161), 37: (1, {'@': 87}), 40: (1, {'@': 87}), 38: (1, {'@': 87}), 41: (1, {'@': 87})}, 200: {37: (1, {'@': 103}), 25: (1, {'@': 103}), 6: (1, {'@': 103}), 14: (1, {'@': 103}), 40: (1, {'@': 103}), 30: (1, {'@': 103}), 38: (1, {'@': 103}), 12: (1, {'@': 103}), 24: (1, {'@': 103}), 28: (1, {'@': 103}), 34: (1, {'@': 103}), 29: (1, {'@': 103}), 19: (1, {'@': 103}), 9: (1, {'@': 103}), 10: (1, {'@': 103}), 15: (1, {'@': 103}), 16: (1, {'@': 103}), 46: (1, {'@': 103}), 41: (1, {'@': 103}), 27: (1, {'@': 103}), 11: (1, {'@': 103}), 33: (1, {'@': 103}), 32: (1, {'@': 103}), 36: (1, {'@': 103})}, 201: {62: (0, 151), 60: (0, 132), 61: (0, 108)}, 202: {49: (0, 39)}, 203: {37: (0, 227), 25: (1, {'@': 213}), 6: (1, {'@': 213}), 14: (1, {'@': 213}), 40: (1, {'@': 213}), 30: (1, {'@': 213}), 38: (1, {'@': 213}), 12: (1, {'@': 213}), 24: (1, {'@': 213}), 28: (1, {'@': 213}), 34: (1, {'@': 213}), 29: (1, {'@': 213}), 19: (1, {'@': 213}), 9: (1, {'@': 213}), 10: (1, {'@': 213}), 15: (1, {'@': 213}), 16: (1, {'@': 213}), 41: (1, {'@': 213}), 27: (1, {'@': 213}), 11: (1, {'@': 213}), 33: (1, {'@': 213}), 32: (1, {'@': 213}), 36: (1, {'@': 213})}, 204: {81: (0, 186), 82: (0, 150)}, 205: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 26: (0, 17), 5: (0, 48), 27: (0, 87), 28: (0, 156), 29: (0, 91), 31: (0, 239), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198), 37: (1, {'@': 129}), 40: (1, {'@': 129}), 38: (1, {'@': 129}), 41: (1, {'@': 129})}, 206: {37: (0, 76), 48: (1, {'@': 161}), 25: (1, {'@': 161}), 6: (1, {'@': 161}), 14: (1, {'@': 161}), 40: (1, {'@': 161}), 30: (1, {'@': 161}), 38: (1, {'@': 161}), 12: (1, {'@': 161}), 24: (1, {'@': 161}), 28: (1, {'@': 161}), 34: (1, {'@': 161}), 29: (1, {'@': 161}), 19: (1, {'@': 161}), 9: (1, {'@': 161}), 10: (1, {'@': 161}), 15: (1, {'@': 161}), 16: (1, {'@': 161}), 41: (1, {'@': 161}), 27: (1, {'@': 161}), 11: (1, {'@': 161}), 33: (1, {'@': 161}), 32: (1, {'@': 161}), 36: (1, {'@': 161})}, 207: {25: (1, {'@': 110}), 6: (1, {'@': 110}), 14: (1, {'@': 110}), 30: (1, {'@': 110}), 12: (1, {'@': 110}), 24: (1, {'@': 110}), 29: (1, {'@': 110}), 28: (1, {'@': 110}), 34: (1, {'@': 110}), 19: (1, {'@': 110}), 8: (1, {'@': 110}), 9: (1, {'@': 110}), 10: (1, {'@': 110}), 15: (1, {'@': 110}), 16: (1, {'@': 110}), 27: (1, {'@': 110}), 11: (1, {'@': 110}), 33: (1, {'@': 110}), 32: (1, {'@': 110}), 36: (1, {'@': 110}), 42: (1, {'@': 110}), 37: (1, {'@': 110}), 43: (1, {'@': 110}), 40: (1, {'@': 110}), 38: (1, {'@': 110}), 44: (1, {'@': 110}), 41: (1, {'@': 110}), 39: (1, {'@': 110}), 45: (1, {'@': 110}), 51: (1, {'@': 110}), 46: (1, {'@': 110}), 47: (1, {'@': 110}), 48: (1, {'@': 110})}, 208: {25: (1, {'@': 96}), 6: (1, {'@': 96}), 14: (1, {'@': 96}), 30: (1, {'@': 96}), 12: (1, {'@': 96}), 24: (1, {'@': 96}), 29: (1, {'@': 96}), 28: (1, {'@': 96}), 34: (1, {'@': 96}), 19: (1, {'@': 96}), 8: (1, {'@': 96}), 9: (1, {'@': 96}), 10: (1, {'@': 96}), 15: (1, {'@': 96}), 16: (1, {'@': 96}), 27: (1, {'@': 96}), 11: (1, {'@': 96}), 33: (1, {'@': 96}), 32: (1, {'@': 96}), 36: (1, {'@': 96}), 42: (1, {'@': 96}), 37: (1, {'@': 96}), 40: (1, {'@': 96}), 38: (1, {'@': 96}), 41: (1, {'@': 96}), 39: (1, {'@': 96}), 45: (1, {'@': 96}), 51: (1, {'@': 96}), 46: (1, {'@': 96}), 47: (1, {'@': 96}), 48: (1, {'@': 96})}, 209: {81: (0, 78)}, 210: {37: (1, {'@': 227}), 43: (1, {'@': 227}), 38: (1, {'@': 227}), 12: (1, {'@': 227}), 24: (1, {'@': 227}), 28: (1, {'@': 227}), 34: (1, {'@': 227}), 19: (1, {'@': 227}), 9: (1, {'@': 227}), 15: (1, {'@': 227}), 33: (1, {'@': 227}), 32: (1, {'@': 227}), 36: (1, {'@': 227}), 25: (1, {'@': 227}), 6: (1, {'@': 227}), 14: (1, {'@': 227}), 40: (1, {'@': 227}), 30: (1, {'@': 227}), 29: (1, {'@': 227}), 10: (1, {'@': 227}), 16: (1, {'@': 227}), 44: (1, {'@': 227}), 41: (1, {'@': 227}), 27: (1, {'@': 227}), 11: (1, {'@': 227})}, 211: {25: (1, {'@': 86}), 6: (1, {'@': 86}), 14: (1, {'@': 86}), 30: (1, {'@': 86}), 12: (1, {'@': 86}), 24: (1, {'@': 86}), 29: (1, {'@': 86}), 28: (1, {'@': 86}), 34: (1, {'@': 86}), 19: (1, {'@': 86}), 8: (1, {'@': 86}), 9: (1, {'@': 86}), 10: (1, {'@': 86}), 15: (1, {'@': 86}), 16: (1, {'@': 86}), 27: (1, {'@': 86}), 11: (1, {'@': 86}), 33: (1, {'@': 86}), 32: (1, {'@': 86}), 36: (1, {'@': 86}), 42: (1, {'@': 86}), 37: (1, {'@': 86}), 40: (1, {'@': 86}), 38: (1, {'@': 86}), 41: (1, {'@': 86}), 39: (1, {'@': 86}), 45: (1, {'@': 86}), 51: (1, {'@': 86}), 46: (1, {'@': 86}), 47: (1, {'@': 86}), 48: (1, {'@': 86})}, 212: {37: (1, {'@': 76}), 38: (1, {'@': 76}), 12: (1, {'@': 76}), 24: (1, {'@': 76}), 28: (1, {'@': 76}), 34: (1, {'@': 76}), 19: (1, {'@': 76}), 9: (1, {'@': 76}), 15: (1, {'@': 76}), 33: (1, {'@': 76}), 32: (1, {'@': 76}), 36: (1, {'@': 76}), 25: (1, {'@': 76}), 6: (1, {'@': 76}), 14: (1, {'@': 76}), 40: (1, {'@': 76}), 30: (1, {'@': 76}), 29: (1, {'@': 76}), 10: (1, {'@': 76}), 16: (1, {'@': 76}), 41: (1, {'@': 76}), 27: (1, {'@': 76}), 11: (1, {'@': 76})}, 213: {37: (1, {'@': 142}), 38: (1, {'@': 142}), 12: (1, {'@': 142}), 24: (1, {'@': 142}), 28: (1, {'@': 142}), 34: (1, {'@': 142}), 19: (1, {'@': 142}), 9: (1, {'@': 142}), 15: (1, {'@': 142}), 33: (1, {'@': 142}), 32: (1, {'@': 142}), 36: (1, {'@': 142}), 25: (1, {'@': 142}), 6: (1, {'@': 142}), 14: (1, {'@': 142}), 40: (1, {'@': 142}), 30: (1, {'@': 142}), 29: (1, {'@': 142}), 10: (1, {'@': 142}), 16: (1, {'@': 142}), 41: (1, {'@': 142}), 27: (1, {'@': 142}), 11: (1, {'@': 142})}, 214: {25: (1, {'@': 92}), 6: (1, {'@': 92}), 14: (1, {'@': 92}), 30: (1, {'@': 92}), 12: (1, {'@': 92}), 24: (1, {'@': 92}), 29: (1, {'@': 92}), 28: (1, {'@': 92}), 34: (1, {'@': 92}), 19: (1, {'@': 92}), 8: (1, {'@': 92}), 9: (1, {'@': 92}), 10: (1, {'@': 92}), 15: (1, {'@': 92}), 16: (1, {'@': 92}), 27: (1, {'@': 92}), 11: (1, {'@': 92}), 33: (1, {'@': 92}), 32: (1, {'@': 92}), 36: (1, {'@': 92}), 42: (1, {'@': 92}), 37: (1, {'@': 92}), 43: (1, {'@': 92}), 40: (1, {'@': 92}), 38: (1, {'@': 92}), 44: (1, {'@': 92}), 41: (1, {'@': 92}), 39: (1, {'@': 92}), 45: (1, {'@': 92}), 51: (1, {'@': 92}), 46: (1, {'@': 92}), 47: (1, {'@': 92}), 48: (1, {'@': 92})}, 215: {95: (0, 114), 39: (0, 23), 37: (1, {'@': 89}), 25: (1, {'@': 89}), 6: (1, {'@': 89}), 14: (1, {'@': 89}), 40: (1, {'@': 89}), 30: (1, {'@': 89}), 38: (1, {'@': 89}), 12: (1, {'@': 89}), 24: (1, {'@': 89}), 28: (1, {'@': 89}), 34: (1, {'@': 89}), 29: (1, {'@': 89}), 19: (1, {'@': 89}), 9: (1, {'@': 89}), 10: (1, {'@': 89}), 15: (1, {'@': 89}), 16: (1, {'@': 89}), 41: (1, {'@': 89}), 27: (1, {'@': 89}), 11: (1, {'@': 89}), 33: (1, {'@': 89}), 32: (1, {'@': 89}), 36: (1, {'@': 89})}, 216: {25: (1, {'@': 185}), 6: (1, {'@': 185}), 14: (1, {'@': 185}), 30: (1, {'@': 185}), 12: (1, {'@': 185}), 24: (1, {'@': 185}), 29: (1, {'@': 185}), 28: (1, {'@': 185}), 34: (1, {'@': 185}), 19: (1, {'@': 185}), 8: (1, {'@': 185}), 9: (1, {'@': 185}), 10: (1, {'@': 185}), 15: (1, {'@': 185}), 16: (1, {'@': 185}), 27: (1, {'@': 185}), 11: (1, {'@': 185}), 33: (1, {'@': 185}), 32: (1, {'@': 185}), 36: (1, {'@': 185}), 42: (1, {'@': 185}), 37: (1, {'@': 185}), 43: (1, {'@': 185}), 38: (1, {'@': 185}), 40: (1, {'@': 185}), 44: (1, {'@': 185}), 41: (1, {'@': 185}), 39: (1, {'@': 185}), 45: (1, {'@': 185}), 51: (1, {'@': 185}), 46: (1, {'@': 185}), 47: (1, {'@': 185}), 48: (1, {'@': 185})}, 217: {37: (0, 219), 48: (1, {'@': 159}), 25: (1, {'@': 159}), 6: (1, {'@': 159}), 14: (1, {'@': 159}), 40: (1, {'@': 159}), 30: (1, {'@': 159}), 38: (1, {'@': 159}), 12: (1, {'@': 159}), 24: (1, {'@': 159}), 28: (1, {'@': 159}), 34: (1, {'@': 159}), 29: (1, {'@': 159}), 19: (1, {'@': 159}), 9: (1, {'@': 159}), 10: (1, {'@': 159}), 15: (1, {'@': 159}), 16: (1, {'@': 159}), 41: (1, {'@': 159}), 27: (1, {'@': 159}), 11: (1, {'@': 159}), 33: (1, {'@': 159}), 32: (1, {'@': 159}), 36: (1, {'@': 159})}, 218: {70: (0, 43), 68: (0, 188)}, 219: {48: (1, {'@': 158}), 37: (1, {'@': 158}), 25: (1, {'@': 158}), 6: (1, {'@': 158}), 14: (1, {'@': 158}), 40: (1, {'@': 158}), 30: (1, {'@': 158}), 38: (1, {'@': 158}), 12: (1, {'@': 158}), 24: (1, {'@': 158}), 28: (1, {'@': 158}), 34: (1, {'@': 158}), 29: (1, {'@': 158}), 19: (1, {'@': 158}), 9: (1, {'@': 158}), 10: (1, {'@': 158}), 15: (1, {'@': 158}), 16: (1, {'@': 158}), 41: (1, {'@': 158}), 27: (1, {'@': 158}), 11: (1, {'@': 158}), 33: (1, {'@': 158}), 32: (1, {'@': 158}), 36: (1, {'@': 158})}, 220: {51: (1, {'@': 208}), 25: (1, {'@': 208}), 6: (1, {'@': 208}), 14: (1, {'@': 208}), 27: (1, {'@': 208}), 30: (1, {'@': 208}), 12: (1, {'@': 208}), 11: (1, {'@': 208}), 24: (1, {'@': 208}), 29: (1, {'@': 208}), 32: (1, {'@': 208}), 9: (1, {'@': 208}), 36: (1, {'@': 208})}, 221: {12: (1, {'@': 179}), 24: (1, {'@': 179}), 28: (1, {'@': 179}), 34: (1, {'@': 179}), 19: (1, {'@': 179}), 9: (1, {'@': 179}), 15: (1, {'@': 179}), 33: (1, {'@': 179}), 32: (1, {'@': 179}), 36: (1, {'@': 179}), 25: (1, {'@': 179}), 6: (1, {'@': 179}), 14: (1, {'@': 179}), 30: (1, {'@': 179}), 29: (1, {'@': 179}), 10: (1, {'@': 179}), 16: (1, {'@': 179}), 27: (1, {'@': 179}), 11: (1, {'@': 179})}, 222: {25: (1, {'@': 94}), 6: (1, {'@': 94}), 14: (1, {'@': 94}), 30: (1, {'@': 94}), 12: (1, {'@': 94}), 24: (1, {'@': 94}), 29: (1, {'@': 94}), 28: (1, {'@': 94}), 34: (1, {'@': 94}), 19: (1, {'@': 94}), 8: (1, {'@': 94}), 9: (1, {'@': 94}), 10: (1, {'@': 94}), 15: (1, {'@': 94}), 16: (1, {'@': 94}), 27: (1, {'@': 94}), 11: (1, {'@': 94}), 33: (1, {'@': 94}), 32: (1, {'@': 94}), 36: (1, {'@': 94}), 42: (1, {'@': 94}), 37: (1, {'@': 94}), 40: (1, {'@': 94}), 38: (1, {'@': 94}), 41: (1, {'@': 94}), 39: (1, {'@': 94}), 45: (1, {'@': 94}), 51: (1, {'@': 94}), 46: (1, {'@': 94}), 47: (1, {'@': 94}), 48: (1, {'@': 94})}, 223: {37: (1, {'@': 224}), 43: (1, {'@': 224}), 38: (1, {'@': 224}), 12: (1, {'@': 224}), 24: (1, {'@': 224}), 28: (1, {'@': 224}), 34: (1, {'@': 224}), 19: (1, {'@': 224}), 9: (1, {'@': 224}), 15: (1, {'@': 224}), 33: (1, {'@': 224}), 32: (1, {'@': 224}), 36: (1, {'@': 224}), 25: (1, {'@': 224}), 6: (1, {'@': 224}), 14: (1, {'@': 224}), 40: (1, {'@': 224}), 30: (1, {'@': 224}), 29: (1, {'@': 224}), 10: (1, {'@': 224}), 16: (1, {'@': 224}), 44: (1, {'@': 224}), 41: (1, {'@': 224}), 27: (1, {'@': 224}), 11: (1, {'@': 224})}, 224: {0: (0, 111), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 5: (0, 55), 6: (0, 28), 7: (0, 11), 9: (0, 71), 10: (0, 139), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 23: (0, 19), 24: (0, 141), 25: (0, 176), 26: (0, 93), 27: (0, 87), 28: (0, 156), 29: (0, 91), 30: (0, 166), 31: (0, 80), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198), 46: (1, {'@': 102})}, 225: {51: (1, {'@': 207}), 25: (1, {'@': 207}), 6: (1, {'@': 207}), 14: (1, {'@': 207}), 27: (1, {'@': 207}), 30: (1, {'@': 207}), 12: (1, {'@': 207}), 11: (1, {'@': 207}), 24: (1, {'@': 207}), 29: (1, {'@': 207}), 32: (1, {'@': 207}), 9: (1, {'@': 207}), 36: (1, {'@': 207})}, 226: {25: (1, {'@': 59}), 6: (1, {'@': 59}), 14: (1, {'@': 59}), 30: (1, {'@': 59}), 12: (1, {'@': 59}), 24: (1, {'@': 59}), 29: (1, {'@': 59}), 28: (1, {'@': 59}), 34: (1, {'@': 59}), 19: (1, {'@': 59}), 8: (1, {'@': 59}), 9: (1, {'@': 59}), 10: (1, {'@': 59}), 15: (1, {'@': 59}), 16: (1, {'@': 59}), 27: (1, {'@': 59}), 11: (1, {'@': 59}), 33: (1, {'@': 59}), 32: (1, {'@': 59}), 36: (1, {'@': 59}), 42: (1, {'@': 59}), 37: (1, {'@': 59}), 43: (1, {'@': 59}), 40: (1, {'@': 59}), 38: (1, {'@': 59}), 44: (1, {'@': 59}), 41: (1, {'@': 59}), 39: (1, {'@': 59}), 45: (1, {'@': 59}), 46: (1, {'@': 59}), 47: (1, {'@': 59}), 48: (1, {'@': 59})}, 227: {37: (1, {'@': 212}), 25: (1, {'@': 212}), 6: (1, {'@': 212}), 14: (1, {'@': 212}), 40: (1, {'@': 212}), 30: (1, {'@': 212}), 38: (1, {'@': 212}), 12: (1, {'@': 212}), 24: (1, {'@': 212}), 28: (1, {'@': 212}), 34: (1, {'@': 212}), 29: (1, {'@': 212}), 19: (1, {'@': 212}), 9: (1, {'@': 212}), 10: (1, {'@': 212}), 15: (1, {'@': 212}), 16: (1, {'@': 212}), 41: (1, {'@': 212}), 27: (1, {'@': 212}), 11: (1, {'@': 212}), 33: (1, {'@': 212}), 32: (1, {'@': 212}), 36: (1, {'@': 212})}, 228: {37: (0, 160), 25: (1, {'@': 163}), 6: (1, {'@': 163}), 14: (1, {'@': 163}), 40: (1, {'@': 163}), 30: (1, {'@': 163}), 38: (1, {'@': 163}), 12: (1, {'@': 163}), 24: (1, {'@': 163}), 28: (1, {'@': 163}), 34: (1, {'@': 163}), 29: (1, {'@': 163}), 19: (1, {'@': 163}), 9: (1, {'@': 163}), 10: (1, {'@': 163}), 15: (1, {'@': 163}), 16: (1, {'@': 163}), 41: (1, {'@': 163}), 39: (1, {'@': 163}), 27: (1, {'@': 163}), 11: (1, {'@': 163}), 33: (1, {'@': 163}), 32: (1, {'@': 163}), 36: (1, {'@': 163})}, 229: {37: (1, {'@': 226}), 43: (1, {'@': 226}), 38: (1, {'@': 226}), 12: (1, {'@': 226}), 24: (1, {'@': 226}), 28: (1, {'@': 226}), 34: (1, {'@': 226}), 19: (1, {'@': 226}), 9: (1, {'@': 226}), 15: (1, {'@': 226}), 33: (1, {'@': 226}), 32: (1, {'@': 226}), 36: (1, {'@': 226}), 25: (1, {'@': 226}), 6: (1, {'@': 226}), 14: (1, {'@': 226}), 40: (1, {'@': 226}), 30: (1, {'@': 226}), 29: (1, {'@': 226}), 10: (1, {'@': 226}), 16: (1, {'@': 226}), 44: (1, {'@': 226}), 41: (1, {'@': 226}), 27: (1, {'@': 226}), 11: (1, {'@': 226})}, 230: {1: (0, 34), 51: (0, 204), 6: (0, 28), 9: (0, 71), 18: (0, 225), 11: (0, 152), 12: (0, 216), 14: (0, 29), 22: (0, 211), 0: (0, 248), 26: (0, 246), 24: (0, 141), 25: (0, 176), 27: (0, 87), 29: (0, 91), 30: (0, 166), 32: (0, 173), 23: (0, 187), 5: (0, 220), 35: (0, 10), 36: (0, 198)}, 231: {51: (1, {'@': 203}), 25: (1, {'@': 203}), 6: (1, {'@': 203}), 14: (1, {'@': 203}), 27: (1, {'@': 203}), 30: (1, {'@': 203}), 12: (1, {'@': 203}), 11: (1, {'@': 203}), 24: (1, {'@': 203}), 29: (1, {'@': 203}), 32: (1, {'@': 203}), 9: (1, {'@': 203}), 36: (1, {'@': 203})}, 232: {46: (0, 32)}, 233: {37: (1, {'@': 77}), 38: (1, {'@': 77}), 12: (1, {'@': 77}), 24: (1, {'@': 77}), 28: (1, {'@': 77}), 34: (1, {'@': 77}), 19: (1, {'@': 77}), 9: (1, {'@': 77}), 15: (1, {'@': 77}), 33: (1, {'@': 77}), 32: (1, {'@': 77}), 36: (1, {'@': 77}), 25: (1, {'@': 77}), 6: (1, {'@': 77}), 14: (1, {'@': 77}), 40: (1, {'@': 77}), 30: (1, {'@': 77}), 29: (1, {'@': 77}), 10: (1, {'@': 77}), 16: (1, {'@': 77}), 41: (1, {'@': 77}), 27: (1, {'@': 77}), 11: (1, {'@': 77})}, 234: {61: (0, 46)}, 235: {0: (0, 111), 52: (0, 224), 1: (0, 34), 2: (0, 144), 3: (0, 15), 4: (0, 47), 6: (0, 28), 104: (0, 180), 7: (0, 11), 9: (0, 71), 10: (0, 139), 26: (0, 54), 11: (0, 152), 12: (0, 216), 13: (0, 73), 14: (0, 29), 15: (0, 13), 31: (0, 242), 16: (0, 75), 17: (0, 119), 18: (0, 113), 19: (0, 202), 20: (0, 82), 21: (0, 16), 22: (0, 211), 37: (0, 200), 23: (0, 19), 24: (0, 141), 25: (0, 176), 27: (0, 87), 5: (0, 130), 28: (0, 156), 29: (0, 91), 30: (0, 166), 32: (0, 173), 33: (0, 97), 34: (0, 146), 35: (0, 10), 36: (0, 198), 40: (1, {'@': 104}), 38: (1, {'@': 104}), 46: (1, {'@': 104}), 41: (1, {'@': 104})}, 236: {48: (1, {'@': 152}), 37: (1, {'@': 152}), 12: (1, {'@': 152}), 24: (1, {'@': 152}), 38: (1, {'@': 152}), 28: (1, {'@': 152}), 34: (1, {'@': 152}), 19: (1, {'@': 152}), 9: (1, {'@': 152}), 15: (1, {'@': 152}), 33: (1, {'@': 152}), 32: (1, {'@': 152}), 36: (1, {'@': 152}), 25: (1, {'@': 152}), 6: (1, {'@': 152}), 14: (1, {'@': 152}), 40: (1, {'@': 152}), 30: (1, {'@': 152}), 29: (1, {'@': 152}), 10: (1, {'@': 152}), 16: (1, {'@': 152}), 41: (1, {'@': 152}), 27: (1, {'@': 152}), 11: (1, {'@': 152})}, 237: {25: (1, {'@': 95}), 6: (1, {'@': 95}), 14: (1, {'@': 95}), 30: (1, {'@': 95}), 12: (1, {'@': 95}), 24: (1, {'@': 95}), 29: (1, {'@': 95}), 28: (1, {'@': 95}), 34: (1, {'@': 95}), 19: (1, {'@': 95}), 8: (1, {'@': 95}), 9: (1, {'@': 95}), 10: (1, {'@': 95}), 15: (1, {'@': 95}), 16: (1, {'@': 95}), 27: (1, {'@': 95}), 11: (1, {'@': 95}), 33: (1, {'@': 95}), 32: (1, {'@': 95}), 36: (1, {'@': 95}), 42: (1, {'@': 95}), 37: (1, {'@': 95}), 40: (1, {'@': 95}), 38: (1, {'@': 95}), 41: (1, {'@': 95}), 39: (1, {'@': 95}), 45: (1, {'@': 95}), 51: (1, {'@': 95}), 46: (1, {'@': 95}), 47: (1, {'@': 95}), 48: (1, {'@': 95})}, 238: {25: (1, {'@': 190}), 6: (1, {'@': 190}), 14: (1, {'@': 190}), 30: (1, {'@': 190}), 12: (1, {'@': 190}), 24: (1, {'@': 190}), 29: (1, {'@': 190}), 28: (1, {'@': 190}), 34: (1, {'@': 190}), 19: (1, {'@': 190}), 8: (1, {'@': 190}), 9: (1, {'@': 190}), 10: (1, {'@': 190}), 15: (1, {'@': 190}), 16: (1, {'@': 190}), 27: (1, {'@': 190}), 11: (1, {'@': 190}), 33: (1, {'@': 190}), 32: (1, {'@': 190}), 36: (1, {'@': 190}), 42: (1, {'@': 190}), 37: (1, {'@': 190}), 43: (1, {'@': 190}), 38: (1, {'@': 190}), 40: (1, {'@': 190}), 44: (1, {'@': 190}), 41: (1, {'@': 190}), 39: (1, {'@': 190}), 45: (1, {'@': 190}), 51: (1, {'@': 190}), 46: (1, {'@': 190}), 47: (1, {'@': 190}), 48: (1, {'@': 190})}, 239: {37: (1, {'@': 169}), 12: (1, {'@': 169}), 24: (1, {'@': 169}), 38: (1, {'@': 169}), 28: (1, {'@': 169}), 34: (1, {'@': 169}), 19: (1, {'@': 169}), 9: (1, {'@': 169}), 15: (1, {'@': 169}), 39: (1, {'@': 169}), 33: (1, {'@': 169}), 32: (1, {'@': 169}), 36: (1, {'@': 169}), 25: (1, {'@': 169}), 6: (1, {'@': 169}), 14: (1, {'@': 169}), 40: (1, {'@': 169}), 30: (1, {'@': 169}), 29: (1, {'@': 169}), 10: (1, {'@': 169}), 16: (1, {'@': 169}), 41: (1, {'@': 169}), 27: (1, {'@': 169}), 11: (1, {'@': 169})}, 240: {38: (1, {'@': 98})}, 241: {46: (0, 178)}, 242: {42: (1, {'@': 132}), 12: (1, {'@': 132}), 24: (1, {'@': 132}), 28: (1, {'@': 132}), 34: (1, {'@': 132}), 19: (1, {'@': 132}), 9: (1, {'@': 132}), 15: (1, {'@': 132}), 33: (1, {'@': 132}), 32: (1, {'@': 132}), 36: (1, {'@': 132}), 25: (1, {'@': 132}), 6: (1, {'@': 132}), 14: (1, {'@': 132}), 30: (1, {'@': 132}), 29: (1, {'@': 132}), 10: (1, {'@': 132}), 16: (1, {'@': 132}), 27: (1, {'@': 132}), 11: (1, {'@': 132}), 45: (1, {'@': 132}), 8: (1, {'@': 132}), 46: (1, {'@': 132}), 47: (1, {'@': 132})}, 243: {51: (1, {'@': 202}), 25: (1, {'@': 202}), 6: (1, {'@': 202}), 14: (1, {'@': 202}), 27: (1, {'@': 202}), 30: (1, {'@': 202}), 12: (1, {'@': 202}), 11: (1, {'@': 202}), 24: (1, {'@': 202}), 29: (1, {'@': 202}), 32: (1, {'@': 202}), 9: (1, {'@': 202}), 36: (1, {'@': 202})}, 244: {78: (0, 100), 77: (0, 240)}, 245: {15: (1, {'@': 175}), 16: (1, {'@': 175}), 25: (1, {'@': 175}), 6: (1, {'@': 175}), 14: (1, {'@': 175}), 27: (1, {'@': 175}), 30: (1, {'@': 175}), 12: (1, {'@': 175}), 9: (1, {'@': 175}), 11: (1, {'@': 175}), 28: (1, {'@': 175}), 29: (1, {'@': 175}), 32: (1, {'@': 175}), 33: (1, {'@': 175}), 19: (1, {'@': 175}), 34: (1, {'@': 175}), 10: (1, {'@': 175}), 36: (1, {'@': 175}), 24: (1, {'@': 175})}, 246: {51: (1, {'@': 209}), 25: (1, {'@': 209}), 6: (1, {'@': 209}), 14: (1, {'@': 209}), 27: (1, {'@': 209}), 30: (1, {'@': 209}), 12: (1, {'@': 209}), 11: (1, {'@': 209}), 24: (1, {'@': 209}), 29: (1, {'@': 209}), 32: (1, {'@': 209}), 9: (1, {'@': 209}), 36: (1, {'@': 209})}, 247: {48: (1, {'@': 157}), 37: (1, {'@': 157}), 12: (1, {'@': 157}), 24: (1, {'@': 157}), 38: (1, {'@': 157}), 28: (1, {'@': 157}), 34: (1, {'@': 157}), 19: (1, {'@': 157}), 9: (1, {'@': 157}), 15: (1, {'@': 157}), 33: (1, {'@': 157}), 32: (1, {'@': 157}), 36: (1, {'@': 157}), 25: (1, {'@': 157}), 6: (1, {'@': 157}), 14: (1, {'@': 157}), 40: (1, {'@': 157}), 30: (1, {'@': 157}), 29: (1, {'@': 157}), 10: (1, {'@': 157}), 16: (1, {'@': 157}), 41: (1, {'@': 157}), 27: (1, {'@': 157}), 11: (1, {'@': 157})}, 248: {51: (1, {'@': 205}), 25: (1, {'@': 205}), 6: (1, {'@': 205}), 14: (1, {'@': 205}), 27: (1, {'@': 205}), 30: (1, {'@': 205}), 12: (1, {'@': 205}), 11: (1, {'@': 205}), 24: (1, {'@': 205}), 29: (1, {'@': 205}), 32: (1, {'@': 205}), 9: (1, {'@': 205}), 36: (1, {'@': 205})}, 249: {46: (0, 99), 113: (0, 36)}, 250: {56: (0, 149), 55: (0, 5), 44: (0, 123), 57: (0, 109), 43: (0, 163)}}, 'start_states': {'start': 133}, 'end_states': {'start': 128}}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}, {'@': 221}, {'@': 222}, {'@': 223}, {'@': 224}, {'@': 225}, {'@': 226}, {'@': 227}, {'@': 228}, {'@': 229}, {'@': 230}, {'@': 231}, {'@': 232}, {'@': 233}, {'@': 234}, {'@': 235}, {'@': 236}, {'@': 237}], 'options': {'debug': False, 'strict': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'cache_grammar': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': True, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'ordered_sets': True, 'import_paths': [], 'source_path': None, '_plugins': {}}, '__type__': 'Lark'}
+MEMO = {0: {'name': 'WS', 'pattern': {'value': '(?:[ \t\x0c\r\n])+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 1: {'name': 'STRING', 'pattern': {'value': '[^`*[_{<>\n\\\\!|\\]-]+|[^`*[_{<>\n\\\\!]', 'flags': [], 'raw': '/[^`*[_{<>\\n\\\\!|\\]-]+|[^`*[_{<>\\n\\\\!]/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': -1, '__type__': 'TerminalDef'}, 2: {'name': 'BR_WORD_NOT_ANCHOR', 'pattern': {'value': '\\[[^^(]+?](?![(\n])', 'flags': [], 'raw': '/\\[[^^(]+?](?![(\\n])/', '_width': [3, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 3: {'name': 'ESCAPED_CHAR', 'pattern': {'value': '\\\\.', 'flags': [], 'raw': None, '_width': [2, 2], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 4: {'name': 'NON_IMAGE_BANG', 'pattern': {'value': '!(?!\\[)', 'flags': [], 'raw': '/!(?!\\[)/', '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 5: {'name': 'CUR_BR_WORD_NOT_DIRECTIVE', 'pattern': {'value': '{[^^\n]+?}', 'flags': [], 'raw': '/{[^^\\n]+?}/', '_width': [3, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 6: {'name': 'PIPE_STRING', 'pattern': {'value': '[^|\n}]+(?=[|])', 'flags': [], 'raw': '/[^|\\n}]+(?=[|])/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 7: {'name': 'ARROW_R', 'pattern': {'value': '->', 'flags': [], 'raw': '"->"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 8: {'name': 'ARROW_L', 'pattern': {'value': '<-', 'flags': [], 'raw': '"<-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 9: {'name': 'PAR_STRING', 'pattern': {'value': '[^)]+(?=[)])', 'flags': [], 'raw': '/[^)]+(?=[)])/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 10: {'name': 'BR_STRING', 'pattern': {'value': '[^!^\\]][^\\]\n]*(?=])', 'flags': [], 'raw': '/[^!^\\]][^\\]\\n]*(?=])/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 11: {'name': 'CUR_BR_STRING', 'pattern': {'value': '[^}]+(?=})', 'flags': [], 'raw': '/[^}]+(?=})/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 12: {'name': 'COLON_STRING', 'pattern': {'value': '[^:\n}]+(?=:)', 'flags': [], 'raw': '/[^:\\n}]+(?=:)/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 13: {'name': '_LF', 'pattern': {'value': '\n', 'flags': [], 'raw': '/\\n/', '_width': [1, 1], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 14: {'name': 'QUOTE_LEAD', 'pattern': {'value': '>(?:[> ]+)?', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 15: {'name': 'LEADING_SPACE_LI', 'pattern': {'value': '^\\s*((\\d+[.])|([*+-])) ', 'flags': ['m'], 'raw': '/^\\s*((\\d+[.])|([*+-])) /m', '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 16: {'name': 'NOT_BACKTICK', 'pattern': {'value': '[^`]+(?=`)', 'flags': [], 'raw': '/[^`]+(?=`)/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 17: {'name': 'CODELINE', 'pattern': {'value': '[\\s\\S]+?(?=```)', 'flags': [], 'raw': '/[\\s\\S]+?(?=```)/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 18: {'name': 'TAB_DIV', 'pattern': {'value': '[:  -]+', 'flags': [], 'raw': '/[:  -]+/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 19: {'name': 'HTML_PROP_NAME', 'pattern': {'value': '[^=>\\s]+', 'flags': [], 'raw': '/[^=>\\s]+/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 20: {'name': 'HTML_VALUE', 'pattern': {'value': '="[^"]*"', 'flags': [], 'raw': None, '_width': [3, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 21: {'name': 'SPACES', 'pattern': {'value': ' +', 'flags': [], 'raw': '/ +/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 22: {'name': 'HASH', 'pattern': {'value': '#', 'flags': [], 'raw': '"#"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 23: {'name': '__ANON_0', 'pattern': {'value': '<sup>', 'flags': [], 'raw': '"<sup>"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 24: {'name': '__ANON_1', 'pattern': {'value': '</sup>', 'flags': [], 'raw': '"</sup>"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 25: {'name': '__ANON_2', 'pattern': {'value': '<sub>', 'flags': [], 'raw': '"<sub>"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 26: {'name': '__ANON_3', 'pattern': {'value': '</sub>', 'flags': [], 'raw': '"</sub>"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 27: {'name': '__ANON_4', 'pattern': {'value': '<small>', 'flags': [], 'raw': '"<small>"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 28: {'name': '__ANON_5', 'pattern': {'value': '</small>', 'flags': [], 'raw': '"</small>"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 29: {'name': '__ANON_6', 'pattern': {'value': '<smaller>', 'flags': [], 'raw': '"<smaller>"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 30: {'name': '__ANON_7', 'pattern': {'value': '</smaller>', 'flags': [], 'raw': '"</smaller>"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 31: {'name': 'MINUS', 'pattern': {'value': '-', 'flags': [], 'raw': '"-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 32: {'name': '__ANON_8', 'pattern': {'value': '---', 'flags': [], 'raw': '"---"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 33: {'name': 'COLON', 'pattern': {'value': ':', 'flags': [], 'raw': '":"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 34: {'name': 'BACKQUOTE', 'pattern': {'value': '`', 'flags': [], 'raw': '"`"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 35: {'name': 'UNDERSCORE', 'pattern': {'value': '_', 'flags': [], 'raw': '"_"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 36: {'name': 'STAR', 'pattern': {'value': '*', 'flags': [], 'raw': '"*"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 37: {'name': '__ANON_9', 'pattern': {'value': '**', 'flags': [], 'raw': '"**"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 38: {'name': '__ANON_10', 'pattern': {'value': '[A-Za-z]+', 'flags': [], 'raw': '/[A-Za-z]+/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 39: {'name': '__ANON_11', 'pattern': {'value': '```', 'flags': [], 'raw': '"```"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 40: {'name': 'VBAR', 'pattern': {'value': '|', 'flags': [], 'raw': '"|"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 41: {'name': '__ANON_12', 'pattern': {'value': '![', 'flags': [], 'raw': '"!["', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 42: {'name': '__ANON_13', 'pattern': {'value': '](', 'flags': [], 'raw': '"]("', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 43: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], 'raw': '")"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 44: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], 'raw': '"["', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 45: {'name': '__ANON_14', 'pattern': {'value': '[^', 'flags': [], 'raw': '"[^"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 46: {'name': '__ANON_15', 'pattern': {'value': '[^\\]]+', 'flags': [], 'raw': '/[^\\]]+/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 47: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], 'raw': '"]"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 48: {'name': '__ANON_16', 'pattern': {'value': ']:', 'flags': [], 'raw': '"]:"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 49: {'name': '__ANON_17', 'pattern': {'value': '{^', 'flags': [], 'raw': '"{^"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 50: {'name': 'RBRACE', 'pattern': {'value': '}', 'flags': [], 'raw': '"}"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 51: {'name': 'LESSTHAN', 'pattern': {'value': '<', 'flags': [], 'raw': '"<"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 52: {'name': '__ANON_18', 'pattern': {'value': '[^\\s>]+', 'flags': [], 'raw': '/[^\\s>]+/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 53: {'name': 'MORETHAN', 'pattern': {'value': '>', 'flags': [], 'raw': '">"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 54: {'name': '__ANON_19', 'pattern': {'value': '</', 'flags': [], 'raw': '"</"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 55: {'name': '__ANON_20', 'pattern': {'value': '[^>]+?(?=>)', 'flags': [], 'raw': '/[^>]+?(?=>)/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 56: {'origin': {'name': 'superscript', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, {'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 57: {'origin': {'name': 'subscript', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, {'name': '__ANON_3', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 58: {'origin': {'name': 'small', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_4', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, {'name': '__ANON_5', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 59: {'origin': {'name': 'smaller', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_6', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, {'name': '__ANON_7', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 60: {'origin': {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'inline_pre', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 61: {'origin': {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ref', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 62: {'origin': {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'anchor', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 63: {'origin': {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'image', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 64: {'origin': {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'plain_text', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 65: {'origin': {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'custom_directive', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 66: {'origin': {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'popover', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 67: {'origin': {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'small', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 68: {'origin': {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'smaller', '__type__': 'NonTerminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 69: {'origin': {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'superscript', '__type__': 'NonTerminal'}], 'order': 9, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 70: {'origin': {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'subscript', '__type__': 'NonTerminal'}], 'order': 10, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 71: {'origin': {'name': 'non_nestable_blocks', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'code_block', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': 1, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 72: {'origin': {'name': 'non_nestable_blocks', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'refblock', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': 1, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 73: {'origin': {'name': 'non_nestable_blocks', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'quote', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': 1, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 74: {'origin': {'name': 'non_nestable_blocks', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'html', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': 1, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 75: {'origin': {'name': 'non_nestable_blocks', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'heading', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': 1, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 76: {'origin': {'name': 'non_nestable_blocks', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'table', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': 1, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 77: {'origin': {'name': 'non_nestable_blocks', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'list_block', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': 1, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 78: {'origin': {'name': 'non_nestable_blocks', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'hr', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': 1, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 79: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'non_nestable_blocks', '__type__': 'NonTerminal'}, {'name': '__start_star_1', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 80: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'non_nestable_blocks', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 81: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_star_1', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 82: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 83: {'origin': {'name': 'hr', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_8', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__hr_star_2', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 84: {'origin': {'name': 'hr', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_8', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 85: {'origin': {'name': 'italic', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_italic', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 86: {'origin': {'name': 'italic', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'under_italic', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 87: {'origin': {'name': 'quote_body', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'QUOTE_LEAD', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 88: {'origin': {'name': 'quote', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__quote_plus_6', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 89: {'origin': {'name': 'list_block', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__list_block_plus_7', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 90: {'origin': {'name': 'list_item', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LEADING_SPACE_LI', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__list_item_plus_8', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 91: {'origin': {'name': 'inline_code', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOT_BACKTICK', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 92: {'origin': {'name': 'inline_pre', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BACKQUOTE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'inline_code', '__type__': 'NonTerminal'}, {'name': 'BACKQUOTE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 93: {'origin': {'name': 'inline_pre', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BACKQUOTE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'BACKQUOTE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 94: {'origin': {'name': 'under_italic', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'UNDERSCORE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__under_italic_plus_10', '__type__': 'NonTerminal'}, {'name': 'UNDERSCORE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 95: {'origin': {'name': 'star_italic', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__under_italic_plus_10', '__type__': 'NonTerminal'}, {'name': 'STAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 96: {'origin': {'name': 'star_bold', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_9', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__star_bold_plus_11', '__type__': 'NonTerminal'}, {'name': '__ANON_9', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': 2, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 97: {'origin': {'name': 'plain_text', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': -2, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 98: {'origin': {'name': 'code', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CODELINE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 99: {'origin': {'name': 'identifier', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_10', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 100: {'origin': {'name': 'code_block', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_11', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'identifier', '__type__': 'NonTerminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'code', '__type__': 'NonTerminal'}, {'name': '__ANON_11', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': 2, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 101: {'origin': {'name': 'code_block', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_11', 'filter_out': True, '__type__': 'Terminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'code', '__type__': 'NonTerminal'}, {'name': '__ANON_11', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': 2, 'template_source': None, 'empty_indices': (False, True, False, False, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 102: {'origin': {'name': 'table_cell', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__superscript_plus_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 103: {'origin': {'name': 'table_row', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'VBAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__table_row_plus_13', '__type__': 'NonTerminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 104: {'origin': {'name': 'table_row', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'VBAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__table_row_plus_13', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 105: {'origin': {'name': 'table_divisor', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'VBAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__table_divisor_plus_14', '__type__': 'NonTerminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 106: {'origin': {'name': 'table', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'table_row', '__type__': 'NonTerminal'}, {'name': 'table_divisor', '__type__': 'NonTerminal'}, {'name': '__table_plus_15', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 107: {'origin': {'name': 'image', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_12', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'BR_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_13', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PAR_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 108: {'origin': {'name': 'image', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_12', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'BR_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_13', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 109: {'origin': {'name': 'image', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_12', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_13', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PAR_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True, False, False, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 110: {'origin': {'name': 'image', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_12', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_13', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 111: {'origin': {'name': 'anchor', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, {'name': '__ANON_13', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PAR_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 112: {'origin': {'name': 'anchor', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, {'name': '__ANON_13', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 113: {'origin': {'name': 'anchor', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_13', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PAR_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 114: {'origin': {'name': 'anchor', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_13', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, True, False), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 115: {'origin': {'name': 'ref', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_14', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_15', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 116: {'origin': {'name': 'refblock', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__refblock_plus_17', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 117: {'origin': {'name': 'refitem', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_14', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_15', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_16', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__refitem_plus_18', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 118: {'origin': {'name': 'custom_directive', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_17', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CUR_BR_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 119: {'origin': {'name': 'popover', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_17', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'PIPE_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'VBAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'CUR_BR_STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 120: {'origin': {'name': 'html', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SPACES', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'html_tag', '__type__': 'NonTerminal'}, {'name': '__html_star_19', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 121: {'origin': {'name': 'html', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SPACES', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'html_tag', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 122: {'origin': {'name': 'html', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'html_tag', '__type__': 'NonTerminal'}, {'name': '__html_star_19', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 123: {'origin': {'name': 'html', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'html_tag', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 124: {'origin': {'name': 'html_tag', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'html_open_tag', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 125: {'origin': {'name': 'html_tag', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'html_close_tag', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 126: {'origin': {'name': 'html_open_tag', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LESSTHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_18', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 127: {'origin': {'name': 'html_open_tag', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LESSTHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_18', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 128: {'origin': {'name': 'html_close_tag', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_19', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_20', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 129: {'origin': {'name': 'heading', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__heading_plus_21', '__type__': 'NonTerminal'}, {'name': '__list_item_plus_8', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 130: {'origin': {'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'italic', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 131: {'origin': {'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 132: {'origin': {'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 133: {'origin': {'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, {'name': 'italic', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 134: {'origin': {'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, {'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 135: {'origin': {'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__superscript_plus_0', '__type__': 'NonTerminal'}, {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 136: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'hr', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 137: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'code_block', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 138: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 139: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'italic', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 140: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 141: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 142: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_star_1', '__type__': 'NonTerminal'}, {'name': 'hr', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 143: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_star_1', '__type__': 'NonTerminal'}, {'name': 'code_block', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 144: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_star_1', '__type__': 'NonTerminal'}, {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 145: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_star_1', '__type__': 'NonTerminal'}, {'name': 'italic', '__type__': 'NonTerminal'}], 'order': 9, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 146: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_star_1', '__type__': 'NonTerminal'}, {'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 10, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 147: {'origin': {'name': '__start_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__start_star_1', '__type__': 'NonTerminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 11, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 148: {'origin': {'name': '__hr_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MINUS', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 149: {'origin': {'name': '__hr_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__hr_star_2', '__type__': 'NonTerminal'}, {'name': 'MINUS', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 150: {'origin': {'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'quote_body', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 151: {'origin': {'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'italic', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 152: {'origin': {'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 153: {'origin': {'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 154: {'origin': {'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, {'name': 'quote_body', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 155: {'origin': {'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, {'name': 'italic', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 156: {'origin': {'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, {'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 157: {'origin': {'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__quote_body_plus_5', '__type__': 'NonTerminal'}, {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 158: {'origin': {'name': '__quote_plus_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'quote_body', '__type__': 'NonTerminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 159: {'origin': {'name': '__quote_plus_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'quote_body', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 160: {'origin': {'name': '__quote_plus_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__quote_plus_6', '__type__': 'NonTerminal'}, {'name': 'quote_body', '__type__': 'NonTerminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 161: {'origin': {'name': '__quote_plus_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__quote_plus_6', '__type__': 'NonTerminal'}, {'name': 'quote_body', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 162: {'origin': {'name': '__list_block_plus_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'list_item', '__type__': 'NonTerminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 163: {'origin': {'name': '__list_block_plus_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'list_item', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 164: {'origin': {'name': '__list_block_plus_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__list_block_plus_7', '__type__': 'NonTerminal'}, {'name': 'list_item', '__type__': 'NonTerminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 165: {'origin': {'name': '__list_block_plus_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__list_block_plus_7', '__type__': 'NonTerminal'}, {'name': 'list_item', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 166: {'origin': {'name': '__list_item_plus_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 167: {'origin': {'name': '__list_item_plus_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 168: {'origin': {'name': '__list_item_plus_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'italic', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 169: {'origin': {'name': '__list_item_plus_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__list_item_plus_8', '__type__': 'NonTerminal'}, {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 170: {'origin': {'name': '__list_item_plus_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__list_item_plus_8', '__type__': 'NonTerminal'}, {'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 171: {'origin': {'name': '__list_item_plus_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__list_item_plus_8', '__type__': 'NonTerminal'}, {'name': 'italic', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 172: {'origin': {'name': '__under_italic_plus_10', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 173: {'origin': {'name': '__under_italic_plus_10', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 174: {'origin': {'name': '__under_italic_plus_10', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__under_italic_plus_10', '__type__': 'NonTerminal'}, {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 175: {'origin': {'name': '__under_italic_plus_10', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__under_italic_plus_10', '__type__': 'NonTerminal'}, {'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 176: {'origin': {'name': '__star_bold_plus_11', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 177: {'origin': {'name': '__star_bold_plus_11', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'italic', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 178: {'origin': {'name': '__star_bold_plus_11', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__star_bold_plus_11', '__type__': 'NonTerminal'}, {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 179: {'origin': {'name': '__star_bold_plus_11', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__star_bold_plus_11', '__type__': 'NonTerminal'}, {'name': 'italic', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 180: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 181: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BR_WORD_NOT_ANCHOR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 182: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ESCAPED_CHAR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 183: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NON_IMAGE_BANG', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 184: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CUR_BR_WORD_NOT_DIRECTIVE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 185: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ARROW_R', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 186: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ARROW_L', 'filter_out': False, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 187: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 188: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, {'name': 'BR_WORD_NOT_ANCHOR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 189: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, {'name': 'ESCAPED_CHAR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 9, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 190: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, {'name': 'NON_IMAGE_BANG', 'filter_out': False, '__type__': 'Terminal'}], 'order': 10, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 191: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, {'name': 'CUR_BR_WORD_NOT_DIRECTIVE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 11, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 192: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, {'name': 'ARROW_R', 'filter_out': False, '__type__': 'Terminal'}], 'order': 12, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 193: {'origin': {'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__plain_text_plus_12', '__type__': 'NonTerminal'}, {'name': 'ARROW_L', 'filter_out': False, '__type__': 'Terminal'}], 'order': 13, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 194: {'origin': {'name': '__table_row_plus_13', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'table_cell', '__type__': 'NonTerminal'}, {'name': 'VBAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 195: {'origin': {'name': '__table_row_plus_13', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__table_row_plus_13', '__type__': 'NonTerminal'}, {'name': 'table_cell', '__type__': 'NonTerminal'}, {'name': 'VBAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 196: {'origin': {'name': '__table_divisor_plus_14', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TAB_DIV', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'VBAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 197: {'origin': {'name': '__table_divisor_plus_14', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__table_divisor_plus_14', '__type__': 'NonTerminal'}, {'name': 'TAB_DIV', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'VBAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 198: {'origin': {'name': '__table_plus_15', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'table_row', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 199: {'origin': {'name': '__table_plus_15', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__table_plus_15', '__type__': 'NonTerminal'}, {'name': 'table_row', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 200: {'origin': {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'image', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 201: {'origin': {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'inline_pre', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 202: {'origin': {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'plain_text', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 203: {'origin': {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'italic', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 204: {'origin': {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 205: {'origin': {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__anchor_star_16', '__type__': 'NonTerminal'}, {'name': 'image', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 206: {'origin': {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__anchor_star_16', '__type__': 'NonTerminal'}, {'name': 'inline_pre', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 207: {'origin': {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__anchor_star_16', '__type__': 'NonTerminal'}, {'name': 'plain_text', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 208: {'origin': {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__anchor_star_16', '__type__': 'NonTerminal'}, {'name': 'italic', '__type__': 'NonTerminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 209: {'origin': {'name': '__anchor_star_16', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__anchor_star_16', '__type__': 'NonTerminal'}, {'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 9, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 210: {'origin': {'name': '__refblock_plus_17', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'refitem', '__type__': 'NonTerminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 211: {'origin': {'name': '__refblock_plus_17', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'refitem', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 212: {'origin': {'name': '__refblock_plus_17', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__refblock_plus_17', '__type__': 'NonTerminal'}, {'name': 'refitem', '__type__': 'NonTerminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 213: {'origin': {'name': '__refblock_plus_17', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__refblock_plus_17', '__type__': 'NonTerminal'}, {'name': 'refitem', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 214: {'origin': {'name': '__refitem_plus_18', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 215: {'origin': {'name': '__refitem_plus_18', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'italic', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 216: {'origin': {'name': '__refitem_plus_18', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 217: {'origin': {'name': '__refitem_plus_18', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__refitem_plus_18', '__type__': 'NonTerminal'}, {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 218: {'origin': {'name': '__refitem_plus_18', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__refitem_plus_18', '__type__': 'NonTerminal'}, {'name': 'italic', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 219: {'origin': {'name': '__refitem_plus_18', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__refitem_plus_18', '__type__': 'NonTerminal'}, {'name': 'star_bold', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 220: {'origin': {'name': '__html_star_19', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 221: {'origin': {'name': '__html_star_19', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'code_block', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 222: {'origin': {'name': '__html_star_19', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 223: {'origin': {'name': '__html_star_19', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'html_tag', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 224: {'origin': {'name': '__html_star_19', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__html_star_19', '__type__': 'NonTerminal'}, {'name': 'non_nestable_inlines', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 225: {'origin': {'name': '__html_star_19', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__html_star_19', '__type__': 'NonTerminal'}, {'name': 'code_block', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 226: {'origin': {'name': '__html_star_19', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__html_star_19', '__type__': 'NonTerminal'}, {'name': '_LF', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 227: {'origin': {'name': '__html_star_19', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__html_star_19', '__type__': 'NonTerminal'}, {'name': 'html_tag', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 228: {'origin': {'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'HTML_PROP_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'HTML_VALUE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 229: {'origin': {'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'HTML_PROP_NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 230: {'origin': {'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'HTML_PROP_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'HTML_VALUE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 231: {'origin': {'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'HTML_PROP_NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 232: {'origin': {'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, {'name': 'WS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'HTML_PROP_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'HTML_VALUE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 233: {'origin': {'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, {'name': 'WS', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'HTML_PROP_NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 234: {'origin': {'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, {'name': 'HTML_PROP_NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'HTML_VALUE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 235: {'origin': {'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__html_open_tag_star_20', '__type__': 'NonTerminal'}, {'name': 'HTML_PROP_NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (False, False, True), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 236: {'origin': {'name': '__heading_plus_21', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'HASH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 237: {'origin': {'name': '__heading_plus_21', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__heading_plus_21', '__type__': 'NonTerminal'}, {'name': 'HASH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
@@ -0,0 +1,150 @@
+# Render many documents at once (parse -> lift -> HTML), optionally in a pool of worker processes
+#
+# A document which fails comes back as a DocError in its DocResult; the rest of the batch is not affected.
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from io import StringIO
+from typing import ContextManager, Hashable, Iterable, Iterator
+
+from markdown_parser.instrument import LIFT, WRITE, Collector, DocMetrics, count_nodes
+from markdown_parser.lifter import lift
+from markdown_parser.limits import Limits
+from markdown_parser.parser import COMPILE_GRAMMAR, DoubleParser
+from markdown_parser.processor import Processor
+from markdown_parser.render_cache import RenderCache, cache_key
+from markdown_parser.renderer import write_html
+
+
+@dataclass
+class DocError:
+    stage: str  # "parse", "lift" or "render"
+    type: str  # name of the exception class
+    message: str
+
+
+@dataclass
+class DocResult:
+    id: Hashable
+    html: str | None = None
+    error: DocError | None = None
+    metrics: DocMetrics | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def render_doc(
+    parser: DoubleParser,
+    doc_id: Hashable,
+    text: str,
+    ext: list[Processor] | None = None,
+    cache: RenderCache | None = None,
+    instrument: bool = False,
+) -> DocResult:
+    """
+    `instrument`: set the `metrics` of the result (see `markdown_parser.instrument`)
+    """
+    metrics = DocMetrics(doc_id) if instrument else None
+    if cache is not None:
+        key = cache_key(text, ext)
+        if (html := cache.get(key)) is not None:
+            if metrics is not None:
+                metrics.cached = True
+                metrics.input_bytes = len(text.encode())
+                metrics.output_bytes = len(html.encode())
+            return DocResult(doc_id, html, metrics=metrics)
+
+    stage = "parse"
+    try:
+        nodes = parser.parse_nodes(text, metrics=metrics)
+        stage = "lift"
+        with _stage(metrics, LIFT):
+            lifted = lift(nodes)
+        if metrics is not None:
+            metrics.lifted_nodes = count_nodes(lifted)
+        stage = "render"
+        out = StringIO()
+        with _stage(metrics, WRITE):
+            write_html(lifted, out, ext)
+    except Exception as e:
+        return DocResult(doc_id, error=DocError(stage, type(e).__name__, str(e)), metrics=metrics)
+    html = out.getvalue()
+    if metrics is not None:
+        metrics.output_bytes = len(html.encode())
+    if cache is not None:
+        cache.put(key, html, lifted if cache.store_ast else None)
+    return DocResult(doc_id, html, metrics=metrics)
+
+
+def _stage(metrics: DocMetrics | None, name: str) -> ContextManager[None]:
+    return nullcontext() if metrics is None else metrics.stage(name)
+
+
+def render_batch(
+    docs: Iterable[tuple[Hashable, str]],
+    workers: int = 0,
+    ext: list[Processor] | None = None,
+    cache_dir: str | None = None,
+    compile_grammar: bool = COMPILE_GRAMMAR,
+    chunksize: int = 8,
+    cache: RenderCache | None = None,
+    collector: Collector | None = None,
+    limits: Limits | None = None,
+) -> Iterator[DocResult]:
+    """
+    Render `docs`, (id, text) pairs, yielding a DocResult for each one, in the same order.
+    `workers`: if set, documents are rendered in a pool of this many processes, each with its own parser;
+    `ext` is sent to them, so it must be picklable.
+    `chunksize`: documents sent to a worker at a time.
+    `cache`: if set, unchanged documents are read from it instead of being rendered; shared by the workers.
+    An entry the cache fails to read is rendered, one it fails to write is not stored (see `RenderCache`).
+    `collector`: if set, receives the metrics of each document (also in its DocResult), in this process.
+    `limits`: see DoubleParser; a document over them fails with a LimitExceeded error.
+    """
+    instrument = collector is not None
+    if not workers:
+        parser = DoubleParser(cache_dir, compile_grammar, limits=limits)
+        results = (render_doc(parser, doc_id, text, ext, cache, instrument) for doc_id, text in docs)
+        yield from _record(results, collector)
+        return
+
+    initargs = (cache_dir, compile_grammar, ext, cache, instrument, limits)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+        yield from _record(pool.map(_render_in_worker, docs, chunksize=chunksize), collector)
+
+
+def _record(results: Iterable[DocResult], collector: Collector | None) -> Iterator[DocResult]:
+    for result in results:
+        if collector is not None and result.metrics is not None:
+            collector.record(result.metrics)
+        yield result
+
+
+_worker_parser: DoubleParser | None = None
+_worker_ext: list[Processor] | None = None
+_worker_cache: RenderCache | None = None
+_worker_instrument = False
+
+
+def _init_worker(
+    cache_dir: str | None,
+    compile_grammar: bool,
+    ext: list[Processor] | None,
+    cache: RenderCache | None,
+    instrument: bool,
+    limits: Limits | None,
+) -> None:
+    global _worker_parser, _worker_ext, _worker_cache, _worker_instrument
+    _worker_parser = DoubleParser(cache_dir, compile_grammar, limits=limits)
+    _worker_ext = ext
+    _worker_cache = cache
+    _worker_instrument = instrument
+
+
+def _render_in_worker(doc: tuple[Hashable, str]) -> DocResult:
+    assert _worker_parser is not None
+    doc_id, text = doc
+    return render_doc(_worker_parser, doc_id, text, _worker_ext, _worker_cache, _worker_instrument)
@@ -0,0 +1,62 @@
+# Build step: compile the grammars in `parser.py` into Python modules holding the serialized LALR tables,
+# same idea as lark's standalone generator, but loaded with the installed `lark` so nodes/tokens keep their types.
+# `DoubleParser` loads these modules by default; they must be regenerated whenever a grammar changes
+#
+#   python -m markdown_parser.build_tables
+
+import os
+import sys
+
+import lark
+from lark.grammar import Rule
+from lark.lexer import TerminalDef
+
+from markdown_parser.parser import P1_OPTIONS, P2_OPTIONS, grammar1, grammar2, grammar_digest
+
+GRAMMARS = [
+    ("_grammar1_tables", grammar1, P1_OPTIONS),
+    ("_grammar2_tables", grammar2, P2_OPTIONS),
+]
+
+
+def render_module(grammar: str, options: dict) -> str:
+    # `debug` only changes analysis logging and error output, but with it set the tables
+    # are not serialized as plain literals. The runtime value is passed again on load
+    compiled = lark.Lark(grammar, **{**options, "debug": False})
+    data, memo = compiled.memo_serialize([TerminalDef, Rule])
+    return "\n".join([
+        "# Generated by `python -m markdown_parser.build_tables`, do not edit",
+        f"DIGEST = {grammar_digest(grammar, options)!r}",
+        f"DATA = {data!r}",
+        f"MEMO = {memo!r}",
+        "",
+    ])
+
+
+def is_current(path: str, grammar: str, options: dict) -> bool:
+    # the tables are not reproducible byte-for-byte, only rewrite them when the grammar changed
+    try:
+        with open(path) as fd:
+            fd.readline()
+            return fd.readline() == f"DIGEST = {grammar_digest(grammar, options)!r}\n"
+    except FileNotFoundError:
+        return False
+
+
+def build(out_dir: str = os.path.dirname(__file__), force: bool = False) -> list[str]:
+    written = []
+    for module_name, grammar, options in GRAMMARS:
+        path = os.path.join(out_dir, module_name + ".py")
+        if not force and is_current(path, grammar, options):
+            continue
+        tmp = path + ".tmp"
+        with open(tmp, "w") as fd:
+            fd.write(render_module(grammar, options))
+        os.replace(tmp, path)
+        written.append(path)
+    return written
+
+
+if __name__ == "__main__":
+    for path in build(force="--force" in sys.argv[1:]):
+        print("wrote", path)
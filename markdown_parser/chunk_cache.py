@@ -0,0 +1,80 @@
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from markdown_parser.nodes import Node
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    errors: int = 0  # entries which could not be read or written (RenderCache), counted as misses when read
+
+
+class ChunkCache:
+    """
+    Bounded LRU cache of parsed chunks, keyed by a hash of the chunk text.
+
+    Entries are kept pickled: every hit returns freshly built nodes, so callers can modify
+    the result without corrupting the cache, and `max_bytes` bounds the actual stored size.
+    Safe to share between threads.
+    """
+
+    def __init__(self, max_entries: int | None = 4096, max_bytes: int | None = None) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.stats = CacheStats()
+        self._entries: OrderedDict[bytes, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(chunk_text: str) -> bytes:
+        return hashlib.blake2b(chunk_text.encode(), digest_size=16).digest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, chunk_text: str) -> bool:
+        return self.key(chunk_text) in self._entries
+
+    def get(self, chunk_text: str) -> list[Node] | None:
+        k = self.key(chunk_text)
+        with self._lock:
+            blob = self._entries.get(k)
+            if blob is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(k)
+            self.stats.hits += 1
+        return pickle.loads(blob)
+
+    def put(self, chunk_text: str, nodes: list[Node]) -> None:
+        k = self.key(chunk_text)
+        blob = pickle.dumps(nodes, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if (old := self._entries.pop(k, None)) is not None:
+                self.size_bytes -= len(old)
+            self._entries[k] = blob
+            self.size_bytes += len(blob)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def _over_limit(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.size_bytes > self.max_bytes
+
+    def _evict(self) -> None:
+        while self._entries and self._over_limit():
+            _, blob = self._entries.popitem(last=False)
+            self.size_bytes -= len(blob)
+            self.stats.evictions += 1
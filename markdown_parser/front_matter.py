@@ -0,0 +1,56 @@
+# Read only the metadata block of a document, eg: for index and listing pages
+#
+# `lift` turns Hr, PlainText lines, Hr at the very start of a document into Metadata. Only the lines up to
+# the closing `---` (or the end of the first paragraph) can be part of it, so those are the only ones parsed.
+
+from itertools import chain
+from typing import Iterable, Iterator
+
+from markdown_parser.lifter import make_meta_from_lines
+from markdown_parser.nodes import KV, Hr, Node, PlainText
+from markdown_parser.parser import DoubleParser
+
+
+def read_front_matter(parser: DoubleParser, lines: Iterable[str]) -> list[KV] | None:
+    """
+    The entries of the Metadata `lift` would find at the start of `lines` (with their line endings,
+    as read from a file), or None if there's no metadata. The rest of the document is not read.
+    """
+    it = iter(lines)
+    head: list[str] = []
+    opened = False
+    for line in it:
+        head.append(line)
+        if "```" in line:
+            # a code block may go past the end of the paragraph, let the stream find it
+            return _entries(parser.parse_stream(chain(head, it)))
+        if line == "\n":
+            if len(head) == 1:
+                continue  # a single leading LF is dropped by p1
+            break  # end of the paragraph
+        if not opened:
+            if not line.startswith("---"):
+                return None
+            opened = True
+        elif line.startswith("---"):
+            break
+    return _entries(iter(parser.parse_nodes("".join(head))))
+
+
+def read_front_matter_file(parser: DoubleParser, path: str) -> list[KV] | None:
+    with open(path) as fd:
+        return read_front_matter(parser, fd)
+
+
+def _entries(nodes: Iterator[Node]) -> list[KV] | None:
+    # same as `lift`: Hr, PlainText lines, Hr
+    if not isinstance(next(nodes, None), Hr):
+        return None
+    meta_lines: list[PlainText] = []
+    for node in nodes:
+        if isinstance(node, Hr):
+            return make_meta_from_lines(meta_lines).entries
+        if not isinstance(node, PlainText):
+            return None
+        meta_lines.append(node)
+    return None
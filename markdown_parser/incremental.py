@@ -0,0 +1,81 @@
+# Incremental re-parsing for editors: after an edit, only the chunks around it go through p2 again
+#
+# A chunk is parsed on its own, so an edit can only change the chunks between the closest
+# untouched ParBreaks around it. Code blocks are the exception, as a fence can swallow
+# ParBreaks, so a fence near the edit (before or after it) falls back to a full parse.
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, replace
+
+from markdown_parser.nodes import Node, ParBreak
+from markdown_parser.parser import DoubleParser
+
+
+@dataclass
+class Piece:
+    start: int
+    end: int
+    chunk: str | ParBreak
+    nodes: list[Node]
+
+
+@dataclass
+class ParseState:
+    """
+    Nodes are shared with the states derived from this one by `reparse`, treat them as read-only.
+    """
+    text: str
+    pieces: list[Piece]
+
+    @property
+    def nodes(self) -> list[Node]:
+        return [node for piece in self.pieces for node in piece.nodes]
+
+
+def _parse_pieces(parser: DoubleParser, text: str, offset: int, known: dict[str, list[Node]]) -> list[Piece]:
+    ret = []
+    for start, end, chunk in parser.split_spans(text):
+        if isinstance(chunk, ParBreak):
+            nodes: list[Node] = [chunk]
+        elif chunk in known:
+            nodes = known[chunk]
+        else:
+            nodes = parser.parse_chunk(chunk)
+        ret.append(Piece(start + offset, end + offset, chunk, nodes))
+    return ret
+
+
+def parse_state(parser: DoubleParser, text: str) -> ParseState:
+    return ParseState(text, _parse_pieces(parser, text, 0, {}))
+
+
+def reparse(parser: DoubleParser, state: ParseState, offset: int, removed: int, inserted: str) -> ParseState:
+    """
+    Apply the edit (replace `removed` characters at `offset` by `inserted`) to `state`.
+    The result is always the same as `parse_state` on the edited text.
+    """
+    text = state.text[:offset] + inserted + state.text[offset + removed :]
+    pieces = state.pieces
+    edit_end = offset + removed
+
+    # pieces[lo:hi] touch the edit, widen to the untouched ParBreaks around them
+    lo = bisect_left(pieces, offset, key=lambda p: p.end)
+    hi = bisect_right(pieces, edit_end, key=lambda p: p.start)
+    first = lo - 1
+    while first >= 0 and not isinstance(pieces[first].chunk, ParBreak):
+        first -= 1
+    last = hi
+    while last < len(pieces) and not isinstance(pieces[last].chunk, ParBreak):
+        last += 1
+
+    win_start = pieces[first].start if first >= 0 else 0
+    win_end = pieces[last].end if last < len(pieces) else len(state.text)
+    delta = len(inserted) - removed
+    window_text = text[win_start : win_end + delta]
+    if "```" in window_text or "```" in state.text[win_start:win_end]:
+        return parse_state(parser, text)
+
+    known = {p.chunk: p.nodes for p in pieces[first + 1 : last] if isinstance(p.chunk, str)}
+    window = _parse_pieces(parser, window_text, win_start, known)
+    after = [replace(p, start=p.start + delta, end=p.end + delta) for p in pieces[last + 1 :]]
+    return ParseState(text, pieces[: max(first, 0)] + window + after)
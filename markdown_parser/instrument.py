@@ -0,0 +1,123 @@
+# Opt-in per-document metrics: time spent in each stage of the pipeline and the size of what it produced
+#
+# Stages (seconds, in `DocMetrics.times`):
+#   split      p1: splitting the document into chunks
+#   parse      p2: lexing and parsing the chunks
+#   transform  NodeTransformer, which runs during `parse`
+#   lift       `lift`
+#   write      `write_html`
+# and, for pipelines timing them with `DocMetrics.stage`: postprocess, render (`render`), str (`str()` of its nodes).
+#
+# Nothing is measured unless a DocMetrics is passed to `parse_nodes`/`parse_stream`, or a Collector to `render_batch`.
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Callable, Hashable, Iterator
+
+SPLIT = "split"
+PARSE = "parse"
+TRANSFORM = "transform"
+LIFT = "lift"
+POSTPROCESS = "postprocess"
+RENDER = "render"
+STR = "str"
+WRITE = "write"
+
+
+@dataclass
+class DocMetrics:
+    """
+    Filled in by `parse_nodes`/`parse_stream` (split, parse, transform) and `render_batch` (lift, write).
+    `render`, `postprocess` and `str()` of HTMLNodes don't take metrics: callers time them by wrapping them in
+    `stage`, eg: `with metrics.stage(RENDER): html = render(lifted)`.
+    """
+
+    id: Hashable = None
+    times: dict[str, float] = field(default_factory=dict)
+    chunks: int = 0
+    plain_chunks: int = 0  # chunks which skipped p2
+    cached_chunks: int = 0  # chunks from the ChunkCache
+    p1_tokens: int = 0
+    p2_tokens: int = 0
+    nodes: int = 0  # parsed nodes, nested ones included
+    lifted_nodes: int = 0
+    input_bytes: int = 0
+    output_bytes: int = 0
+    cached: bool = False  # the HTML came from the RenderCache
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        self.times[stage] = self.times.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        t = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, perf_counter() - t)
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.times.values())
+
+    def add(self, other: "DocMetrics") -> None:
+        """
+        Add the times and counts of `other` to these
+        """
+        for stage, seconds in other.times.items():
+            self.add_time(stage, seconds)
+        self.chunks += other.chunks
+        self.plain_chunks += other.plain_chunks
+        self.cached_chunks += other.cached_chunks
+        self.p1_tokens += other.p1_tokens
+        self.p2_tokens += other.p2_tokens
+        self.nodes += other.nodes
+        self.lifted_nodes += other.lifted_nodes
+        self.input_bytes += other.input_bytes
+        self.output_bytes += other.output_bytes
+
+
+class Collector:
+    """
+    Receives the DocMetrics of each document: passed to `callback` (eg: to export them), and summed in `totals`
+    """
+
+    def __init__(self, callback: Callable[[DocMetrics], object] | None = None) -> None:
+        self.callback = callback
+        self.docs = 0
+        self.cached_docs = 0
+        self.totals = DocMetrics()
+
+    def record(self, metrics: DocMetrics) -> None:
+        self.docs += 1
+        self.cached_docs += metrics.cached
+        self.totals.add(metrics)
+        if self.callback is not None:
+            self.callback(metrics)
+
+
+_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+def count_nodes(value: object) -> int:
+    """
+    Number of nodes (dataclass instances, including HTMLNode and KV) in `value` and under it
+    """
+    count = 0
+    stack = [value]
+    while stack:
+        v = stack.pop()
+        if isinstance(v, list):
+            stack.extend(v)
+            continue
+        typ = type(v)
+        names = _FIELDS.get(typ)
+        if names is None:
+            names = _FIELDS[typ] = tuple(getattr(typ, "__dataclass_fields__", ()))
+        if names:
+            count += 1
+            stack.extend(getattr(v, name) for name in names)
+        elif hasattr(v, "children") and not isinstance(v, str):  # lark Tree
+            stack.extend(v.children)
+    return count
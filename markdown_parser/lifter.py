@@ -13,44 +13,65 @@ from typing import Type, TypeVar
 T = TypeVar("T")
 
 
-@dataclass
+def open_tag(tag: str, props: list[KV]) -> str:
+    """
+    `<tag props>`, or `<tag props/>` for self closing tags, which have no children nor closing tag
+    """
+    attrs = "".join(f' {prop.key}="{prop.val}"' for prop in props)
+    if tag in SELF_CLOSING_TAGS:
+        return f'<{tag}{attrs}/>'
+    return f'<{tag}{attrs}>'
+
+
+@dataclass(slots=True)
 class HTMLNode:
     tag: str
     children: list['HTMLNode'] = field(default_factory=list)
     props: list[KV] = field(default_factory=list)
+    span: Span | None = field(default=None, kw_only=True, compare=False, repr=False)
 
     @property
     def self_closing(self):
-        return self.tag in ['hr', 'img', 'link', 'br', 'input', 'source']
+        return self.tag in SELF_CLOSING_TAGS
 
     def __str__(self):
-        props = " ".join(f'{prop.key}="{prop.val}"' for prop in self.props)
-        if props:
-            props = " " + props
-        if self.self_closing:
-            return f'<{self.tag}{props}/>'
-        children = "".join(str(c) for c in self.children)
-        return f'<{self.tag}{props}>{children}</{self.tag}>'
+        # explicit stack, for deep trees: nodes to expand, and strings (closing tags, str() of other nodes)
+        parts: list[str] = []
+        stack: list[object] = [self]
+        while stack:
+            node = stack.pop()
+            if type(node).__str__ is not _html_str:
+                parts.append(str(node))
+            else:
+                parts.append(open_tag(node.tag, node.props))
+                if node.tag in SELF_CLOSING_TAGS:
+                    continue
+                stack.append(f"</{node.tag}>")
+                stack += reversed(node.children)
+        return "".join(parts)
 
 
-@dataclass
+_html_str = HTMLNode.__str__
+
+
+@dataclass(slots=True)
 class Paragraph(Node):
     children: list[Node]
 
 
-@dataclass
+@dataclass(slots=True)
 class QuoteBlock(Node):
     children: list["FullQuote"]
 
 
-@dataclass
+@dataclass(slots=True)
 class FullQuote(Node):
     content: list[Node]
     indent_level: int  # meta only
     children: list["FullQuote"]
 
 
-@dataclass
+@dataclass(slots=True)
 class FullListItem(Node):
     marker: UnorderedListIndicator | OrderedListIndicator
     content: list[Node]
@@ -58,27 +79,39 @@ class FullListItem(Node):
     children: list["FullListItem"]
 
 
-@dataclass
+@dataclass(slots=True)
 class List(Node):
     marker: UnorderedListIndicator | OrderedListIndicator
     children: list["FullListItem"]
 
 
+def span_of(first: Node | HTMLNode, last: Node | HTMLNode) -> Span | None:
+    """
+    The span from `first` to `last`, if both have one
+    """
+    start = getattr(first, "span", None)
+    end = getattr(last, "span", None)
+    if start is None or end is None:
+        return None
+    return Span(start.start, end.end)
+
+
 def pop(l: list[T]) -> T | None:
     if len(l):
         return l.pop(0)
     return None
 
 
-def match_until_delim(items: list[Node], must_match, delim) -> int | None:
+def match_until_delim(items: list[Node], must_match, delim, start: int = 0) -> int | None:
     """
-    Check whether `items` is composed of [must_match, must_match, must_match, .., delim].
+    Check whether `items[start:]` is composed of [must_match, must_match, must_match, .., delim].
     Return the number of matches, including `delim`.
 
     Returns None if the sequence does not match
     """
     matching = 0
-    for item in items:
+    for idx in range(start, len(items)):
+        item = items[idx]
         if isinstance(item, delim):
             return matching + 1
         elif isinstance(item, must_match):
@@ -88,10 +121,10 @@ def match_until_delim(items: list[Node], must_match, delim) -> int | None:
     return None
 
 
-def match_while(items: list[Node], must_match) -> int | None:
+def match_while(items: list[Node], must_match, start: int = 0) -> int:
     matching = 0
-    for item in items:
-        if isinstance(item, must_match):
+    for idx in range(start, len(items)):
+        if isinstance(items[idx], must_match):
             matching += 1
         else:
             return matching
@@ -115,17 +148,7 @@ def li_to_full(item: ListItem | OListItem, indent_level) -> FullListItem:
         ind = UnorderedListIndicator(item.marker)
     else:
         assert False, item
-    return FullListItem(ind, item.content, indent_level, [])
-
-
-def li_at_level(items: list[FullListItem], level: int) -> list[FullListItem]:
-    ret = []
-    for i in items:
-        if i.indent_level == level:
-            ret.append(i)
-        if i.indent_level < level:
-            ret.extend(li_at_level(i.children, level))
-    return ret
+    return FullListItem(ind, item.content, indent_level, [], span=item.span)
 
 
 def make_list(items: list[ListItem | OListItem]) -> List:
@@ -137,43 +160,37 @@ def make_list(items: list[ListItem | OListItem]) -> List:
         FullListItem(children=[FullListItem]),
         FullListItem(children=[]),
         ])
+    An item goes under the last item (in pre-order) one level up, or at the top if there's none.
     """
     rlist: List | None = None
     ret: list[FullListItem] = []
-    while item := pop(items):
+    # level -> last item at that level, in pre-order, and the index of its top-level item in `ret`
+    last: dict[int, tuple[FullListItem, int]] = {}
+    for item in items:
         indent_level = item.indentation // 4  # hardcoding 4 spaces?
         full = li_to_full(item, indent_level)
         if rlist is None:
             rlist = List(full.marker, [])
-            ret.append(full)
-            continue
 
-        mb_parents = li_at_level(ret, indent_level - 1)
-        if mb_parents:
-            last = mb_parents[-1]
-            last.children.append(full)
-        else:
+        mb_parent = last.get(indent_level - 1)
+        if mb_parent is None:
             # there's no parents only if all items are at the same level
             ret.append(full)
+            top = len(ret) - 1
+        else:
+            parent, top = mb_parent
+            parent.children.append(full)
+            prev = last.get(indent_level)
+            if prev is not None and prev[1] > top:
+                # a later top-level item at this level comes after `full` in pre-order
+                continue
+        last[indent_level] = (full, top)
 
     assert rlist is not None
     rlist.children = ret
     return rlist
 
 
-def find_q_parent(items: list[FullQuote], to_add: FullQuote) -> FullQuote | None:
-    candidates = [i for i in items if i.indent_level < to_add.indent_level]
-    if not candidates:
-        return None
-    last = candidates[-1]
-    if not last.children:
-        return last
-    mb_child_parent = find_q_parent(last.children, to_add)
-    if mb_child_parent:
-        return mb_child_parent
-    return last
-
-
 def make_quote(items: list[Quote]) -> QuoteBlock:
     """
     Convert a flat list of Quote, such as:
@@ -186,28 +203,22 @@ def make_quote(items: list[Quote]) -> QuoteBlock:
         FullQuote(content=[Text2])
         Text3,
     ])
+    A quote goes under the deepest one with a lower level on the path to the last quote.
     """
     flattened: list[FullQuote] = []
-    while item := pop(items):
-        fq = FullQuote(item.content, indent_level=item.level, children=[])
-        if not flattened:
-            flattened.append(fq)
-            continue
-        mb_parent = find_q_parent(flattened, fq)
-        if mb_parent:
-            mb_parent.children.append(fq)
+    path: list[FullQuote] = []  # from the top-level quote to the last one added, levels increasing
+    for item in items:
+        fq = FullQuote(item.content, indent_level=item.level, children=[], span=item.span)
+        while path and path[-1].indent_level >= fq.indent_level:
+            path.pop()
+        if path:
+            path[-1].children.append(fq)
         else:
-            assert len(flattened) == 1, flattened  # ehh idk
+            assert len(flattened) <= 1, flattened  # ehh idk
             flattened.append(fq)
+        path.append(fq)
 
-    return QuoteBlock(flattened)
-
-
-def idx_of_last_elem_by_type(items: list[Node], type_: Type | tuple[Type]) -> int | None:
-    for idx, item in list(enumerate(items))[::-1]:
-        if isinstance(item, type_):
-            return idx
-    return None
+    return QuoteBlock(flattened, span=span_of(items[0], items[-1]))
 
 
 BLOCKS = (Heading, CodeBlock, List, QuoteBlock, RefItem, Table, Hr, Metadata, Paragraph, RefBlock)
@@ -221,91 +232,124 @@ class LastWasBlock(BlockRes):
     ...
 class NotFound(BlockRes):
     ...
-@dataclass
+@dataclass(slots=True)
 class Found(BlockRes):
     idx: int
 
-def idx_of_last_block(items: list[Node]) -> BlockRes:
-    ret = -1
-    for idx, item in list(enumerate(items))[::-1]:
-        if is_block(item):
-            ret = idx+1
-            break
-    if is_block(items[-1]): # found a block, but it's the last entry
-        return LastWasBlock()
-    if ret > 0:
-        return Found(ret)
-    return NotFound()
+
+class LiftBuffer:
+    """
+    The output of `lift`, along with the positions of its blocks and html open tags,
+    so that finding the last one does not need to scan the output.
+    """
+    def __init__(self) -> None:
+        self.items: list[Node] = []
+        self.blocks: list[int] = []
+        self.open_tags: list[int] = []
+
+    def append(self, node: Node | HTMLNode) -> None:
+        if is_block(node):
+            self.blocks.append(len(self.items))
+        elif isinstance(node, HtmlOpenTag):
+            self.open_tags.append(len(self.items))
+        self.items.append(node)
+
+    def take_from(self, idx: int) -> list[Node]:
+        """
+        Remove and return items[idx:]
+        """
+        while self.blocks and self.blocks[-1] >= idx:
+            self.blocks.pop()
+        while self.open_tags and self.open_tags[-1] >= idx:
+            self.open_tags.pop()
+        taken = self.items[idx:]
+        del self.items[idx:]
+        return taken
+
+    def last_block(self) -> BlockRes:
+        if not self.blocks:
+            return NotFound()
+        idx = self.blocks[-1]
+        if idx == len(self.items) - 1:  # found a block, but it's the last entry
+            return LastWasBlock()
+        return Found(idx + 1)
+
+    def last_open_tag(self) -> int | None:
+        return self.open_tags[-1] if self.open_tags else None
+
 
 def lift(items: list[Node]) -> list[Node]:
-    ret: list[Node] = []
-    while node := pop(items):
+    ret = LiftBuffer()
+    i = 0
+    while i < len(items):
+        node = items[i]
+        i += 1
         match node:
             case ParBreak():
-                match idx_of_last_block(ret):
+                match ret.last_block():
                     case Found(idx):
-                        p = Paragraph(ret[idx:])
-                        ret = ret[:idx]
-                        ret.append(p)
+                        ret.append(paragraph(ret.take_from(idx)))
                     case NotFound():
-                        ret.append(ParBreak())
+                        ret.append(node)
             case Hr():
                 # Metadata must be at the start of the file
-                if ret:
+                if ret.items:
                     # normal rule
                     ret.append(node)
                     continue
 
-                num_match = match_until_delim(items, PlainText, Hr)
+                num_match = match_until_delim(items, PlainText, Hr, start=i)
                 if num_match is None:
                     # found something other than PlainText + Hr so this is not a meta block
                     ret.append(node)
                     continue
 
-                meta_kv = items[: num_match - 1]
-                ret.append(make_meta_from_lines(meta_kv))
-                items = items[num_match:]
+                meta_kv = items[i : i + num_match - 1]
+                meta = make_meta_from_lines(meta_kv)
+                meta.span = span_of(node, items[i + num_match - 1])
+                ret.append(meta)
+                i += num_match
             case ListBlock():
-                ret.append(make_list(node.children))
+                lst = make_list(node.children)
+                lst.span = node.span
+                ret.append(lst)
             case Quote():
-                num_match = match_while(items, Quote)
-                if num_match is None:
-                    continue
-                quotes = [node] + items[:num_match]
-                items = items[num_match:]
+                num_match = match_while(items, Quote, start=i)
+                quotes = [node] + items[i : i + num_match]
+                i += num_match
                 ret.append(make_quote(quotes))
             case HtmlCloseTag():
                 close_tag = node
                 # TODO this should ignore items that don't need closing: <source> or <image>
-                idx = idx_of_last_elem_by_type(ret, HtmlOpenTag)
+                idx = ret.last_open_tag()
                 assert idx is not None, f"No open tag to match {node}"
-                open_tag = ret[idx]
+                open_tag = ret.items[idx]
                 assert isinstance(open_tag, HtmlOpenTag)
                 assert (
                     open_tag.elem_type == close_tag.elem_type
                 ), f"Mismatched open & close tags: {open_tag.elem_type} - {close_tag.elem_type}"
-                children = ret[idx + 1 :]
-                ret = ret[:idx]
-                ret.append(HTMLNode(open_tag.elem_type, children, open_tag.props))
+                children = ret.take_from(idx)[1:]
+                ret.append(HTMLNode(open_tag.elem_type, children, open_tag.props, span=span_of(open_tag, close_tag)))
 
             case RefItem():
-                num_match = match_while(items, RefItem)
-                assert num_match is not None
-                refs = [node] + items[:num_match]
-                items = items[num_match:]
-                ret.append(RefBlock(refs))
+                num_match = match_while(items, RefItem, start=i)
+                refs = [node] + items[i : i + num_match]
+                i += num_match
+                ret.append(RefBlock(refs, span=span_of(refs[0], refs[-1])))
             case _:
                 ret.append(node)
 
     # final paragraph
-    match idx_of_last_block(ret):
+    match ret.last_block():
         case Found(idx):
-            p = Paragraph(ret[idx:])
-            ret = ret[:idx]
-            ret.append(p)
+            ret.append(paragraph(ret.take_from(idx)))
         case NotFound():
-            ret = [Paragraph(ret)]
-    return ret
+            return [paragraph(ret.items)]
+    return ret.items
+
+
+def paragraph(children: list[Node]) -> Paragraph:
+    return Paragraph(children, span=span_of(children[0], children[-1]) if children else None)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+# Bounds on the input of a parser, for untrusted documents: exceeding one fails fast with LimitExceeded
+
+from dataclasses import dataclass
+from time import perf_counter
+
+from markdown_parser.nodes import SELF_CLOSING_TAGS, HtmlCloseTag, HtmlOpenTag, ListItem, Node, OListItem, Quote
+
+
+class LimitExceeded(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Limits:
+    """
+    `max_chunk`: characters in a chunk (paragraph, code block), checked before parsing it.
+    `max_depth`: nesting of the parsed nodes, quote and list levels included, as well as html tags
+    (which `lift` nests across chunks).
+    `time_budget`: seconds to parse a document, checked between chunks (so `max_chunk` bounds the overrun).
+    """
+
+    max_chunk: int | None = None
+    max_depth: int | None = None
+    time_budget: float | None = None
+
+    def start(self) -> "Budget":
+        return Budget(self)
+
+
+class Budget:
+    """
+    The limits for one document
+    """
+
+    def __init__(self, limits: Limits) -> None:
+        self.limits = limits
+        self.chunks = 0
+        self.html_depth = 0  # html tags left open by the chunks so far
+        self.deadline = None if limits.time_budget is None else perf_counter() + limits.time_budget
+
+    def size(self, size: int) -> None:
+        max_chunk = self.limits.max_chunk
+        if max_chunk is not None and size > max_chunk:
+            raise LimitExceeded(f"Chunk of {size} characters, over max_chunk={max_chunk}")
+
+    def chunk(self, chunk_text: str) -> None:
+        """
+        Before parsing `chunk_text`
+        """
+        self.size(len(chunk_text))
+        if self.deadline is not None and perf_counter() > self.deadline:
+            raise LimitExceeded(f"Over time_budget={self.limits.time_budget}s, after {self.chunks} chunks")
+        self.chunks += 1
+
+    def nodes(self, nodes: list[Node]) -> None:
+        """
+        After parsing a chunk into `nodes`, in document order
+        """
+        max_depth = self.limits.max_depth
+        if max_depth is None:
+            return
+        depth = 0
+        for node in nodes:
+            if isinstance(node, HtmlCloseTag):
+                self.html_depth = max(self.html_depth - 1, 0)
+            depth = max(depth, self.html_depth + nesting_depth([node]))
+            if isinstance(node, HtmlOpenTag) and node.elem_type not in SELF_CLOSING_TAGS:
+                self.html_depth += 1
+        if depth > max_depth:
+            raise LimitExceeded(f"Nodes nested {depth} deep, over max_depth={max_depth}")
+
+
+def nesting_depth(nodes: list[Node]) -> int:
+    """
+    Depth of the node tree, counting the level of quotes and list items, which `lift` turns into nesting
+    """
+    deepest = 0
+    stack: list[tuple[object, int]] = [(n, 1) for n in nodes]
+    while stack:
+        v, depth = stack.pop()
+        if isinstance(v, list):
+            stack.extend((item, depth) for item in v)
+            continue
+        names = getattr(type(v), "__dataclass_fields__", None)
+        if names:
+            if isinstance(v, Quote):
+                depth += v.level
+            elif isinstance(v, (ListItem, OListItem)):
+                depth += v.indentation // 4
+            stack.extend((getattr(v, name), depth + 1) for name in names)
+        elif hasattr(v, "children") and not isinstance(v, str):  # lark Tree
+            stack.extend((c, depth + 1) for c in v.children)
+        else:
+            continue
+        deepest = max(deepest, depth)
+    return deepest
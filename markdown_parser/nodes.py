@@ -1,43 +1,52 @@
 import enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import NamedTuple
 
-@dataclass
+class Span(NamedTuple):
+    """
+    Where a node comes from: `text[start:end]` of the parsed document
+    """
+    start: int
+    end: int
+
+@dataclass(slots=True)
 class Node:
-    pass
+    # only set by parsers made with `spans=True`; not part of equality nor repr
+    span: Span | None = field(default=None, kw_only=True, compare=False, repr=False)
 
-@dataclass
+@dataclass(slots=True)
 class PlainText(Node):
     text: str
 
-@dataclass
+@dataclass(slots=True)
 class Bold(Node):
     content: list[Node]
 
-@dataclass
+@dataclass(slots=True)
 class Emphasis(Node):
     content: list[Node]
 
-@dataclass
+@dataclass(slots=True)
 class Anchor(Node):
     content: list[Node]
     href: str
 
-@dataclass
+@dataclass(slots=True)
 class Image(Node):
     alt: str | None
     url: str | None
 
-@dataclass
+@dataclass(slots=True)
 class Quote(Node):
     level: int
     content: list[Node]
 
-@dataclass
+@dataclass(slots=True)
 class CodeBlock(Node):
     identifier: str | None
     lines: list[str]
 
-@dataclass
+@dataclass(slots=True)
 class InlineCode(Node):
     text: str
 
@@ -46,137 +55,140 @@ class Alignment(enum.Enum):
     CENTER = enum.auto()
     RIGHT = enum.auto()
 
-@dataclass
+@dataclass(slots=True)
 class TableDivisor(Node):
     alignment: Alignment
 
-@dataclass
+@dataclass(slots=True)
 class TableCell(Node):
     content: list[Node]
 
-@dataclass
+@dataclass(slots=True)
 class TableRow(Node):
     cells: list[TableCell]
 
-@dataclass
+@dataclass(slots=True)
 class TableHeaderCell(Node):
     content: list[Node]
 
-@dataclass
+@dataclass(slots=True)
 class TableHeaderRow(Node):
     cells: list[TableHeaderCell]
 
-@dataclass
+@dataclass(slots=True)
 class Table(Node):
     header: TableHeaderRow
     divisors: list[TableDivisor]
     rows: list[TableRow]
 
-@dataclass
+@dataclass(slots=True)
 class UnorderedListIndicator(Node):
     marker: str
 
-@dataclass
+@dataclass(slots=True)
 class OrderedListIndicator(Node):
     num: int
 
-@dataclass
+@dataclass(slots=True)
 class ListItemIndicator(Node):
     indentation: int
     marker: UnorderedListIndicator | OrderedListIndicator
 
-@dataclass
+@dataclass(slots=True)
 class ListItem(Node):
     marker: str
     content: list[Node]
     indentation: int
 
-@dataclass
+@dataclass(slots=True)
 class OListItem(Node):
     index: int
     content: list[Node]
     indentation: int
 
-@dataclass
+@dataclass(slots=True)
 class ListBlock(Node):
     children: list[ListItem | OListItem]
 
 # Extensions
-@dataclass
+@dataclass(slots=True)
 class Ref(Node):
     text: str
 
-@dataclass
+@dataclass(slots=True)
 class RefItem(Node):
     ref: str
     text: list[Node]
 
-@dataclass
+@dataclass(slots=True)
 class RefBlock(Node):
     children: list[RefItem]
 
-@dataclass
+@dataclass(slots=True)
 class CustomDirective(Node):
     name: str
     arguments: list[str]
 
-@dataclass
+@dataclass(slots=True)
 class Popover(Node):
     hint: str
     content: str
 
-@dataclass
+@dataclass(slots=True)
 class KV:
     key: str
     val: str
 
-@dataclass
+# no children nor closing tag
+SELF_CLOSING_TAGS = ['hr', 'img', 'link', 'br', 'input', 'source']
+
+@dataclass(slots=True)
 class HtmlOpenTag(Node):
     elem_type: str
     props: list[KV]
 
-@dataclass
+@dataclass(slots=True)
 class HtmlCloseTag(Node):
     elem_type: str
 
-@dataclass
+@dataclass(slots=True)
 class HtmlSelfCloseTag(Node):
     elem_type: str
     props: list[KV]
 
-@dataclass
+@dataclass(slots=True)
 class Heading(Node):
     level: int
     content: list[Node]
 
-@dataclass
+@dataclass(slots=True)
 class Newline(Node):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class ParBreak(Node):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class Superscript(Node):
     content: list[Node]
 
-@dataclass
+@dataclass(slots=True)
 class Subscript(Node):
     content: list[Node]
 
-@dataclass
+@dataclass(slots=True)
 class Small(Node):
     content: list[Node]
 
-@dataclass
+@dataclass(slots=True)
 class Smaller(Node):
     content: list[Node]
 
-@dataclass
+@dataclass(slots=True)
 class Hr(Node):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class Metadata(Node):
     entries: list[KV]
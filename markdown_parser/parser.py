@@ -1,13 +1,30 @@
+import copy
+import hashlib
+import importlib
+import logging
+import os
+import re
+import threading
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, Iterable, Iterator
 import lark
-from markdown_parser.transformer import NodeTransformer
-from markdown_parser.nodes import ParBreak, Node
+from lark.grammar import Rule
+from lark.lexer import TerminalDef
+from markdown_parser.chunk_cache import ChunkCache
+from markdown_parser.instrument import PARSE, SPLIT, TRANSFORM, DocMetrics, count_nodes
+from markdown_parser.limits import Budget, Limits
+from markdown_parser.transformer import NodeTransformer, SpanTransformer
+from markdown_parser.nodes import ParBreak, Node, PlainText, Span
 
 grammar1 = r"""
 TEXT: /[^\n]+/
 LF: /\n/
 PAR_BREAK: LF LF+
 
-CODELINE: /(.|\n)+?(?=```)/
+CODELINE: /[\s\S]+?(?=```)/
 IDENTIFIER: /[A-Za-z]+/
 CODE_BLOCK: "```" [IDENTIFIER] LF CODELINE "```"
 
@@ -16,7 +33,10 @@ start: (CODE_BLOCK | TEXT | LF | PAR_BREAK)+
 grammar2 = r"""
 
 # string does not capture any symbols which may start an inline-tag
-STRING: /[^`*[_{<>\n\\!]/
+# it matches a whole run of characters which can't start another token after plain text
+# (`-` for `->` and `---`, `|` for table cells, `]` for anchors), falling back to one character at a time.
+# lowest priority, so that every other terminal allowed at a position is tried first
+STRING.-1: /[^`*[_{<>\n\\!|\]-]+|[^`*[_{<>\n\\!]/
 # string can't capture valid text which is not actually a tag, examples:
 # * some [text] which is not an anchor
 #  - still can't have [^text]
@@ -31,7 +51,8 @@ CUR_BR_WORD_NOT_DIRECTIVE: /{[^^\n]+?}/
 
 # NOT working
 # * some text with a | which is not a table
-PIPE_STRING: /[^|\n]+?(?=[|])/
+# stops at `}`: tried at every `{^`, it would scan the rest of the line for each directive
+PIPE_STRING: /[^|\n}]+(?=[|])/
 ARROW_R: "->"
 ARROW_L: "<-"
 
@@ -46,7 +67,7 @@ PAR_STRING: /[^)]+(?=[)])/
 # which forbids links-to-images: [![]()]()
 BR_STRING: /[^!^\]][^\]\n]*(?=])/
 CUR_BR_STRING: /[^}]+(?=})/
-COLON_STRING: /[^:\n]+?(?=:)/
+COLON_STRING: /[^:\n}]+(?=:)/
 
 superscript: "<sup>" (italic | star_bold | non_nestable_inlines)+ "</sup>"
 subscript: "<sub>"  (italic | star_bold | non_nestable_inlines)+ "</sub>"
@@ -138,7 +159,7 @@ plain_text.-2: (STRING | BR_WORD_NOT_ANCHOR | ESCAPED_CHAR | NON_IMAGE_BANG | CU
 # a code block
 # ```
 # code block > inline_pre (`)
-CODELINE: /(.|\n)+?(?=```)/
+CODELINE: /[\s\S]+?(?=```)/
 code: CODELINE
 identifier: /[A-Za-z]+/
 code_block.2: "```" [identifier] _LF (code) "```"
@@ -193,56 +214,531 @@ heading: HASH+ (non_nestable_inlines | star_bold | italic)+
 # &mdash; html entities
 """
 
+P1_OPTIONS = dict(parser='lalr', debug=True, lexer="contextual")
+P2_OPTIONS = dict(parser='lalr', debug=True, lexer="contextual", maybe_placeholders=True)
+
+
+# Set to compile the grammars at runtime instead of loading the pre-generated tables
+# (see `markdown_parser.build_tables`), eg: while editing the grammars.
+COMPILE_GRAMMAR = bool(os.environ.get("MARKDOWN_PARSER_COMPILE_GRAMMAR"))
+
+logger = logging.getLogger(__name__)
+
+
+def grammar_digest(grammar: str, options: dict) -> str:
+    """
+    Identifies the compiled tables of `grammar`: derived from the grammar text, the options and the lark version.
+    """
+    opts = ",".join(f"{k}={v!r}" for k, v in sorted(options.items()))
+    return hashlib.sha256(f"{lark.__version__}\0{opts}\0{grammar}".encode()).hexdigest()
+
+
+def cache_path(cache_dir: str, grammar: str, options: dict) -> str:
+    """
+    Path of the compiled-table cache for `grammar` in `cache_dir`.
+    Changing the grammar, the options or the lark version points to a new file, so stale entries are never loaded.
+    """
+    return os.path.join(cache_dir, f"markdown_parser-{grammar_digest(grammar, options)[:32]}.lark")
+
+
+def _load_generated(module_name: str, grammar: str, options: dict, **kwargs) -> lark.Lark | None:
+    try:
+        tables = importlib.import_module(f"markdown_parser.{module_name}")
+    except ImportError:
+        logger.warning("%s is missing, compiling grammar; run `python -m markdown_parser.build_tables`", module_name)
+        return None
+    if tables.DIGEST != grammar_digest(grammar, options):
+        logger.warning("%s is stale, compiling grammar; run `python -m markdown_parser.build_tables`", module_name)
+        return None
+    return lark.Lark._load_from_dict(tables.DATA, tables.MEMO, debug=options["debug"], **kwargs)
+
+
+def _make_lark(grammar: str, options: dict, cache_dir: str | None, **kwargs) -> lark.Lark:
+    if cache_dir is None:
+        return lark.Lark(grammar, **options, **kwargs)
+    os.makedirs(cache_dir, exist_ok=True)
+    return lark.Lark(grammar, **options, **kwargs, cache=cache_path(cache_dir, grammar, options))
+
+
+def _get_lark(module_name: str, grammar: str, options: dict, cache_dir: str | None, compile_grammar: bool, **kwargs) -> lark.Lark:
+    if not compile_grammar:
+        if p := _load_generated(module_name, grammar, options, **kwargs):
+            return p
+    return _make_lark(grammar, options, cache_dir, **kwargs)
+
+
+def _with_positions(p: lark.Lark) -> lark.Lark:
+    """
+    The same parser as `p`, building trees with positions instead of applying its transformer
+    """
+    data, memo = p.memo_serialize([TerminalDef, Rule])
+    return lark.Lark._load_from_dict(data, memo, transformer=None, propagate_positions=True)
+
+
+def build_scanners(p: lark.Lark) -> None:
+    """
+    Build the regexes of every lexer of `p` now rather than on first use, after which lexing only reads them
+    """
+    lexer = p.parser.lexer
+    for sub in getattr(lexer, "lexers", {}).values():
+        sub.scanner
+    if (root := getattr(lexer, "root_lexer", None)) is not None:
+        root.scanner
+
+
+class _TimedTransformer:
+    """
+    Calls the methods of `transformer`, adding the time spent in them to `counts.transform_time`.
+    Given to lark as the transformer, which looks the callbacks up by name.
+    """
+
+    def __init__(self, transformer: lark.Transformer, counts: threading.local) -> None:
+        self._transformer = transformer
+        self._counts = counts
+
+    def __getattr__(self, name: str) -> Callable:
+        f = getattr(self._transformer, name)  # an AttributeError makes lark build a Tree
+        counts = self._counts
+
+        def timed(*args):
+            t = perf_counter()
+            try:
+                return f(*args)
+            finally:
+                counts.transform_time += perf_counter() - t
+        # lark calls methods decorated with `v_args` through it
+        timed.visit_wrapper = getattr(f, "visit_wrapper", None)  # type: ignore[attr-defined]
+        return timed
+
+
+class _Instrumented:
+    """
+    The same parser as `p`, counting the tokens it lexes and the time spent in its transformer.
+    The counts are per thread, so it can be shared between threads.
+    """
+
+    def __init__(self, p: lark.Lark) -> None:
+        self._counts = threading.local()  # tokens, transform_time
+        data, memo = p.memo_serialize([TerminalDef, Rule])
+        lexer_callbacks = {t.name: self._count for t in p.terminals}
+        transformer = _TimedTransformer(p.options.transformer, self._counts)
+        self.p = lark.Lark._load_from_dict(data, memo, transformer=transformer, lexer_callbacks=lexer_callbacks)
+        build_scanners(self.p)  # so threads only read them
+
+    def _count(self, token: lark.Token) -> lark.Token:
+        self._counts.tokens += 1
+        return token
+
+    def parse(self, chunk_text: str, metrics: DocMetrics) -> list[Node]:
+        counts = self._counts
+        counts.tokens = 0
+        counts.transform_time = 0.0
+        t = perf_counter()
+        try:
+            return _as_nodes(self.p.parse(chunk_text))
+        finally:
+            metrics.add_time(PARSE, perf_counter() - t - counts.transform_time)
+            metrics.add_time(TRANSFORM, counts.transform_time)
+            metrics.p2_tokens += counts.tokens
+
+
+# A chunk is only PlainText (one per line) if it has nothing that may start another construct in grammar2
+# (nor `](`, which p2 rejects outside of an anchor)
+INLINE_MARKUP = re.compile(r"[`*_\[{<>!#|\\]|---|\]\(")
+# lists (LEADING_SPACE_LI) and html (SPACES) may only start a chunk
+BLOCK_START = re.compile(r" |\s*(\d+[.]|[*+-]) ")
+
+
+def is_plain(chunk_text: str) -> bool:
+    return not INLINE_MARKUP.search(chunk_text) and not BLOCK_START.match(chunk_text)
+
+
+# Code block tracking for `parse_stream`, following CODE_BLOCK in grammar1: a line
+# with "```" [IDENTIFIER] opens a block, the next "```" closes it, after at least one character of code.
+# An unclosed fence is TEXT for p1; the stream just never finds a boundary after it
+FENCE_OPEN = re.compile(r"```[A-Za-z]*")
+NO_FENCE = -1
+
+
+def next_fence_state(line: str, fence: int) -> int:
+    """
+    `fence` is NO_FENCE outside of a code block, or the index in `line` from which it may be closed.
+    Returns the state for the line after `line`.
+    """
+    body = line.removesuffix("\n")
+    pos = 0
+    if fence != NO_FENCE:
+        idx = body.find("```", fence)
+        if idx == -1:
+            return 0
+        pos = idx + 3
+    if FENCE_OPEN.fullmatch(body, pos) and line.endswith("\n"):
+        return 1
+    return NO_FENCE
+
+
+def _join_chunk(tokens: list[lark.Token]) -> tuple[int, int, str]:
+    return tokens[0].start_pos, tokens[-1].end_pos, "\n".join(t.value for t in tokens)
+
+
+def _offset_map(tokens: list[lark.Token], offset: int) -> Callable[[int], int]:
+    """
+    Maps an offset in the chunk joined by `_join_chunk` to the document.
+    The chunk is usually a slice of the text, but a code block can be directly followed by text, without a LF.
+    """
+    start = tokens[0].start_pos
+    if tokens[-1].end_pos - start == sum(len(t) for t in tokens) + len(tokens) - 1:
+        return lambda pos: pos + start + offset
+    chunk_starts: list[int] = []
+    pos = 0
+    for t in tokens:
+        chunk_starts.append(pos)
+        pos += len(t) + 1
+
+    def to_doc(pos: int) -> int:
+        idx = bisect_right(chunk_starts, pos) - 1
+        return tokens[idx].start_pos + pos - chunk_starts[idx] + offset
+    return to_doc
+
+
+def _as_nodes(res: lark.Tree | list[Node] | Node) -> list[Node]:
+    if isinstance(res, lark.Tree):
+        return res.children
+    elif isinstance(res, list):
+        return res
+    # single-item parsing
+    return [res]
+
+
+@dataclass
+class ParseStats:
+    chunks: int = 0
+    plain_chunks: int = 0  # chunks which skipped p2 (fast path)
+
+
 class DoubleParser:
-    def __init__(self) -> None:
-        self.p1 = lark.Lark(grammar1, parser='lalr', debug=True, lexer="contextual")
-        self.p2 = lark.Lark(grammar2, parser='lalr', debug=True, lexer="contextual", transformer=NodeTransformer(), maybe_placeholders=True)
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        compile_grammar: bool = COMPILE_GRAMMAR,
+        workers: int = 0,
+        chunk_cache: ChunkCache | None = None,
+        spans: bool = False,
+        limits: Limits | None = None,
+    ) -> None:
+        """
+        By default the LALR tables are loaded from the modules generated by `markdown_parser.build_tables`.
+        `compile_grammar`: ignore the generated modules and build the tables from the grammars.
+        `cache_dir`: if set, tables built from the grammars are stored in (and loaded from) this directory,
+        so only the first process to start pays for grammar analysis.
+        `workers`: if set, chunks are parsed in a pool of this many processes; see `close()`.
+        `chunk_cache`: if set, parsed chunks are memoized, so repeated (or re-parsed) paragraphs skip p2.
+        `spans`: set the `span` of the nodes from `parse_nodes`/`parse_stream` (not `parse_chunk`),
+        at the cost of building a parse tree; can't be combined with `workers` nor `chunk_cache`.
+        `limits`: bounds on each document given to `parse_nodes`/`parse_stream`, for untrusted input.
+        """
+        if spans and (workers or chunk_cache is not None):
+            raise ValueError("spans can't be used with workers nor chunk_cache")
+        self.p1 = _get_lark("_grammar1_tables", grammar1, P1_OPTIONS, cache_dir, compile_grammar)
+        self.p2 = _get_lark("_grammar2_tables", grammar2, P2_OPTIONS, cache_dir, compile_grammar, transformer=NodeTransformer())
+        self.spans = spans
+        self.limits = limits
+        self.p2_spans = _with_positions(self.p2) if spans else None
+        self._p2_instrumented: _Instrumented | None = None
+        self._forked_from: DoubleParser | None = None
+        self._lock = threading.Lock()
+        self.stats = ParseStats()
+        self.chunk_cache = chunk_cache
+        self.workers = workers
+        self._worker_args = (cache_dir, compile_grammar)
+        self._pool: ProcessPoolExecutor | None = None
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "DoubleParser":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def fork(self) -> "DoubleParser":
+        """
+        A parser sharing the lark parsers (the instrumented one too, whenever it's built), chunk cache and pool
+        of this one, with its own stats: one per thread to parse from several at once
+        (see `markdown_parser.shared`). Don't close it.
+        """
+        ret = copy.copy(self)
+        ret.stats = ParseStats()
+        ret._forked_from = self if self._forked_from is None else self._forked_from
+        return ret
 
-    def parse(self, text: str) -> Node | list[Node]:
-        ret: list[Node] = []
+    def instrumented(self) -> _Instrumented:
+        """
+        The copy of p2 used to collect metrics, built on first use (by any fork)
+        """
+        if (ret := self._p2_instrumented) is not None:
+            return ret
+        if self._forked_from is not None:
+            ret = self._p2_instrumented = self._forked_from.instrumented()
+            return ret
+        with self._lock:
+            if (ret := self._p2_instrumented) is None:
+                ret = self._p2_instrumented = _Instrumented(self.p2)
+        return ret
+
+    def pool(self) -> ProcessPoolExecutor:
+        """
+        The pool of `workers` processes, started on first use
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=self._worker_args)
+        return self._pool
+
+    def split(self, text: str) -> list[str | ParBreak]:
+        """
+        Split `text` into chunks, which can be parsed independently by `parse_chunk`, and the ParBreaks between them.
+        """
+        return [piece for _, _, piece in self.split_spans(text)]
+
+    def split_spans(self, text: str) -> list[tuple[int, int, str | ParBreak]]:
+        """
+        Like `split`, along with the (start, end) offsets of each piece in `text`.
+        """
+        return [
+            (piece.start_pos, piece.end_pos, ParBreak()) if isinstance(piece, lark.Token) else _join_chunk(piece)
+            for piece in self._split_tokens(text)
+        ]
+
+    def _split_tokens(self, text: str) -> list[list[lark.Token] | lark.Token]:
+        """
+        The p1 tokens of each chunk, and the PAR_BREAK tokens between them
+        """
+        ret: list[list[lark.Token] | lark.Token] = []
         chunks = self.p1.parse(text).children
-        cur_chunk: list[str] = []
+        cur_chunk: list[lark.Token] = []
         for chunk in chunks:
             assert isinstance(chunk, lark.Token), chunk
             if chunk.type == "PAR_BREAK":
                 if cur_chunk:
-                    chunk_text = "\n".join(cur_chunk)
-                    # print("#" * 50, "\n", chunk_text)
-                    res = self.p2.parse(chunk_text)
-                    if isinstance(res, lark.Tree):
-                        ret.extend(res.children)
-                    elif isinstance(res, list):
-                        ret.extend(res)
-                    else:
-                        # single-item parsing
-                        ret.append(res)
+                    ret.append(cur_chunk)
                     cur_chunk = []
-                ret.append(ParBreak())
+                ret.append(chunk)
                 continue
             if chunk.type == "LF":
                 continue
-            cur_chunk.append(chunk.value)
+            cur_chunk.append(chunk)
 
         if cur_chunk:
-            chunk_text = "\n".join(cur_chunk)
-            # print(chunk_text)
-            res = self.p2.parse(chunk_text)
-            if isinstance(res, lark.Tree):
-                ret.extend(res.children)
-            elif isinstance(res, list):
-                ret.extend(res)
+            ret.append(cur_chunk)
+        return ret
+
+    def parse_chunk(self, chunk_text: str, metrics: DocMetrics | None = None) -> list[Node]:
+        """
+        `metrics`: if set, the chunk is parsed with the instrumented p2, and its counts and times are added to it
+        """
+        self.stats.chunks += 1
+        if metrics is not None:
+            metrics.chunks += 1
+        if is_plain(chunk_text):
+            self.stats.plain_chunks += 1
+            if metrics is not None:
+                metrics.plain_chunks += 1
+            return [PlainText(line) for line in chunk_text.split("\n")]
+
+        if self.chunk_cache is not None and (nodes := self.chunk_cache.get(chunk_text)) is not None:
+            if metrics is not None:
+                metrics.cached_chunks += 1
+            return nodes
+        if metrics is None:
+            nodes = self._parse_inline(chunk_text)
+        else:
+            nodes = self.instrumented().parse(chunk_text, metrics)
+        if self.chunk_cache is not None:
+            self.chunk_cache.put(chunk_text, nodes)
+        return nodes
+
+    def _parse_chunk_checked(self, chunk_text: str, budget: Budget | None, metrics: DocMetrics | None = None) -> list[Node]:
+        if budget is None:
+            return self.parse_chunk(chunk_text, metrics)
+        budget.chunk(chunk_text)
+        nodes = self.parse_chunk(chunk_text, metrics)
+        budget.nodes(nodes)
+        return nodes
+
+    def _parse_inline(self, chunk_text: str) -> list[Node]:
+        return _as_nodes(self.p2.parse(chunk_text))
+
+    def _parse_chunk_spans(self, tokens: list[lark.Token], offset: int, budget: Budget | None) -> list[Node]:
+        assert self.p2_spans is not None
+        _, _, chunk_text = _join_chunk(tokens)
+        if budget is not None:
+            budget.chunk(chunk_text)
+        to_doc = _offset_map(tokens, offset)
+        self.stats.chunks += 1
+        if is_plain(chunk_text):
+            self.stats.plain_chunks += 1
+            ret: list[Node] = []
+            pos = 0
+            for line in chunk_text.split("\n"):
+                ret.append(PlainText(line, span=Span(to_doc(pos), to_doc(pos + len(line)))))
+                pos += len(line) + 1
+            return ret
+        tree = self.p2_spans.parse(chunk_text)
+        nodes = _as_nodes(SpanTransformer(to_doc).transform(tree))
+        if budget is not None:
+            budget.nodes(nodes)
+        return nodes
+
+    def _parse_nodes_spans(self, text: str, offset: int, budget: Budget | None) -> list[Node]:
+        ret: list[Node] = []
+        for piece in self._split_tokens(text):
+            if isinstance(piece, lark.Token):
+                ret.append(ParBreak(span=Span(piece.start_pos + offset, piece.end_pos + offset)))
+            else:
+                ret.extend(self._parse_chunk_spans(piece, offset, budget))
+        return ret
+
+    def _split_metered(self, text: str, metrics: DocMetrics) -> list[str | ParBreak]:
+        """
+        `split`, adding its time and counts to `metrics`
+        """
+        metrics.input_bytes += len(text.encode())
+        t = perf_counter()
+        pieces = self._split_tokens(text)
+        metrics.add_time(SPLIT, perf_counter() - t)
+        metrics.p1_tokens += sum(1 if isinstance(piece, lark.Token) else len(piece) for piece in pieces)
+        return [ParBreak() if isinstance(piece, lark.Token) else _join_chunk(piece)[2] for piece in pieces]
+
+    def _needs_p2(self, piece: str | ParBreak) -> bool:
+        if isinstance(piece, ParBreak) or is_plain(piece):
+            return False
+        return self.chunk_cache is None or piece not in self.chunk_cache
+
+    def _parse_parallel(self, pieces: list[str | ParBreak], budget: Budget | None) -> list[list[Node]]:
+        # plain and cached chunks are cheaper to build here than to send to a worker
+        remote = [self._needs_p2(p) for p in pieces]
+        todo = [p for p, r in zip(pieces, remote) if r]
+        if len(todo) < 2:
+            return [[p] if isinstance(p, ParBreak) else self._parse_chunk_checked(p, budget) for p in pieces]
+        if budget is not None:
+            for p in todo:
+                budget.size(len(p))
+
+        chunksize = max(1, len(todo) // (self.workers * 4))
+        parsed = iter(self.pool().map(_parse_chunk_in_worker, todo, chunksize=chunksize))
+
+        ret: list[list[Node]] = []
+        for p, r in zip(pieces, remote):
+            if isinstance(p, ParBreak):
+                ret.append([p])
+            elif not r:
+                ret.append(self._parse_chunk_checked(p, budget))
             else:
-                # single-item parsing
-                ret.append(res)
-            cur_chunk = []
+                self.stats.chunks += 1
+                if budget is not None:
+                    budget.chunk(p)
+                nodes = next(parsed)
+                if budget is not None:
+                    budget.nodes(nodes)
+                if self.chunk_cache is not None:
+                    self.chunk_cache.put(p, nodes)
+                ret.append(nodes)
+        return ret
 
+    def parse_nodes(self, text: str, offset: int = 0, metrics: DocMetrics | None = None) -> list[Node]:
+        """
+        `offset`: position of `text` in the document, added to the spans
+        `metrics`: if set, the time spent in each stage and the counts are added to it;
+        the chunks are then parsed in this process, and it can't be combined with spans.
+        Raises LimitExceeded if `text` goes over the parser's `limits`.
+        """
+        budget = None if self.limits is None else self.limits.start()
+        return self._parse_nodes(text, offset, metrics, budget)
+
+    def _parse_nodes(self, text: str, offset: int, metrics: DocMetrics | None, budget: Budget | None) -> list[Node]:
+        if self.spans:
+            assert metrics is None, "metrics can't be used with spans"
+            return self._parse_nodes_spans(text, offset, budget)
+        if metrics is None:
+            pieces = self.split(text)
+        else:
+            pieces = self._split_metered(text, metrics)
+        if self.workers and metrics is None:
+            parsed = self._parse_parallel(pieces, budget)
+        else:
+            parsed = [[p] if isinstance(p, ParBreak) else self._parse_chunk_checked(p, budget, metrics) for p in pieces]
+        ret = [node for nodes in parsed for node in nodes]
+        if metrics is not None:
+            metrics.nodes += count_nodes(ret)
+        return ret
+
+    def parse(self, text: str) -> Node | list[Node]:
+        ret = self.parse_nodes(text)
         # ugh, compat with parse()
         if len(ret) == 1:
             return ret[0]
         return ret
 
-def make_parser() -> DoubleParser:
-    return DoubleParser()
+    def parse_stream(self, lines: Iterable[str], metrics: DocMetrics | None = None) -> Iterator[Node]:
+        """
+        Parse lines (with their line endings, as read from a file), yielding the nodes of each paragraph
+        as soon as it's complete; gives the same nodes as `parse_nodes` on the whole text.
+        Only the current paragraph (or code block) is kept in memory.
+        `metrics`: see `parse_nodes`
+        The `limits` apply to the whole stream; a paragraph over `max_chunk` fails before it's read entirely.
+        """
+        budget = None if self.limits is None else self.limits.start()
+        buf: list[str] = []
+        size = 0  # of the current paragraph, without blank lines
+        has_text = False
+        fence = NO_FENCE
+        offset = 0
+        for line in lines:
+            blank = line == "\n"
+            # a blank line outside of a code block is a PAR_BREAK, what follows parses independently
+            if not blank and has_text and buf[-1] == "\n" and fence == NO_FENCE:
+                text = "".join(buf)
+                yield from self._parse_nodes(text, offset, metrics, budget)
+                offset += len(text)
+                buf = []
+                size = 0
+                has_text = False
+            buf.append(line)
+            has_text = has_text or not blank
+            fence = next_fence_state(line, fence)
+            if budget is not None and not blank:
+                size += len(line)
+                budget.size(size - 1)
+
+        if buf:
+            yield from self._parse_nodes("".join(buf), offset, metrics, budget)
+
+
+_worker_parser: DoubleParser | None = None
+
+
+def _init_worker(cache_dir: str | None, compile_grammar: bool) -> None:
+    global _worker_parser
+    _worker_parser = DoubleParser(cache_dir, compile_grammar)
+
+
+def _parse_chunk_in_worker(chunk_text: str) -> list[Node]:
+    assert _worker_parser is not None
+    return _worker_parser.parse_chunk(chunk_text)
+
+
+def make_parser(
+    cache_dir: str | None = None,
+    compile_grammar: bool = COMPILE_GRAMMAR,
+    workers: int = 0,
+    chunk_cache: ChunkCache | None = None,
+    spans: bool = False,
+    limits: Limits | None = None,
+) -> DoubleParser:
+    return DoubleParser(cache_dir, compile_grammar, workers, chunk_cache, spans, limits)
 
 if __name__ == "__main__":
     parser = make_parser()
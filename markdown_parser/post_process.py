@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from typing import TypeVar
-from markdown_parser.lifter import pop, lift, HTMLNode
+from markdown_parser.lifter import lift, HTMLNode
 from markdown_parser.nodes import Node, Heading, KV
 from markdown_parser.renderer import render
 from markdown_parser.parser import make_parser
-from markdown_parser.processor import Processor
+from markdown_parser.processor import Processor, Registry, group_by_type
 
 # HTML level can add attributes such as `id` for anchors/headings
 # but HTML level loses certain abstractions -- the RefBlock is just hr div ol li li ..
@@ -20,7 +20,7 @@ from markdown_parser.processor import Processor
 T = TypeVar("T", bound=Node)
 U = TypeVar("U", bound=Node)
 
-@dataclass
+@dataclass(slots=True)
 class HeadingAnchor(Node):
     heading: Heading
 
@@ -42,17 +42,12 @@ class InsertHeadingAnchors(Processor[Heading, HeadingAnchor]):
 
 
 def postprocess(items: list[Node], rules: list[Processor]) -> list[HTMLNode]:
+    by_type = Registry(group_by_type(rules, "process_type"))
     ret = []
-    while item := pop(items):
-        matched = False
-        for r in rules:
-            if not isinstance(item, r.process_type):
-                continue
+    for item in items:
+        for r in by_type.get(type(item)) or ():
             ret.extend(r.transform(item))
-            matched = True
-        if not matched:
-            pass
-            # ret.append(item)
+        # unmatched items are dropped
     return ret
 
 
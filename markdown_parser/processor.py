@@ -5,6 +5,8 @@ from markdown_parser.lifter import HTMLNode
 
 T = TypeVar("T", bound=Node)
 U = TypeVar("U", bound=Node)
+H = TypeVar("H")
+
 @dataclass
 class Processor(Generic[T, U]):
     item_type: Type[T]
@@ -16,3 +18,38 @@ class Processor(Generic[T, U]):
     def render(node: U) -> list[HTMLNode]:
         ...
 
+
+class Registry(Generic[H]):
+    """
+    Handlers indexed by node type. A type without its own handler uses the one of its closest
+    base class (following the MRO); lookups are remembered, so each type is resolved once.
+    """
+
+    def __init__(self, handlers: dict[type, H]) -> None:
+        self.handlers = handlers
+        self._resolved: dict[type, H | None] = {}
+
+    def get(self, typ: type) -> H | None:
+        try:
+            return self._resolved[typ]
+        except KeyError:
+            pass
+        handler = next((self.handlers[t] for t in typ.__mro__ if t in self.handlers), None)
+        self._resolved[typ] = handler
+        return handler
+
+    def override(self, handlers: dict[type, H]) -> "Registry[H]":
+        """
+        A new registry where `handlers` replace the existing ones for the same types
+        """
+        return Registry(self.handlers | handlers)
+
+
+def group_by_type(processors: list[Processor], attr: str) -> dict[type, list[Processor]]:
+    """
+    `processors` by the node type in their `attr` (`process_type` or `render_type`), keeping their order
+    """
+    ret: dict[type, list[Processor]] = {}
+    for p in processors:
+        ret.setdefault(getattr(p, attr), []).append(p)
+    return ret
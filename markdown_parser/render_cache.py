@@ -0,0 +1,194 @@
+# On-disk cache of rendered documents, for site builds where most files don't change between runs
+#
+# Entries are content-addressed: the key covers the input text, the grammars (and lark version)
+# and the enabled extensions, so an entry never goes stale, it's just not looked up anymore.
+# Several processes can share a directory: entries are written to a temporary file and renamed
+# into place, and an entry removed by another process is just a miss.
+# The cache never fails a render: an entry which can't be read (permissions, corruption) is a miss, and one which
+# can't be written (permissions, full disk) is not stored; both are logged and counted in `stats.errors`.
+
+import hashlib
+import logging
+import os
+import tempfile
+from io import StringIO
+
+from markdown_parser.chunk_cache import CacheStats
+from markdown_parser.lifter import lift
+from markdown_parser.nodes import Node
+from markdown_parser.parser import P1_OPTIONS, P2_OPTIONS, DoubleParser, grammar1, grammar2, grammar_digest
+from markdown_parser.processor import Processor
+from markdown_parser.renderer import write_html
+from markdown_parser import serialize
+
+# Bump when the HTML for the same nodes changes (renderer, lifter)
+FORMAT_VERSION = 1
+GRAMMAR_VERSION = grammar_digest(grammar1, P1_OPTIONS) + grammar_digest(grammar2, P2_OPTIONS)
+
+HTML_SUFFIX = ".html"
+AST_SUFFIX = ".ast"
+TMP_PREFIX = ".tmp-"
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(text: str, ext: list[Processor] | None = None) -> str:
+    """
+    Extensions are identified by their class, so their output must only depend on it
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{FORMAT_VERSION}\0{GRAMMAR_VERSION}\0{serialize.HEADER.hex()}\0".encode())
+    for e in ext or []:
+        h.update(f"{type(e).__module__}.{type(e).__qualname__}\0".encode())
+    h.update(b"\0")
+    h.update(text.encode())
+    return h.hexdigest()
+
+
+class RenderCache:
+    """
+    HTML (and optionally the lifted nodes, see `serialize`) of rendered documents, in `directory`.
+    Once the entries take more than `max_bytes`, the least recently used ones are removed.
+    """
+
+    def __init__(self, directory: str, max_bytes: int | None = 1 << 30, store_ast: bool = False) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.store_ast = store_ast
+        self.stats = CacheStats()
+        # estimate of the size of `directory`, refreshed on eviction; other processes also write to it
+        self._size: int | None = None
+
+    def path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def get(self, key: str) -> str | None:
+        path = self.path(key, HTML_SUFFIX)
+        try:
+            with open(path, "rb") as fd:
+                html = fd.read().decode()
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        except (OSError, UnicodeDecodeError) as e:
+            self._error("reading", path, e)
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self._touch(path)
+        return html
+
+    def get_ast(self, key: str) -> list[Node] | None:
+        path = self.path(key, AST_SUFFIX)
+        try:
+            with open(path, "rb") as fd:
+                blob = fd.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self._error("reading", path, e)
+            return None
+        self._touch(path)
+        return serialize.decode(blob)  # type: ignore[return-value]
+
+    def put(self, key: str, html: str, ast: list[Node] | None = None) -> None:
+        try:
+            self._put(key, html, ast)
+        except OSError as e:
+            self._error("writing", self.path(key, HTML_SUFFIX), e)
+
+    def _put(self, key: str, html: str, ast: list[Node] | None) -> None:
+        written = self._write(self.path(key, HTML_SUFFIX), html.encode())
+        if ast is not None:
+            written += self._write(self.path(key, AST_SUFFIX), serialize.encode(ast))
+        if self.max_bytes is None:
+            return
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += written
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def render(self, parser: DoubleParser, text: str, ext: list[Processor] | None = None) -> str:
+        """
+        The HTML of `text`, from the cache, or parsed, lifted and rendered (and then stored)
+        """
+        key = cache_key(text, ext)
+        if (html := self.get(key)) is not None:
+            return html
+        lifted = lift(parser.parse_nodes(text))
+        out = StringIO()
+        write_html(lifted, out, ext)
+        html = out.getvalue()
+        self.put(key, html, lifted if self.store_ast else None)
+        return html
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries, down to 90% of `max_bytes`
+        """
+        assert self.max_bytes is not None
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes * 0.9:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass  # evicted by another process
+            total -= size
+            self.stats.evictions += 1
+        self._size = total
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """
+        (last use, size, path) of every file in the cache, including temporary ones
+        """
+        ret = []
+        try:
+            subdirs = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return ret
+        for subdir in subdirs:
+            if not subdir.is_dir():
+                continue
+            for entry in os.scandir(subdir.path):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                ret.append((st.st_mtime, st.st_size, entry.path))
+        return ret
+
+    def _write(self, path: str, data: bytes) -> int:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=TMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except FileNotFoundError:
+            # the temporary file was evicted by another process, the entry is just not stored
+            return 0
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        return len(data)
+
+    def _error(self, action: str, path: str, e: Exception) -> None:
+        self.stats.errors += 1
+        logger.warning("render cache: %s %s failed: %s", action, path, e)
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        # the modification time is the last use, for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # removed by another process, or read-only: only the eviction order is affected
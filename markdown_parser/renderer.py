@@ -1,16 +1,18 @@
-from functools import partial
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator, TextIO
 from markdown_parser.nodes import *
 from markdown_parser.parser import make_parser
-from markdown_parser.lifter import lift, pop, QuoteBlock, FullQuote, Paragraph, HTMLNode, List, FullListItem, RefBlock
+from markdown_parser.lifter import lift, open_tag, QuoteBlock, FullQuote, Paragraph, HTMLNode, List, FullListItem, RefBlock
 from typing import TypeVar
 
-from markdown_parser.processor import Processor
+from markdown_parser.processor import Processor, Registry, group_by_type
 
 T = TypeVar('T')
 U = TypeVar('U')
+H = TypeVar('H')
 
-@dataclass
+@dataclass(slots=True)
 class TextHTMLNode(HTMLNode):
     text: str = ""
 
@@ -22,141 +24,525 @@ def interleave_1(items: list[T], to_add: U) -> list[T | U]:
     flattened = [i for item in interleaved for i in item][1:]  # remove leading to_add
     return flattened
 
-def render(items: Node | list[Node], ext: list[Processor] | None = None) -> list[HTMLNode]:
-    return _render(items, {}, ext or [])
-
-def _render(items: Node | list[Node], ref_map: dict[str, int], ext: list[Processor]) -> list[HTMLNode]:
-    __render = partial(_render, ref_map=ref_map, ext=ext)
-
-    ret: list[HTMLNode] = []
-    if isinstance(items, Node):
-        items = [items]
-
-    while item := pop(items):
-        match item:
-            case Metadata():
-                pass
-            case Hr():
-                ret.append(HTMLNode('hr'))
-            case HtmlSelfCloseTag():
-                node = HTMLNode(item.elem_type, [], item.props)
-                assert node.self_closing
-                ret.append(node)
-            case Heading():
-                tag_name = "h" + str(item.level)
-                ret.append(HTMLNode(tag_name, __render(item.content)))
-            case CodeBlock():
-                ret.append(HTMLNode("pre", [HTMLNode("code", [TextHTMLNode(tag="", text='\n'.join(item.lines))])]))
-            case Image():
-                if item.url is None:
-                    continue
-                props = [KV("src", item.url)]
-                if item.alt:
-                    props.append(KV("alt", item.alt))
-                ret.append(HTMLNode("img", [], props))
-            case Anchor():
-                ret.append(HTMLNode("a", __render(item.content), [KV("href", item.href)]))
-            case InlineCode():
-                ret.append(HTMLNode("code", [item.text]))
-            case ParBreak():
-                ret.append(HTMLNode("br"))
-            case Paragraph():
-                ret.append(HTMLNode("p", __render(item.children)))
-            case PlainText():
-                ret.append(TextHTMLNode(tag="", text=item.text))
-            case Bold():
-                ret.append(HTMLNode("b", __render(item.content)))
-            case Emphasis():
-                ret.append(HTMLNode("em", __render(item.content)))
-            case FullQuote():
-                ret.extend(__render(item.content))
-                if item.children:
-                    ret.append(HTMLNode("blockquote", __render(interleave_1(item.children, ParBreak()))))
-            case QuoteBlock():
-                ret.append(HTMLNode("blockquote", __render(item.children)))
-            case HTMLNode():
-                ret.append(HTMLNode(item.tag, __render(item.children), item.props))
-            case List():
-                props = []
-                tag = ""
-                match item.marker:
-                    case UnorderedListIndicator():
-                        tag = "ul"
-                    case OrderedListIndicator():
-                        tag = "ol"
-                        if item.marker.num > 1:
-                            props = [KV("start", str(item.marker.num))]
-                ret.append(HTMLNode(tag, __render(item.children), props))
-            case FullListItem():
-                tag = "li"
-                all_li_content = item.content
-                if item.children:
-                    props = []
-                    first = item.children[0]
-                    assert isinstance(first, FullListItem)
-                    match first.marker:
-                        case UnorderedListIndicator():
-                            ntag = "ul"
-                        case OrderedListIndicator():
-                            ntag = "ol"
-                            if first.marker.num > 1:
-                                props = [KV("start", str(first.marker.num))]
-                    all_li_content += [HTMLNode(ntag, item.children, props)]
-                ret.append(HTMLNode(tag, __render(all_li_content)))
-            case Popover():  # Extension, should it be "pluggable" ?
-                h = HTMLNode("span", [TextHTMLNode(tag='', text=item.hint)], [KV("data-tooltip", item.content)])
-                ret.append(h)
-            case Ref():
-                idx = max(ref_map.values()) + 1 if ref_map else 1
-                ref_map[item.text] = idx
-                a = HTMLNode("a", [TextHTMLNode("", text=str(idx))],
-                        props=[KV("href", f"#fn-{idx}"), KV("id", f"fnref-{idx}")])
-                sup = HTMLNode("sup", [a])
-                ret.append(sup)
-            case RefBlock():
-                hr = HTMLNode("hr")
-                ol = HTMLNode("ol", __render(item.children))
-                div = HTMLNode("div", [hr, ol], [KV("class", "footnotes")])
-                ret.append(div)
-            case RefItem():
-                idx = ref_map[item.ref]
-                ref_content = item.text
-                ref_content += [Anchor([PlainText("↩")], f"#fnref-{idx}")]
-                ret.append(HTMLNode("li", __render(ref_content), props=[KV("id", f"fn-{idx}")]))
-            case TableCell():
-                ret.append(HTMLNode("td", __render(item.content)))
-            case TableRow():
-                tr = HTMLNode("tr", __render(item.cells))
-                ret.append(tr)
-            case TableHeaderCell():
-                ret.append(HTMLNode("th", __render(item.content)))
-            case Table():
-                head_tr = HTMLNode("tr", __render(item.header.cells))
-                head = HTMLNode("thead", [head_tr])
-                rows = []
-                for r in item.rows:
-                    rows.extend(__render(r))
-                ret.append(HTMLNode("table", [head] + rows))
-            # Should probably gather sup/sub/small/smaller/bold/em in "style"
-            case Superscript():
-                ret.append(HTMLNode("sup", __render(item.content)))
-            case Subscript():
-                ret.append(HTMLNode("sub", __render(item.content)))
-            case Smaller():
-                ret.append(HTMLNode("smaller", __render(item.content)))
-            case Small():
-                ret.append(HTMLNode("small", __render(item.content)))
-            case other:
-                found = False
-                for e in ext:
-                    if not isinstance(other, e.render_type):
-                        continue
-                    found = True
-                    ret.extend(e.render(other))
-                assert found, f"Item type {other} not handled by any extensions"
-
-
-    return ret
+@dataclass
+class RefContext:
+    """
+    Footnote numbering for one render: each reference gets the next number, in document order.
+    Pass one to `render`/`write_html` to inspect it afterwards.
+    """
+    indices: dict[str, int] = field(default_factory=dict)
+    defined: set[str] = field(default_factory=set)
+    count: int = 0
+
+    def reference(self, ref: str) -> int:
+        self.count += 1
+        self.indices[ref] = self.count
+        return self.count
+
+    def definition(self, ref: str) -> int:
+        self.defined.add(ref)
+        return self.indices[ref]
+
+    @property
+    def dangling(self) -> list[str]:
+        """
+        References without a footnote
+        """
+        return [ref for ref in self.indices if ref not in self.defined]
+
+def render(items: Node | list[Node], ext: list[Processor] | None = None, refs: RefContext | None = None) -> list[HTMLNode]:
+    """
+    Render lifted nodes to HTML. `items` is left untouched, so the same tree can be rendered many times.
+    """
+    return TreeRenderer(_with_ext(TREE_HANDLERS, ext, _tree_ext), refs or RefContext()).render(items)
+
+
+def _with_ext(base: Registry[H], ext: list[Processor] | None, adapt: Callable[[list[Processor]], H]) -> Registry[H]:
+    """
+    `base` with the handlers of `ext`, which take precedence over the built-in ones
+    """
+    if not ext:
+        return base
+    return base.override({t: adapt(procs) for t, procs in group_by_type(ext, "render_type").items()})
+
+
+class UnhandledNode(ValueError):
+    """
+    A node without a handler, eg: a CustomDirective (`{^name: args}`) when no extension renders directives
+    """
+
+
+def _unhandled(item: Node) -> UnhandledNode:
+    if isinstance(item, CustomDirective):
+        return UnhandledNode(f"No extension renders the directive {item.name!r}: {item}")
+    return UnhandledNode(f"Item type {item} not handled by any extensions")
+
+
+TreeHandler = Callable[["TreeRenderer", Any, list[HTMLNode]], None]
+
+
+class TreeRenderer:
+    """
+    Renders with an explicit stack rather than recursion, so deep nesting doesn't reach the recursion limit:
+    handlers `push` the nodes nested in an item, which are rendered once the handler returns, before the
+    next item. Calling `render` from a handler (eg: an extension's) still works, for content nested no further.
+    """
+
+    def __init__(self, handlers: Registry[TreeHandler], refs: RefContext) -> None:
+        self.handlers = handlers
+        self.refs = refs
+        self._pushed: list[tuple[Iterator[Node], list[HTMLNode]]] = []
+
+    def push(self, items: list[Node], ret: list[HTMLNode]) -> None:
+        """
+        Render `items` into `ret` after the current handler, following what it pushed before
+        """
+        self._pushed.append((iter(items), ret))
+
+    def render(self, items: Node | list[Node]) -> list[HTMLNode]:
+        ret: list[HTMLNode] = []
+        if isinstance(items, Node):
+            items = [items]
+        lookup = self.handlers.get
+        handlers: dict[type, TreeHandler | None] = {}
+        outer = self._pushed
+        self._pushed = pushed = []
+        stack = [(iter(items), ret)]
+        try:
+            while stack:
+                it, out = top = stack.pop()
+                for item in it:
+                    typ = type(item)
+                    try:
+                        handler = handlers[typ]
+                    except KeyError:
+                        handler = handlers[typ] = lookup(typ)
+                    if handler is None:
+                        raise _unhandled(item)
+                    handler(self, item, out)
+                    if pushed:
+                        stack.append(top)
+                        pushed.reverse()
+                        stack += pushed
+                        pushed.clear()
+                        break
+        finally:
+            self._pushed = outer
+        return ret
+
+
+def _tree_tag(tag: str, attr: str) -> TreeHandler:
+    """
+    Render the nodes in `attr` inside a `tag` element
+    """
+    get = attrgetter(attr)
+    def handler(r: TreeRenderer, item: Node, ret: list[HTMLNode]) -> None:
+        node = HTMLNode(tag)
+        r.push(get(item), node.children)
+        ret.append(node)
+    return handler
+
+
+def _tree_ext(procs: list[Processor]) -> TreeHandler:
+    def handler(r: TreeRenderer, item: Node, ret: list[HTMLNode]) -> None:
+        for p in procs:
+            ret.extend(p.render(item))
+    return handler
+
+
+def _tree_skip(r: TreeRenderer, item: Node, ret: list[HTMLNode]) -> None:
+    pass
+
+
+def _tree_hr(r: TreeRenderer, item: Hr, ret: list[HTMLNode]) -> None:
+    ret.append(HTMLNode('hr'))
+
+
+def _tree_self_close(r: TreeRenderer, item: HtmlSelfCloseTag, ret: list[HTMLNode]) -> None:
+    node = HTMLNode(item.elem_type, [], item.props)
+    assert node.self_closing
+    ret.append(node)
+
+
+def _tree_heading(r: TreeRenderer, item: Heading, ret: list[HTMLNode]) -> None:
+    node = HTMLNode("h" + str(item.level))
+    r.push(item.content, node.children)
+    ret.append(node)
+
+
+def _tree_code_block(r: TreeRenderer, item: CodeBlock, ret: list[HTMLNode]) -> None:
+    ret.append(HTMLNode("pre", [HTMLNode("code", [TextHTMLNode(tag="", text='\n'.join(item.lines))])]))
+
+
+def _tree_image(r: TreeRenderer, item: Image, ret: list[HTMLNode]) -> None:
+    if item.url is None:
+        return
+    props = [KV("src", item.url)]
+    if item.alt:
+        props.append(KV("alt", item.alt))
+    ret.append(HTMLNode("img", [], props))
+
+
+def _tree_anchor(r: TreeRenderer, item: Anchor, ret: list[HTMLNode]) -> None:
+    node = HTMLNode("a", [], [KV("href", item.href)])
+    r.push(item.content, node.children)
+    ret.append(node)
+
+
+def _tree_inline_code(r: TreeRenderer, item: InlineCode, ret: list[HTMLNode]) -> None:
+    ret.append(HTMLNode("code", [item.text]))
+
+
+def _tree_br(r: TreeRenderer, item: ParBreak, ret: list[HTMLNode]) -> None:
+    ret.append(HTMLNode("br"))
+
+
+def _tree_text(r: TreeRenderer, item: PlainText, ret: list[HTMLNode]) -> None:
+    ret.append(TextHTMLNode(tag="", text=item.text))
+
+
+def _tree_full_quote(r: TreeRenderer, item: FullQuote, ret: list[HTMLNode]) -> None:
+    # the blockquote goes after the content, so it's rendered after it too
+    r.push(item.content, ret)
+    if item.children:
+        r.push([HTMLNode("blockquote", interleave_1(item.children, ParBreak()))], ret)
+
+
+def _tree_html(r: TreeRenderer, item: HTMLNode, ret: list[HTMLNode]) -> None:
+    node = HTMLNode(item.tag, [], item.props)
+    r.push(item.children, node.children)
+    ret.append(node)
+
+
+def _tree_list(r: TreeRenderer, item: List, ret: list[HTMLNode]) -> None:
+    tag, props = _list_tag(item.marker)
+    node = HTMLNode(tag, [], props)
+    r.push(item.children, node.children)
+    ret.append(node)
+
+
+def _tree_list_item(r: TreeRenderer, item: FullListItem, ret: list[HTMLNode]) -> None:
+    all_li_content = item.content
+    if item.children:
+        first = item.children[0]
+        assert isinstance(first, FullListItem)
+        ntag, props = _list_tag(first.marker)
+        all_li_content = all_li_content + [HTMLNode(ntag, item.children, props)]
+    node = HTMLNode("li")
+    r.push(all_li_content, node.children)
+    ret.append(node)
+
+
+def _tree_popover(r: TreeRenderer, item: Popover, ret: list[HTMLNode]) -> None:
+    ret.append(HTMLNode("span", [TextHTMLNode(tag='', text=item.hint)], [KV("data-tooltip", item.content)]))
+
+
+def _tree_ref(r: TreeRenderer, item: Ref, ret: list[HTMLNode]) -> None:
+    idx = r.refs.reference(item.text)
+    a = HTMLNode("a", [TextHTMLNode("", text=str(idx))],
+            props=[KV("href", f"#fn-{idx}"), KV("id", f"fnref-{idx}")])
+    ret.append(HTMLNode("sup", [a]))
+
+
+def _tree_ref_block(r: TreeRenderer, item: RefBlock, ret: list[HTMLNode]) -> None:
+    hr = HTMLNode("hr")
+    ol = HTMLNode("ol")
+    r.push(item.children, ol.children)
+    ret.append(HTMLNode("div", [hr, ol], [KV("class", "footnotes")]))
+
+
+def _tree_ref_item(r: TreeRenderer, item: RefItem, ret: list[HTMLNode]) -> None:
+    idx = r.refs.definition(item.ref)
+    ref_content = item.text + [Anchor([PlainText("↩")], f"#fnref-{idx}")]
+    node = HTMLNode("li", props=[KV("id", f"fn-{idx}")])
+    r.push(ref_content, node.children)
+    ret.append(node)
+
+
+def _tree_table(r: TreeRenderer, item: Table, ret: list[HTMLNode]) -> None:
+    tr = HTMLNode("tr")
+    r.push(item.header.cells, tr.children)
+    node = HTMLNode("table", [HTMLNode("thead", [tr])])
+    r.push(item.rows, node.children)
+    ret.append(node)
+
+
+# Nodes which are a `tag` element around the nodes in their `attr`: the same for both TREE_HANDLERS and
+# WRITE_HANDLERS, which must otherwise give the same HTML for the same types
+ELEMENTS: dict[type, tuple[str, str]] = {
+    Paragraph: ("p", "children"),
+    Bold: ("b", "content"),
+    Emphasis: ("em", "content"),
+    QuoteBlock: ("blockquote", "children"),
+    TableCell: ("td", "content"),
+    TableRow: ("tr", "cells"),
+    TableHeaderCell: ("th", "content"),
+    # Should probably gather sup/sub/small/smaller/bold/em in "style"
+    Superscript: ("sup", "content"),
+    Subscript: ("sub", "content"),
+    Smaller: ("smaller", "content"),
+    Small: ("small", "content"),
+}
+
+
+TREE_HANDLERS: Registry[TreeHandler] = Registry({
+    **{typ: _tree_tag(tag, attr) for typ, (tag, attr) in ELEMENTS.items()},
+    Metadata: _tree_skip,
+    Hr: _tree_hr,
+    HtmlSelfCloseTag: _tree_self_close,
+    Heading: _tree_heading,
+    CodeBlock: _tree_code_block,
+    Image: _tree_image,
+    Anchor: _tree_anchor,
+    InlineCode: _tree_inline_code,
+    ParBreak: _tree_br,
+    PlainText: _tree_text,
+    FullQuote: _tree_full_quote,
+    HTMLNode: _tree_html,
+    List: _tree_list,
+    FullListItem: _tree_list_item,
+    Popover: _tree_popover,
+    Ref: _tree_ref,
+    RefBlock: _tree_ref_block,
+    RefItem: _tree_ref_item,
+    Table: _tree_table,
+})
+
+
+def write_html(
+    items: Node | list[Node],
+    out: Callable[[str], object] | TextIO,
+    ext: list[Processor] | None = None,
+    refs: RefContext | None = None,
+) -> None:
+    """
+    Write the HTML for lifted nodes straight to `out` (a `write` callable or a text buffer),
+    without building the HTMLNode tree; the output is the same as `str()` of every node from `render`.
+    """
+    write = out.write if hasattr(out, "write") else out
+    HTMLWriter(write, _with_ext(WRITE_HANDLERS, ext, _write_ext), refs or RefContext()).write(items)
+
+
+def _list_tag(marker: UnorderedListIndicator | OrderedListIndicator) -> tuple[str, list[KV]]:
+    match marker:
+        case UnorderedListIndicator():
+            return "ul", []
+        case OrderedListIndicator():
+            if marker.num > 1:
+                return "ol", [KV("start", str(marker.num))]
+            return "ol", []
+    assert False, marker
+
+
+WriteHandler = Callable[["HTMLWriter", Any], None]
+
+
+class HTMLWriter:
+    """
+    Writes with an explicit stack, like TreeRenderer: handlers `push` nested nodes and closing tags, written
+    once the handler returns, while `out` writes right away (so before anything the handler pushed).
+    """
+
+    def __init__(self, write: Callable[[str], object], handlers: Registry[WriteHandler], refs: RefContext) -> None:
+        self.out = write
+        self.handlers = handlers
+        self.refs = refs
+        # nodes to write, then HTML to write after them
+        self._pushed: list[tuple[Iterable[Node], str]] = []
+
+    def push(self, items: list[Node], after: str = "") -> None:
+        """
+        Write `items`, then the HTML `after`, once the current handler returns, following what it pushed before
+        """
+        self._pushed.append((iter(items), after))
+
+    def wrap(self, tag: str, children: Node | list[Node], props: list[KV] | None = None) -> None:
+        pushed = self._pushed
+        if pushed:
+            pushed.append(((), open_tag(tag, props or [])))
+        else:
+            self.out(open_tag(tag, props or []))
+        pushed.append((iter([children] if isinstance(children, Node) else children), f"</{tag}>"))
+
+    def write(self, items: Node | list[Node]) -> None:
+        if isinstance(items, Node):
+            items = [items]
+        lookup = self.handlers.get
+        handlers: dict[type, WriteHandler | None] = {}
+        out = self.out
+        outer = self._pushed
+        self._pushed = pushed = []
+        stack: list[tuple[Iterable[Node], str]] = [(iter(items), "")]
+        try:
+            while stack:
+                it, after = top = stack.pop()
+                for item in it:
+                    typ = type(item)
+                    try:
+                        handler = handlers[typ]
+                    except KeyError:
+                        handler = handlers[typ] = lookup(typ)
+                    if handler is None:
+                        raise _unhandled(item)
+                    handler(self, item)
+                    if pushed:
+                        stack.append(top)
+                        pushed.reverse()
+                        stack += pushed
+                        pushed.clear()
+                        break
+                else:
+                    if after:
+                        out(after)
+        finally:
+            self._pushed = outer
+
+
+def _write_tag(tag: str, attr: str) -> WriteHandler:
+    """
+    Write the nodes in `attr` inside a `tag` element
+    """
+    get = attrgetter(attr)
+    start, end = open_tag(tag, []), f"</{tag}>"
+    def handler(w: HTMLWriter, item: Node) -> None:
+        w.out(start)
+        w.push(get(item), end)
+    return handler
+
+
+def _write_ext(procs: list[Processor]) -> WriteHandler:
+    def handler(w: HTMLWriter, item: Node) -> None:
+        for p in procs:
+            for node in p.render(item):
+                w.out(str(node))
+    return handler
+
+
+def _write_skip(w: HTMLWriter, item: Node) -> None:
+    pass
+
+
+def _write_hr(w: HTMLWriter, item: Hr) -> None:
+    w.out("<hr/>")
+
+
+def _write_self_close(w: HTMLWriter, item: HtmlSelfCloseTag) -> None:
+    assert HTMLNode(item.elem_type).self_closing
+    w.out(open_tag(item.elem_type, item.props))
+
+
+def _write_heading(w: HTMLWriter, item: Heading) -> None:
+    w.wrap("h" + str(item.level), item.content)
+
+
+def _write_code_block(w: HTMLWriter, item: CodeBlock) -> None:
+    w.out("<pre><code>" + "\n".join(item.lines) + "</code></pre>")
+
+
+def _write_image(w: HTMLWriter, item: Image) -> None:
+    if item.url is None:
+        return
+    props = [KV("src", item.url)]
+    if item.alt:
+        props.append(KV("alt", item.alt))
+    w.out(open_tag("img", props))
+
+
+def _write_anchor(w: HTMLWriter, item: Anchor) -> None:
+    w.wrap("a", item.content, [KV("href", item.href)])
+
+
+def _write_inline_code(w: HTMLWriter, item: InlineCode) -> None:
+    w.out(f"<code>{item.text}</code>")
+
+
+def _write_br(w: HTMLWriter, item: ParBreak) -> None:
+    w.out("<br/>")
+
+
+def _write_text(w: HTMLWriter, item: PlainText) -> None:
+    w.out(item.text)
+
+
+def _write_full_quote(w: HTMLWriter, item: FullQuote) -> None:
+    w.push(item.content)
+    if item.children:
+        w.wrap("blockquote", interleave_1(item.children, ParBreak()))
+
+
+def _write_html(w: HTMLWriter, item: HTMLNode) -> None:
+    if item.self_closing:
+        w.out(open_tag(item.tag, item.props))
+    else:
+        w.wrap(item.tag, item.children, item.props)
+
+
+def _write_list(w: HTMLWriter, item: List) -> None:
+    tag, props = _list_tag(item.marker)
+    w.wrap(tag, item.children, props)
+
+
+def _write_list_item(w: HTMLWriter, item: FullListItem) -> None:
+    w.out("<li>")
+    w.push(item.content)
+    if item.children:
+        first = item.children[0]
+        assert isinstance(first, FullListItem)
+        tag, props = _list_tag(first.marker)
+        w.wrap(tag, item.children, props)
+    w.push([], "</li>")
+
+
+def _write_popover(w: HTMLWriter, item: Popover) -> None:
+    w.out(f'{open_tag("span", [KV("data-tooltip", item.content)])}{item.hint}</span>')
+
+
+def _write_ref(w: HTMLWriter, item: Ref) -> None:
+    idx = w.refs.reference(item.text)
+    w.out(f'<sup><a href="#fn-{idx}" id="fnref-{idx}">{idx}</a></sup>')
+
+
+def _write_ref_block(w: HTMLWriter, item: RefBlock) -> None:
+    w.out('<div class="footnotes"><hr/>')
+    w.wrap("ol", item.children)
+    w.push([], "</div>")
+
+
+def _write_ref_item(w: HTMLWriter, item: RefItem) -> None:
+    idx = w.refs.definition(item.ref)
+    w.wrap("li", item.text + [Anchor([PlainText("↩")], f"#fnref-{idx}")], [KV("id", f"fn-{idx}")])
+
+
+def _write_table(w: HTMLWriter, item: Table) -> None:
+    w.out("<table><thead>")
+    w.wrap("tr", item.header.cells)
+    w.push([], "</thead>")
+    w.push(item.rows, "</table>")
+
+
+WRITE_HANDLERS: Registry[WriteHandler] = Registry({
+    **{typ: _write_tag(tag, attr) for typ, (tag, attr) in ELEMENTS.items()},
+    Metadata: _write_skip,
+    Hr: _write_hr,
+    HtmlSelfCloseTag: _write_self_close,
+    Heading: _write_heading,
+    CodeBlock: _write_code_block,
+    Image: _write_image,
+    Anchor: _write_anchor,
+    InlineCode: _write_inline_code,
+    ParBreak: _write_br,
+    PlainText: _write_text,
+    FullQuote: _write_full_quote,
+    HTMLNode: _write_html,
+    List: _write_list,
+    FullListItem: _write_list_item,
+    Popover: _write_popover,
+    Ref: _write_ref,
+    RefBlock: _write_ref_block,
+    RefItem: _write_ref_item,
+    Table: _write_table,
+})
+
 
 if __name__ == "__main__":
     parser = make_parser()
@@ -0,0 +1,236 @@
+# Compact binary format for parsed and lifted nodes, to cache them or send them to another process
+#
+#   header:  MAGIC, VERSION (1 byte), schema hash (4 bytes)
+#   strings: count, the length (in characters) of each one, then all of them as one utf-8 blob
+#   body:    the value, in pre-order: one tag byte per value, followed by
+#            - str: index in the string table
+#            - int: zigzag encoded
+#            - list: length, then the items
+#            - lark Token: its type then its value, as strings (not its position)
+#            - node: its fields, in declaration order, then its span (or NONE) if it has one
+#
+# Both directions use an explicit stack, so the depth of the tree is not bounded by the recursion limit.
+# Integers are unsigned LEB128 varints. The schema hash covers the node types and their fields,
+# so a blob from another version of the nodes is rejected instead of decoded wrongly.
+
+import hashlib
+from dataclasses import fields
+from operator import attrgetter
+from typing import Callable
+
+from lark import Token, Tree
+
+from markdown_parser.lifter import FullListItem, FullQuote, HTMLNode, List, Paragraph, QuoteBlock
+from markdown_parser.nodes import *
+
+MAGIC = b"MDAST"
+VERSION = 2
+
+NODE_TYPES: tuple[type, ...] = (
+    PlainText, Bold, Emphasis, Anchor, Image, Quote, CodeBlock, InlineCode,
+    TableDivisor, TableCell, TableRow, TableHeaderCell, TableHeaderRow, Table,
+    UnorderedListIndicator, OrderedListIndicator, ListItemIndicator, ListItem, OListItem, ListBlock,
+    Ref, RefItem, RefBlock, CustomDirective, Popover, KV, HtmlOpenTag, HtmlCloseTag, HtmlSelfCloseTag,
+    Heading, Newline, ParBreak, Superscript, Subscript, Small, Smaller, Hr, Metadata,
+    Paragraph, QuoteBlock, FullQuote, FullListItem, List, HTMLNode,
+)
+
+NONE, STR, INT, LIST, SPAN, ALIGNMENT, TREE, TOKEN = range(8)
+FIRST_NODE = 16
+
+ALIGNMENTS = list(Alignment)
+
+# per type: tag, fields (without `span`), whether it has a span
+_SPECS = {
+    cls: (
+        FIRST_NODE + idx,
+        tuple(f.name for f in fields(cls) if f.name != "span"),
+        "span" in cls.__dataclass_fields__,
+    )
+    for idx, cls in enumerate(NODE_TYPES)
+}
+_BY_TAG = {tag: (cls, names, has_span) for cls, (tag, names, has_span) in _SPECS.items()}
+
+SCHEMA = hashlib.blake2b(
+    repr([(cls.__name__, names, has_span) for cls, (_, names, has_span) in _SPECS.items()]).encode(),
+    digest_size=4,
+).digest()
+HEADER = MAGIC + bytes([VERSION]) + SCHEMA
+
+
+def _reversed_getter(names: tuple[str, ...]) -> Callable[[object], tuple]:
+    names = names[::-1]
+    if len(names) > 1:
+        return attrgetter(*names)
+    return lambda v: tuple(getattr(v, name) for name in names)
+
+
+# per type: tag, and a getter of its fields then span, in reverse order (as they are pushed on the stack)
+_PUSH = {
+    cls: (tag, _reversed_getter(names + ("span",) * has_span))
+    for cls, (tag, names, has_span) in _SPECS.items()
+}
+
+
+def _varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def encode(value: object) -> bytes:
+    """
+    Serialize nodes (usually a list of them, as returned by `parse_nodes` or `lift`)
+    """
+    strings: dict[str, int] = {}
+    body = bytearray()
+    specs = _PUSH
+
+    # values left to write, the next one last: a node pushes its span and fields in reverse order
+    stack = [value]
+    while stack:
+        v = stack.pop()
+        if v is None:
+            body.append(NONE)
+        elif type(v) is str:
+            idx = strings.get(v)
+            if idx is None:
+                idx = strings[v] = len(strings)
+            body.append(STR)
+            if idx < 0x80:
+                body.append(idx)
+            else:
+                _varint(body, idx)
+        elif type(v) is list:
+            body.append(LIST)
+            _varint(body, len(v))
+            stack += reversed(v)
+        elif (spec := specs.get(type(v))) is not None:
+            tag, get = spec
+            body.append(tag)
+            stack += get(v)
+        elif type(v) is Span:
+            body.append(SPAN)
+            _varint(body, v.start)
+            _varint(body, v.end)
+        elif type(v) is int:
+            body.append(INT)
+            _varint(body, v << 1 if v >= 0 else (-v << 1) - 1)
+        elif isinstance(v, Alignment):
+            body.append(ALIGNMENT)
+            body.append(ALIGNMENTS.index(v))
+        elif isinstance(v, Token):
+            body.append(TOKEN)
+            stack.append(v[:])
+            stack.append(str(v.type))
+        elif isinstance(v, Tree):
+            body.append(TREE)
+            stack.append(v.children)
+            stack.append(str(v.data))
+        else:
+            raise TypeError(f"Can't serialize {type(v).__name__}: {v!r}")
+
+    out = bytearray(HEADER)
+    _varint(out, len(strings))
+    for s in strings:
+        _varint(out, len(s))
+    blob = "".join(strings).encode()
+    _varint(out, len(blob))
+    out += blob
+    out += body
+    return bytes(out)
+
+
+def decode(data: bytes) -> object:
+    if not data.startswith(MAGIC):
+        raise ValueError("Not a serialized AST")
+    if data[len(MAGIC)] != VERSION or data[len(MAGIC) + 1 : len(HEADER)] != SCHEMA:
+        raise ValueError(f"Serialized AST from another version (format {data[len(MAGIC)]})")
+    pos = len(HEADER)
+
+    def varint() -> int:
+        nonlocal pos
+        b = data[pos]
+        pos += 1
+        if b < 0x80:
+            return b
+        n = b & 0x7F
+        shift = 7
+        while True:
+            b = data[pos]
+            pos += 1
+            n |= (b & 0x7F) << shift
+            if b < 0x80:
+                return n
+            shift += 7
+
+    count = varint()
+    lengths = [varint() for _ in range(count)]
+    size = varint()
+    text = data[pos : pos + size].decode()
+    pos += size
+    strings = []
+    start = 0
+    for length in lengths:
+        strings.append(text[start : start + length])
+        start += length
+
+    by_tag = _BY_TAG
+
+    # values being read: (class, None for a list; whether its last value is a span; number of values; values)
+    frames: list[tuple[type | None, bool, int, list]] = []
+    while True:
+        tag = data[pos]
+        pos += 1
+        if tag == STR:
+            v: object = strings[varint()]
+        elif tag >= FIRST_NODE:
+            cls, names, has_span = by_tag[tag]
+            if n := len(names) + has_span:
+                frames.append((cls, has_span, n, []))
+                continue
+            v = cls()
+        elif tag == LIST:
+            if n := varint():
+                frames.append((None, False, n, []))
+                continue
+            v = []
+        elif tag == NONE:
+            v = None
+        elif tag == INT:
+            n = varint()
+            v = n >> 1 if not n & 1 else -((n + 1) >> 1)
+        elif tag == SPAN:
+            v = Span(varint(), varint())
+        elif tag == ALIGNMENT:
+            pos += 1
+            v = ALIGNMENTS[data[pos - 1]]
+        elif tag == TREE:
+            frames.append((Tree, False, 2, []))
+            continue
+        elif tag == TOKEN:
+            frames.append((Token, False, 2, []))
+            continue
+        else:
+            raise ValueError(f"Corrupted AST: unknown tag {tag} at {pos - 1}")
+        # `v` is complete: add it to its parent, which may complete it in turn
+        while frames:
+            cls, has_span, n, args = frames[-1]
+            args.append(v)
+            if len(args) < n:
+                break
+            frames.pop()
+            if cls is None:
+                v = args
+            elif has_span and (span := args.pop()) is not None:
+                v = cls(*args, span=span)
+            else:
+                v = cls(*args)
+        if not frames:
+            break
+
+    ret = v
+    if pos != len(data):
+        raise ValueError(f"Corrupted AST: {len(data) - pos} trailing bytes")
+    return ret
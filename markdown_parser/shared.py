@@ -0,0 +1,118 @@
+# One parser for all the threads of a process (eg: a threaded WSGI server), so the grammars are loaded once
+#
+# A lark parse keeps its state (lexer position, parser stacks) in objects made for the call, and only reads the
+# LALR tables, the lexers and the NodeTransformer, which are shared. What a DoubleParser changes while parsing
+# (`stats`) is per thread: each thread parses with its own `fork` of the parser, which goes away with the thread
+# (its stats are added to the totals). The instrumented p2 (for metrics, built on their first use), the ChunkCache
+# and the pool of `workers` are shared, all are thread-safe.
+
+import threading
+import weakref
+from typing import Iterable, Iterator
+
+from markdown_parser.chunk_cache import ChunkCache
+from markdown_parser.instrument import DocMetrics
+from markdown_parser.limits import Limits
+from markdown_parser.nodes import Node, ParBreak
+from markdown_parser.parser import COMPILE_GRAMMAR, DoubleParser, ParseStats, build_scanners
+
+
+class SharedParser:
+    """
+    A thread-safe DoubleParser: the same methods, callable from any thread at once
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        compile_grammar: bool = COMPILE_GRAMMAR,
+        workers: int = 0,
+        chunk_cache: ChunkCache | None = None,
+        spans: bool = False,
+        limits: Limits | None = None,
+    ) -> None:
+        self._parser = DoubleParser(cache_dir, compile_grammar, workers, chunk_cache, spans, limits)
+        # lexers build their regexes lazily, on their first token
+        for p in (self._parser.p1, self._parser.p2, self._parser.p2_spans):
+            if p is not None:
+                build_scanners(p)
+        if workers:
+            self._parser.pool()
+        self._local = threading.local()
+        # reentrant: a fork may be collected, adding its stats, while the lock is held
+        self._lock = threading.RLock()
+        self._forks: weakref.WeakSet[DoubleParser] = weakref.WeakSet()
+        self._totals = ParseStats()  # of the forks which are gone
+
+    def local(self) -> DoubleParser:
+        """
+        The parser of the calling thread, eg: for functions taking a DoubleParser
+        """
+        try:
+            return self._local.parser
+        except AttributeError:
+            pass
+        parser = self._local.parser = self._parser.fork()
+        with self._lock:
+            self._forks.add(parser)
+        weakref.finalize(parser, self._add_stats, parser.stats)
+        return parser
+
+    def _add_stats(self, stats: ParseStats) -> None:
+        with self._lock:
+            self._totals.chunks += stats.chunks
+            self._totals.plain_chunks += stats.plain_chunks
+
+    @property
+    def spans(self) -> bool:
+        return self._parser.spans
+
+    @property
+    def limits(self) -> Limits | None:
+        return self._parser.limits
+
+    @property
+    def chunk_cache(self) -> ChunkCache | None:
+        return self._parser.chunk_cache
+
+    @property
+    def stats(self) -> ParseStats:
+        """
+        Of all threads
+        """
+        with self._lock:
+            forks = list(self._forks)
+            return ParseStats(
+                self._totals.chunks + sum(f.stats.chunks for f in forks),
+                self._totals.plain_chunks + sum(f.stats.plain_chunks for f in forks),
+            )
+
+    def close(self) -> None:
+        self._parser.close()
+
+    def __enter__(self) -> "SharedParser":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def split(self, text: str) -> list[str | ParBreak]:
+        return self.local().split(text)
+
+    def split_spans(self, text: str) -> list[tuple[int, int, str | ParBreak]]:
+        return self.local().split_spans(text)
+
+    def parse_chunk(self, chunk_text: str, metrics: DocMetrics | None = None) -> list[Node]:
+        return self.local().parse_chunk(chunk_text, metrics)
+
+    def parse_nodes(self, text: str, offset: int = 0, metrics: DocMetrics | None = None) -> list[Node]:
+        return self.local().parse_nodes(text, offset, metrics)
+
+    def parse(self, text: str) -> Node | list[Node]:
+        return self.local().parse(text)
+
+    def parse_stream(self, lines: Iterable[str], metrics: DocMetrics | None = None) -> Iterator[Node]:
+        """
+        Parses with the parser of the thread which calls this, wherever the nodes are read from
+        """
+        return self.local().parse_stream(lines, metrics)
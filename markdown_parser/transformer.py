@@ -1,3 +1,5 @@
+from typing import Callable
+
 from lark import Transformer, Token, Tree
 
 from markdown_parser.nodes import *
@@ -170,8 +172,8 @@ class NodeTransformer(Transformer):
     def table(self, items) -> Table:
         header, divisors, *rows = items
         assert isinstance(header, TableRow)
-        cells = [TableHeaderCell(c.content) for c in header.cells]
-        header = TableHeaderRow(cells)
+        cells = [TableHeaderCell(c.content, span=c.span) for c in header.cells]
+        header = TableHeaderRow(cells, span=header.span)
         return Table(header, divisors, rows)
 
     def table_cell(self, items) -> TableCell:
@@ -227,3 +229,26 @@ class NodeTransformer(Transformer):
         _, *entries, _ = items
         return Metadata(entries)
 
+
+
+class SpanTransformer(NodeTransformer):
+    """
+    NodeTransformer for trees parsed with `propagate_positions`: sets the `span` of the node each rule returns.
+    `to_doc` maps an offset in the parsed text to the document.
+    """
+    def __init__(self, to_doc: Callable[[int], int]) -> None:
+        super().__init__()
+        self.to_doc = to_doc
+
+    def _call_userfunc(self, tree, new_children=None):
+        ret = super()._call_userfunc(tree, new_children)
+        # rules passing a child through (eg: `delim`) keep its span
+        if isinstance(ret, Node) and ret.span is None and not tree.meta.empty:
+            ret.span = Span(self.to_doc(tree.meta.start_pos), self.to_doc(tree.meta.end_pos))
+        return ret
+
+    def table_divisor(self, items) -> list[TableDivisor]:
+        ret = super().table_divisor(items)
+        for td, tok in zip(ret, items):
+            td.span = Span(self.to_doc(tok.start_pos), self.to_doc(tok.end_pos))
+        return ret
@@ -0,0 +1,44 @@
+import pytest
+
+from markdown_parser.batch import render_batch
+from markdown_parser.lifter import lift
+from markdown_parser.nodes import PlainText
+from markdown_parser.renderer import TextHTMLNode, render
+
+DOCS = [
+    ("a", "# title\n\nsome **text**"),
+    ("b", "</div>"),  # no open tag: fails in lift
+    ("c", "text\n> quote"),  # fails in parse
+    ("d", "* a\n    * b"),
+] * 3
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_render_batch(parser, workers):
+    results = list(render_batch(DOCS, workers=workers, chunksize=2))
+    assert [r.id for r in results] == [doc_id for doc_id, _ in DOCS]
+    for (_, text), r in zip(DOCS, results):
+        if r.id in ("a", "d"):
+            assert r.ok
+            assert r.html == "".join(str(n) for n in render(lift(parser.parse_nodes(text))))
+        else:
+            assert not r.ok
+            assert r.html is None
+    errors = {r.id: r.error for r in results if r.error}
+    assert errors["b"].stage == "lift"
+    assert errors["b"].type == "AssertionError"
+    assert "No open tag" in errors["b"].message
+    assert errors["c"].stage == "parse"
+
+
+class Shout:
+    render_type = PlainText
+
+    @staticmethod
+    def render(node):
+        return [TextHTMLNode(tag="", text=node.text.upper())]
+
+
+def test_render_batch_ext():
+    results = list(render_batch([(1, "# title")], workers=1, ext=[Shout()]))
+    assert results[0].html == "<h1> TITLE</h1>"
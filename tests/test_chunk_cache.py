@@ -0,0 +1,45 @@
+from markdown_parser.chunk_cache import ChunkCache
+from markdown_parser.nodes import *
+from markdown_parser.parser import make_parser
+
+
+def test_lru_entries():
+    cache = ChunkCache(max_entries=2)
+    cache.put("a", [PlainText("a")])
+    cache.put("b", [PlainText("b")])
+    assert cache.get("a") == [PlainText("a")]
+    cache.put("c", [PlainText("c")])  # evicts "b", least recently used
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("c") == [PlainText("c")]
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (2, 1, 1)
+
+
+def test_lru_bytes():
+    cache = ChunkCache(max_entries=None, max_bytes=200)
+    for i in range(10):
+        cache.put(str(i), [PlainText(str(i) * 20)])
+    assert 0 < cache.size_bytes <= 200
+    assert len(cache) < 10
+    assert cache.stats.evictions == 10 - len(cache)
+
+
+def test_hits_are_copies():
+    cache = ChunkCache()
+    nodes = [Bold([PlainText("x")])]
+    cache.put("**x**", nodes)
+    nodes[0].content.append(PlainText("changed by caller"))
+    got = cache.get("**x**")
+    assert got == [Bold([PlainText("x")])]
+    got[0].content.clear()
+    assert cache.get("**x**") == [Bold([PlainText("x")])]
+
+
+def test_parser_cache(parser):
+    text = "\n\n".join(["**repeated** notice", "plain", "_other_", "**repeated** notice"])
+    cache = ChunkCache()
+    cached = make_parser(chunk_cache=cache)
+    assert cached.parse(text) == parser.parse(text)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+    assert cached.parse(text) == parser.parse(text)
+    assert (cache.stats.hits, cache.stats.misses) == (4, 2)
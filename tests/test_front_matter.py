@@ -0,0 +1,57 @@
+import io
+
+import pytest
+
+from markdown_parser.front_matter import read_front_matter, read_front_matter_file
+from markdown_parser.lifter import lift
+from markdown_parser.nodes import KV, Metadata
+
+
+def lifted_entries(parser, text):
+    first = lift(parser.parse_nodes(text))[0]
+    return first.entries if isinstance(first, Metadata) else None
+
+
+@pytest.mark.parametrize("text", [
+    "---\ntitle: a: b\ntags: x, y\nk\n---\n\n# body",
+    "\n---\nk: v\n---\nbody",
+    "----\nk: v\n--- x\n",
+    "---\n---",
+    "---\nk: v --- w\nx: y\n\nbody",
+    "---\nk: **v**\n---",
+    "---\nk: v\n\nx: y\n---",
+    "\n\n---\nk: v\n---",
+    "---\nk: v",
+    "---\nk: v\n```\n---\n\n```\n---",
+    "---\nk: v\n---\n```\ncode\n\nmore\n```",
+    "# title\n\n---\nk: v\n---",
+])
+def test_same_as_lift(parser, text):
+    got = read_front_matter(parser, io.StringIO(text))
+    assert got == lifted_entries(parser, text)
+    assert read_front_matter(parser, text.splitlines(keepends=True)) == got
+
+
+class Lines:
+    def __init__(self, lines):
+        self.lines = lines
+        self.read = 0
+
+    def __iter__(self):
+        for line in self.lines:
+            self.read += 1
+            yield line
+
+
+def test_body_not_read(parser, tmp_path):
+    lines = Lines(["---\n", "title: post\n", "---\n"] + ["**body**\n"] * 1000)
+    assert read_front_matter(parser, lines) == [KV("title", "post")]
+    assert lines.read == 3
+
+    lines = Lines(["# no metadata\n"] + ["**body**\n"] * 1000)
+    assert read_front_matter(parser, lines) is None
+    assert lines.read == 1
+
+    path = tmp_path / "post.md"
+    path.write_text("---\ntitle: post\n---\n\nbody")
+    assert read_front_matter_file(parser, str(path)) == [KV("title", "post")]
@@ -0,0 +1,39 @@
+import pytest
+
+from markdown_parser.incremental import parse_state, reparse
+from markdown_parser.nodes import *
+
+TEXT = "# title\n\nsome **bold** text\n\n* a\n* b\n\n```\ncode\n```\n\nlast"
+
+
+def spans(state):
+    return [(p.start, p.end, p.chunk, p.nodes) for p in state.pieces]
+
+
+@pytest.mark.parametrize(
+    "offset,removed,inserted",
+    [
+        (TEXT.index("bold"), 4, "strong"),  # inside a chunk
+        (TEXT.index("some"), 0, "new paragraph\n\n"),  # split a chunk
+        (TEXT.index("some") - 2, 2, "\n"),  # join two chunks
+        (TEXT.index("code"), 0, "more\n\n"),  # inside a code block
+        (TEXT.index("last"), 0, "```\nfenced\n\n\nblank lines\n```\n\n"),  # add a fence
+        (0, len(TEXT), "replaced"),
+        (len(TEXT), 0, "\n\nappended"),
+    ],
+)
+def test_reparse_matches_full_parse(parser, offset, removed, inserted):
+    state = parse_state(parser, TEXT)
+    edited = TEXT[:offset] + inserted + TEXT[offset + removed :]
+    got = reparse(parser, state, offset, removed, inserted)
+    assert got.text == edited
+    assert spans(got) == spans(parse_state(parser, edited))
+
+
+def test_reparse_only_touched_chunks(parser):
+    state = parse_state(parser, TEXT)
+    chunks = parser.stats.chunks
+    got = reparse(parser, state, TEXT.index("bold"), 0, "very ")
+    assert parser.stats.chunks == chunks + 1
+    assert got.pieces[0] is state.pieces[0]
+    assert got.nodes[3] == Bold([PlainText("very bold")])
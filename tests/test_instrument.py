@@ -0,0 +1,73 @@
+import io
+
+import pytest
+
+from markdown_parser.batch import render_batch
+from markdown_parser.chunk_cache import ChunkCache
+from markdown_parser.instrument import LIFT, PARSE, SPLIT, TRANSFORM, WRITE, Collector, DocMetrics, count_nodes
+from markdown_parser.lifter import lift
+from markdown_parser.nodes import Bold, PlainText
+from markdown_parser.parser import make_parser
+from markdown_parser.render_cache import RenderCache
+
+TEXT = "# title\n\nsome **text** [a](b)\n\nplain\nlines\n\n* a\n    * b"
+
+
+def test_parse_metrics(parser):
+    m = DocMetrics()
+    nodes = parser.parse_nodes(TEXT, metrics=m)
+    assert nodes == parser.parse_nodes(TEXT)
+    assert set(m.times) == {SPLIT, PARSE, TRANSFORM}
+    assert all(t > 0 for t in m.times.values())
+    assert (m.chunks, m.plain_chunks, m.cached_chunks) == (4, 1, 0)
+    assert m.p1_tokens == 9  # 6 lines, 3 PAR_BREAKs
+    assert m.p2_tokens > 10
+    assert m.nodes == count_nodes(nodes)
+    assert m.input_bytes == len(TEXT)
+
+    streamed = DocMetrics()
+    assert list(parser.parse_stream(io.StringIO(TEXT), metrics=streamed)) == nodes
+    assert (streamed.chunks, streamed.p2_tokens, streamed.nodes) == (m.chunks, m.p2_tokens, m.nodes)
+
+    chunk = DocMetrics()
+    assert parser.parse_chunk("some **text**", chunk) == parser.parse_chunk("some **text**")
+    assert chunk.chunks == 1 and chunk.p2_tokens > 0 and chunk.times[TRANSFORM] > 0
+
+
+def test_parse_metrics_chunk_cache():
+    p = make_parser(chunk_cache=ChunkCache())
+    p.parse_nodes(TEXT, metrics=DocMetrics())
+    m = DocMetrics()
+    p.parse_nodes(TEXT, metrics=m)
+    assert (m.chunks, m.plain_chunks, m.cached_chunks, m.p2_tokens) == (4, 1, 3, 0)
+
+
+def test_count_nodes():
+    assert count_nodes([PlainText("a"), Bold([PlainText("b"), PlainText("c")])]) == 4
+    assert count_nodes([]) == 0
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_render_batch_collector(tmp_path, workers):
+    seen = []
+    collector = Collector(seen.append)
+    cache = RenderCache(str(tmp_path))
+    docs = [("a", TEXT), ("b", "</div>"), ("c", TEXT)]
+    results = list(render_batch(docs, workers=workers, cache=cache, collector=collector))
+    assert [m.id for m in seen] == ["a", "b", "c"]
+    assert [r.metrics for r in results] == seen
+
+    a, b, c = seen
+    assert {SPLIT, PARSE, TRANSFORM, LIFT, WRITE} <= set(a.times)
+    assert a.output_bytes == len(results[0].html)
+    assert a.lifted_nodes > 0
+    assert LIFT in b.times and WRITE not in b.times  # failed in lift
+    assert c.cached and not c.times and c.output_bytes == a.output_bytes
+    assert (collector.docs, collector.cached_docs) == (3, 1)
+    assert collector.totals.chunks == a.chunks + b.chunks
+    assert collector.totals.times[PARSE] == pytest.approx(a.times[PARSE] + b.times[PARSE])
+
+
+def test_no_metrics_by_default():
+    results = list(render_batch([("a", TEXT)]))
+    assert results[0].metrics is None
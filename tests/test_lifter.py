@@ -1,4 +1,4 @@
-from markdown_parser.lifter import HTMLNode, List, RefBlock, lift, QuoteBlock
+from markdown_parser.lifter import HTMLNode, List, Paragraph, RefBlock, lift, QuoteBlock
 from markdown_parser.nodes import CodeBlock, Heading, Metadata, OrderedListIndicator, ParBreak, PlainText, Ref, UnorderedListIndicator
 
 def test_unordered_list(parser):
@@ -230,3 +230,56 @@ def test_html_selfclose_attr(parser):
     i = parser.parse(text)
     print(i)
     got = lift(i)
+
+
+def test_lift_keeps_input():
+    items = [PlainText("a"), ParBreak(), Heading(1, [PlainText("h")]), ParBreak(), PlainText("b")]
+    before = list(items)
+    got = lift(items)
+    assert items == before
+    assert got == [PlainText("a"), ParBreak(), Heading(1, [PlainText("h")]), Paragraph([PlainText("b")])]
+
+def test_nodes_are_slotted(parser):
+    import pickle
+    l = lift(parser.parse_nodes('# t\n\n* a\n    * b\n\n> q\n\ntext **b** [l](u)'))
+    def walk(n):
+        yield n
+        for name in getattr(n, "__dataclass_fields__", {}):
+            val = getattr(n, name)
+            for c in val if isinstance(val, list) else [val]:
+                if hasattr(c, "__dataclass_fields__"):
+                    yield from walk(c)
+    seen = [n for top in l for n in walk(top)]
+    assert len(seen) > 10
+    assert not any(hasattr(n, "__dict__") for n in seen)
+    assert pickle.loads(pickle.dumps(l)) == l
+    match l[0]:
+        case Heading(1, [PlainText(t)]):
+            assert t.strip() == "t"
+        case _:
+            assert False, l[0]
+
+def test_lift_spans():
+    from markdown_parser.parser import make_parser
+    text = "---\nk: v\n---\n\ntext **b**\n\n* a\n    * b\n\n> q\n>> r\n\n[^a]: n\n[^b]: m"
+    l = lift(make_parser(spans=True).parse_nodes(text))
+    src = [text[n.span.start:n.span.end] for n in l]
+    assert src == ["---\nk: v\n---", "text **b**", "* a\n    * b", "> q\n>> r", "[^a]: n\n[^b]: m"]
+    assert text[slice(*l[2].children[0].children[0].span)] == "    * b"
+
+def test_list_tree_shape():
+    from markdown_parser.lifter import make_list, make_quote
+    from markdown_parser.nodes import ListItem, Quote
+    def shape(items):
+        return [(i.content[0].text, shape(i.children)) for i in items]
+    def li(text, level):
+        return ListItem("*", [PlainText(text)], 4 * level)
+
+    # `c` starts at the top (there's no level 1 item yet), so `e` goes under it, not under `d`
+    l = make_list([li("a", 0), li("c", 2), li("b", 1), li("d", 2), li("e", 3)])
+    assert shape(l.children) == [("a", [("b", [("d", [])])]), ("c", [("e", [])])]
+
+    l = make_list([li(str(i), i) for i in range(5000)])
+    assert l.children[0].children[0].children[0].content == [PlainText("2")]
+    q = make_quote([Quote(i, [PlainText(str(i))]) for i in range(5000)])
+    assert q.children[0].children[0].children[0].content == [PlainText("2")]
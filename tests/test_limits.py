@@ -0,0 +1,101 @@
+import io
+
+import pytest
+
+from lark.exceptions import UnexpectedToken
+
+from markdown_parser.batch import render_batch
+from markdown_parser.lifter import lift
+from markdown_parser.limits import LimitExceeded, Limits, nesting_depth
+from markdown_parser.nodes import CustomDirective, Heading, Popover, PlainText
+from markdown_parser.parser import make_parser
+from markdown_parser.renderer import UnhandledNode, render, write_html
+
+DOC = "# title\n\nsome **text**\n\n> quote\n>> nested\n\n* a\n    * b"
+
+
+def test_directive_then_popover(parser):
+    # the popover's hint used to run over the directive
+    assert parser.parse_nodes("{^embed: a.txt} b {^h|c}") == [
+        CustomDirective("embed", ["a.txt"]), PlainText(" b "), Popover("h", "c"),
+    ]
+    assert parser.parse_nodes("| {^d: a} | b |\n|---|---|\n| c | d |")
+    # it was a popover with the hint "e: f}{^h"
+    assert parser.parse_nodes("#{^e: f}{^h|c}#!") == [
+        Heading(1, [CustomDirective("e", ["f"]), Popover("h", "c"), PlainText("#!")]),
+    ]
+    with pytest.raises(UnhandledNode, match="directive 'e'"):
+        write_html(lift(parser.parse_nodes(">[^a]: x\n\n#{^e: f}{^h|c}#!")), io.StringIO())
+    with pytest.raises(UnhandledNode, match="directive 'e'"):
+        render(lift(parser.parse_nodes("{^e: f}")))
+
+
+@pytest.mark.parametrize("text", ["{^a}b|c}", "x {^h}i|c} y"])
+def test_popover_hint_closing_brace(parser, text):
+    # the hint stops at the first `}`
+    with pytest.raises(UnexpectedToken):
+        parser.parse_nodes(text)
+
+
+def test_nesting_depth(parser):
+    assert nesting_depth([PlainText("a")]) == 1
+    assert nesting_depth(parser.parse_nodes("a **b _c_**")) == 3
+    assert nesting_depth(parser.parse_nodes(">>>> a")) == 5
+    assert nesting_depth(parser.parse_nodes("* a\n        * b")) == 5  # ListBlock, item at level 2, text
+
+
+@pytest.mark.parametrize("options", [{}, {"spans": True}, {"workers": 2}])
+def test_limits(options):
+    with make_parser(limits=Limits(max_chunk=100, max_depth=4), **options) as p:
+        assert p.parse_nodes(DOC) == make_parser().parse_nodes(DOC)
+        with pytest.raises(LimitExceeded, match="max_chunk=100"):
+            p.parse_nodes(DOC + "\n\n" + "word " * 30)
+        with pytest.raises(LimitExceeded, match="max_depth=4"):
+            p.parse_nodes(DOC + "\n\n>>>>> deep")
+        with pytest.raises(LimitExceeded, match="max_depth=4"):
+            p.parse_nodes(DOC + "\n\n**a _b <sup>c [d](e)</sup>_**")
+
+    with make_parser(limits=Limits(time_budget=0), **options) as p:
+        with pytest.raises(LimitExceeded, match="time_budget"):
+            p.parse_nodes(DOC)
+
+
+@pytest.mark.parametrize("sep", ["", "\n", "\n\n"])  # one chunk, or a chunk per tag
+def test_html_depth(sep):
+    p = make_parser(limits=Limits(max_depth=50))
+    p.parse_nodes(sep.join(["<div>"] * 40 + ["x"] + ["</div>"] * 40))
+    with pytest.raises(LimitExceeded, match="max_depth=50"):
+        p.parse_nodes(sep.join(["<div>"] * 1000 + ["x"] + ["</div>"] * 1000))
+    # closed and self closing tags don't add up
+    p.parse_nodes("\n\n".join(["<div>x</div>"] * 60 + ["<br>"] * 60))
+
+
+def test_limits_metrics():
+    from markdown_parser.instrument import DocMetrics
+    p = make_parser(limits=Limits(max_depth=2))
+    with pytest.raises(LimitExceeded):
+        p.parse_nodes(DOC, metrics=DocMetrics())
+
+
+def test_stream_limits():
+    p = make_parser(limits=Limits(max_chunk=100))
+    read = []
+
+    def lines():
+        yield "# title\n"
+        yield "\n"
+        while True:
+            read.append(1)
+            yield "word word word\n"
+
+    with pytest.raises(LimitExceeded):
+        list(p.parse_stream(lines()))
+    assert len(read) < 10
+
+    assert list(p.parse_stream(io.StringIO(DOC))) == p.parse_nodes(DOC)
+
+
+def test_render_batch_limits():
+    results = list(render_batch([("ok", DOC), ("big", "word " * 100)], limits=Limits(max_chunk=100)))
+    assert results[0].ok
+    assert (results[1].error.stage, results[1].error.type) == ("parse", "LimitExceeded")
@@ -0,0 +1,119 @@
+import os
+
+import pytest
+from lark import Tree
+
+from markdown_parser import _grammar1_tables, _grammar2_tables
+from markdown_parser.chunk_cache import ChunkCache
+from markdown_parser.parser import P1_OPTIONS, P2_OPTIONS, cache_path, grammar1, grammar2, grammar_digest, is_plain, make_parser
+from markdown_parser.nodes import *
+
+
+def test_table_cache(tmp_path, parser):
+    text = "some **bold** text\n\n# heading"
+    cold = make_parser(str(tmp_path), compile_grammar=True)
+    assert len(os.listdir(tmp_path)) == 2
+    warm = make_parser(str(tmp_path), compile_grammar=True)
+    assert cold.parse(text) == warm.parse(text) == parser.parse(text)
+
+
+def test_table_cache_key():
+    base = cache_path("d", grammar2, P2_OPTIONS)
+    assert base == cache_path("d", grammar2, dict(P2_OPTIONS))
+    assert base != cache_path("d", grammar2 + "\n", P2_OPTIONS)
+    assert base != cache_path("d", grammar2, {**P2_OPTIONS, "debug": False})
+
+
+def test_generated_tables_up_to_date():
+    # regenerate with `python -m markdown_parser.build_tables`
+    assert _grammar1_tables.DIGEST == grammar_digest(grammar1, P1_OPTIONS)
+    assert _grammar2_tables.DIGEST == grammar_digest(grammar2, P2_OPTIONS)
+
+
+def test_generated_tables(parser):
+    text = "# title\n\n* a [link](url)\n* b\n\n```py\ncode\n```\n\n| a | b |\n|---|---|\n| 1 | 2 |"
+    assert parser.parse(text) == make_parser(compile_grammar=True).parse(text)
+
+
+def lex(parser, text):
+    return [(t.type, t.value) for t in parser.p2.parse_interactive(text).iter_parse()]
+
+
+def test_plain_text_runs(parser):
+    assert lex(parser, "plain words, 1.5 (or so): fine") == [("STRING", "plain words, 1.5 (or so): fine")]
+    assert lex(parser, "a-b c]d") == [("STRING", "a"), ("STRING", "-"), ("STRING", "b c"), ("STRING", "]"), ("STRING", "d")]
+    assert lex(parser, "a->b")[1] == ("ARROW_R", "->")
+
+
+@pytest.mark.parametrize("text", ["plain text", "two\nlines", "a - b, 9.5 km: fine", "\tindented", "1.x -- y"])
+def test_plain_fast_path(parser, text):
+    plain_chunks = parser.stats.plain_chunks
+    res = parser.p2.parse(text)
+    expected = res.children if isinstance(res, Tree) else [res]
+    assert parser.parse_chunk(text) == expected
+    assert parser.stats.plain_chunks == plain_chunks + 1
+
+
+@pytest.mark.parametrize("text", ["a *b*", "text---", "1. item", "- item", "  <b>x</b>", "a\n# no", "x | y", "a](b"])
+def test_plain_fast_path_skipped(text):
+    assert not is_plain(text)
+
+
+def test_parallel_parse(parser):
+    text = "\n\n".join(["# title", "plain", "a **b** `c`", "* x\n* y", "> q\n>> r", "[^a]: _note_"] * 5)
+    with make_parser(workers=2) as parallel:
+        assert parallel.parse(text) == parser.parse(text)
+        assert parallel.stats.chunks == len(text.split("\n\n"))
+
+
+def test_parse_stream(parser):
+    text = "\n\n# title\n\nsome *text*\nmore\n\n\n```py\ncode\n\nwith blank lines\n```\n\n* a\n* b\n"
+    lines = text.splitlines(keepends=True)
+    assert list(parser.parse_stream(lines)) == parser.parse_nodes(text)
+
+
+def test_parse_stream_is_lazy(parser):
+    consumed = []
+
+    def lines():
+        for i in range(1000):
+            consumed.append(i)
+            yield f"paragraph {i}\n" if i % 2 == 0 else "\n"
+
+    stream = parser.parse_stream(lines())
+    assert next(stream) == PlainText("paragraph 0")
+    assert len(consumed) == 3
+
+
+def test_spans(parser):
+    text = "# title\n\nsome **bold** [a](b)\nplain\n\n```\ncode\n```tail\n\n| a |\n|---|\n| b |"
+    spanned = make_parser(spans=True)
+    nodes = spanned.parse_nodes(text)
+    assert nodes == parser.parse_nodes(text)
+    assert all(n.span is None for n in parser.parse_nodes(text))
+
+    def src(node):
+        return text[node.span.start:node.span.end]
+
+    heading, pb, some, bold, sp, anchor, plain, pb2, code, tail, pb3, table = nodes
+    assert src(heading) == "# title"
+    assert src(heading.content[0]) == " title"
+    assert src(pb) == "\n\n"
+    assert src(bold) == "**bold**"
+    assert src(bold.content[0]) == "bold"
+    assert src(anchor) == "[a](b)"
+    assert src(plain) == "plain"
+    assert src(code) == "```\ncode\n```"
+    # joined to the code block with a "\n" for p2, which is not in the text
+    assert src(tail) == "tail"
+    assert src(table) == "| a |\n|---|\n| b |"
+    assert src(table.divisors[0]) == "---"
+    assert list(spanned.parse_stream(text.splitlines(keepends=True))) == nodes
+    assert [n.span for n in spanned.parse_stream(text.splitlines(keepends=True))] == [n.span for n in nodes]
+
+
+@pytest.mark.parametrize("options", [{"workers": 2}, {"chunk_cache": ChunkCache()}])
+def test_spans_exclusive(options):
+    # an empty ChunkCache is falsy
+    with pytest.raises(ValueError):
+        make_parser(spans=True, **options)
@@ -0,0 +1,39 @@
+from markdown_parser.lifter import lift, HTMLNode
+from markdown_parser.nodes import Node, PlainText, Heading
+from markdown_parser.post_process import InsertHeadingAnchors, postprocess
+from markdown_parser.processor import Registry
+from markdown_parser.renderer import render, write_html, TextHTMLNode
+
+class Sub(PlainText):
+    pass
+
+def test_registry_mro_fallback():
+    r = Registry({Node: "node", PlainText: "text"})
+    assert r.get(PlainText) == "text"
+    assert r.get(Sub) == "text"
+    assert r.get(Heading) == "node"
+    assert Registry({PlainText: "text"}).get(Heading) is None
+    assert r.override({Sub: "sub"}).get(Sub) == "sub"
+    assert r.get(Sub) == "text"
+
+class Shout:
+    render_type = PlainText
+
+    @staticmethod
+    def render(node: PlainText) -> list[HTMLNode]:
+        return [TextHTMLNode(tag="", text=node.text.upper())]
+
+def test_ext_overrides_builtin(parser):
+    l = lift(parser.parse_nodes("some **text**"))
+    assert "".join(str(n) for n in render(l, [Shout()])) == "<p>SOME <b>TEXT</b></p>"
+    out = []
+    write_html(l, out.append, [Shout()])
+    assert "".join(out) == "<p>SOME <b>TEXT</b></p>"
+    assert "".join(str(n) for n in render(l)) == "<p>some <b>text</b></p>"
+
+def test_postprocess(parser):
+    l = lift(parser.parse_nodes("# title\n\ntext"))
+    a = InsertHeadingAnchors()
+    p = postprocess(l, [a])
+    assert len(l) == 2
+    assert "".join(str(n) for n in render(p, [a])) == '<a id="todo-id"><h1> title</h1></a>'
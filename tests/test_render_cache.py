@@ -0,0 +1,89 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from markdown_parser.batch import render_batch
+from markdown_parser.lifter import lift
+from markdown_parser.render_cache import RenderCache, cache_key
+from markdown_parser.renderer import render
+
+
+class Ext:
+    render_type = int
+
+
+def test_render_cache(tmp_path, parser):
+    cache = RenderCache(str(tmp_path), store_ast=True)
+    text = "# title\n\nsome **text**"
+    html = cache.render(parser, text)
+    assert html == "".join(str(n) for n in render(lift(parser.parse_nodes(text))))
+    assert (cache.stats.hits, cache.stats.misses) == (0, 1)
+    assert cache.render(parser, text) == html
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.get_ast(cache_key(text)) == lift(parser.parse_nodes(text))
+    # a different set of extensions is a different entry
+    assert cache.get(cache_key(text, [Ext()])) is None
+    assert cache_key(text + " ") != cache_key(text)
+
+
+def test_render_cache_evicts_lru(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=1000)
+    keys = [cache_key(str(i)) for i in range(9)]
+    for i, key in enumerate(keys):
+        cache.put(key, "x" * 100)
+        os.utime(cache.path(key, ".html"), (i, i))
+    os.utime(cache.path(keys[0], ".html"), (100, 100))  # recently used
+    cache.put(cache_key("last"), "x" * 200)
+    # 1100 bytes, down to 900
+    assert cache.stats.evictions == 2
+    assert cache.get(keys[0]) is not None
+    assert [cache.get(k) for k in keys[1:3]] == [None] * 2
+    assert cache.get(keys[3]) is not None
+
+
+def _hammer(directory, worker):
+    cache = RenderCache(directory, max_bytes=2_000)
+    for i in range(300):
+        key = cache_key(str(i % 50))
+        html = cache.get(key)
+        assert html is None or html == str(i % 50) * 100, html
+        if html is None:
+            cache.put(key, str(i % 50) * 100)
+    return cache.stats
+
+
+def test_render_cache_processes(tmp_path):
+    with ProcessPoolExecutor(3) as pool:
+        stats = list(pool.map(_hammer, [str(tmp_path)] * 3, range(3)))
+    assert sum(s.hits for s in stats) > 0
+    assert sum(s.evictions for s in stats) > 0
+    assert not [f for d in tmp_path.iterdir() for f in d.iterdir() if f.name.startswith(".tmp-")]
+
+
+def test_render_batch_cache(tmp_path):
+    docs = [(i, f"# page {i}\n\ntext") for i in range(6)] + [(6, "</div>")]
+    first = list(render_batch(docs, workers=2, cache=RenderCache(str(tmp_path))))
+    cache = RenderCache(str(tmp_path))
+    assert list(render_batch(docs, cache=cache)) == first
+    assert (cache.stats.hits, cache.stats.misses) == (6, 1)
+
+
+def test_render_cache_errors(tmp_path, caplog):
+    docs = [(i, f"# page {i}") for i in range(3)]
+    expected = list(render_batch(docs))
+    # eg: a read-only or full disk; `directory` being a file fails the same way, even for root
+    unwritable = tmp_path / "file"
+    unwritable.write_text("")
+    cache = RenderCache(str(unwritable))
+    with caplog.at_level(logging.WARNING, "markdown_parser.render_cache"):
+        assert list(render_batch(docs, cache=cache)) == expected
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.errors) == (0, 3, 6)
+    assert len(caplog.records) == 6
+
+    # a corrupt entry is a miss
+    cache = RenderCache(str(tmp_path / "cache"))
+    assert list(render_batch(docs, cache=cache)) == expected
+    with open(cache.path(cache_key(docs[0][1]), ".html"), "wb") as fd:
+        fd.write(b"\xff")
+    assert list(render_batch(docs, cache=cache)) == expected
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.errors) == (2, 4, 1)
@@ -1,6 +1,10 @@
+import copy
+import dataclasses
+import io
 import pytest
-from markdown_parser.lifter import lift
-from markdown_parser.renderer import render
+from markdown_parser.lifter import FullListItem, FullQuote, HTMLNode, List, Paragraph, QuoteBlock, lift
+from markdown_parser.nodes import Bold, PlainText, UnorderedListIndicator
+from markdown_parser.renderer import TREE_HANDLERS, WRITE_HANDLERS, RefContext, render, write_html
 
 def test_simple_render(parser):
     text = "text **bold _emp_ bold**"
@@ -74,3 +78,107 @@ def test_footnote_2(parser):
     assert str(r[0]) == expected1
     assert str(r[2]) == "<br/>"
     assert str(r[3]) == expected2
+
+def test_render_is_repeatable(parser):
+    data = "# title\n\n* a\n    * b\n\n> q\n>> r\n\ntext[^x]\n\n[^x]: note\n\n| a |\n|---|\n| b |"
+    l = lift(parser.parse(data))
+    before = copy.deepcopy(l)
+    first = "".join(str(n) for n in render(l))
+    assert l == before
+    assert "".join(str(n) for n in render(l)) == first
+
+# together, every node type
+WRITE_DOCS = [
+    "text **bold _emp_ bold**",
+    "> quote1\n>> quote nested1\n>> quote nested2",
+    "* list1\n    2. list2\n* list3",
+    "[^ref][^ref2]\n\n[^ref]: content\n[^ref2]: content2",
+    "<div class=\"a\">\n\n![alt](url) `code` {^hint|content}\n\n</div>",
+    "# title\n\n```py\ncode\n```\n\n| a | b |\n|---|---|\n| c | d |\n\n---",
+    "---\ntitle: t\n---\n\n[a](b) <sup>s</sup><sub>s</sub><small>s</small><smaller>s</smaller>\n\n<img src=\"x\"/>",
+]
+
+@pytest.mark.parametrize("data", WRITE_DOCS)
+def test_write_html(parser, data):
+    l = lift(parser.parse_nodes(data))
+    buf = io.StringIO()
+    write_html(l, buf)
+    assert buf.getvalue() == "".join(str(n) for n in render(l))
+
+def _types(value, ret):
+    if isinstance(value, list):
+        for v in value:
+            _types(v, ret)
+    elif dataclasses.is_dataclass(value):
+        ret.add(type(value))
+        for f in dataclasses.fields(value):
+            _types(getattr(value, f.name), ret)
+    return ret
+
+def test_handlers_match(parser):
+    # render and write_html handle the same types, all of them covered by test_write_html
+    assert TREE_HANDLERS.handlers.keys() == WRITE_HANDLERS.handlers.keys()
+    types = set()
+    for data in WRITE_DOCS:
+        _types(lift(parser.parse_nodes(data)), types)
+    assert TREE_HANDLERS.handlers.keys() <= types
+
+def test_ref_context(parser):
+    l = lift(parser.parse_nodes("[^a][^b][^c]\n\n[^a]: one\n[^c]: three"))
+    refs = RefContext()
+    html = "".join(str(n) for n in render(l, refs=refs))
+    assert refs.indices == {"a": 1, "b": 2, "c": 3}
+    assert refs.dangling == ["b"]
+    assert 'id="fn-3"' in html
+
+    refs2 = RefContext()
+    write_html(l, io.StringIO(), refs=refs2)
+    assert refs2 == refs
+
+
+DEPTH = 10_000
+
+def _nested(kind, depth):
+    if kind == "bold":
+        node = PlainText("x")
+        for _ in range(depth):
+            node = Bold([node])
+        return [Paragraph([node])]
+    if kind == "html":
+        node = HTMLNode("br")
+        for _ in range(depth):
+            node = HTMLNode("div", [node])
+        return [node]
+    if kind == "quote content":
+        node = PlainText("x")
+        for _ in range(depth):
+            node = QuoteBlock([FullQuote([PlainText("x"), node], 1, [])])
+        return [node]
+    if kind == "list content":
+        marker = UnorderedListIndicator("*")
+        node = PlainText("x")
+        for _ in range(depth):
+            node = List(marker, [FullListItem(marker, [PlainText("x"), node], 1, [])])
+        return [node]
+    if kind == "quote":
+        quote = FullQuote([PlainText("x")], depth, [])
+        for level in range(depth - 1, 0, -1):
+            quote = FullQuote([PlainText("x")], level, [quote])
+        return [QuoteBlock([quote])]
+    marker = UnorderedListIndicator("*")
+    item = FullListItem(marker, [PlainText("x")], depth, [])
+    for level in range(depth - 1, 0, -1):
+        item = FullListItem(marker, [PlainText("x")], level, [item])
+    return [List(marker, [item])]
+
+@pytest.mark.parametrize(["kind", "tag"], [
+    ("bold", "<b>"), ("html", "<div>"), ("quote", "<blockquote>"), ("list", "<ul>"),
+    ("quote content", "<blockquote>"), ("list content", "<ul>"),
+])
+def test_deep_nesting(kind, tag):
+    l = _nested(kind, DEPTH)
+    html = "".join(str(n) for n in render(l))
+    assert html.count(tag) == DEPTH
+    buf = io.StringIO()
+    write_html(l, buf)
+    assert buf.getvalue() == html
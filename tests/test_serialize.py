@@ -0,0 +1,64 @@
+import pytest
+
+from markdown_parser.lifter import lift
+from markdown_parser.nodes import *
+from markdown_parser.parser import make_parser
+from markdown_parser.serialize import HEADER, MAGIC, decode, encode
+
+TEXT = "\n\n".join([
+    "---\nk: v\n---",
+    "# title *em*",
+    "text **bold _em_** `code` [a](b) ![alt](u) ![](x) x[^a] {^h|c} {^dir: a b} <sup>s</sup> \\*",
+    "* a\n    2. b\n* c",
+    "> q\n>> r",
+    "```py\ncode\n```",
+    "| a | b |\n|:--|--:|\n| c | d |",
+    "[^a]: note",
+    "<img src=\"a\"/>",
+])
+HTML = "<div class=\"a\">\n\n![alt](url) `code` {^hint|content}\n\n</div>"
+TOKENS = " <div>x</div>"  # lark Tokens in the nodes
+
+
+@pytest.mark.parametrize("spans", [False, True])
+@pytest.mark.parametrize("text", [TEXT, HTML, TOKENS])
+def test_round_trip(spans, text):
+    nodes = make_parser(spans=spans).parse_nodes(text)
+    for value in [nodes, lift(nodes)]:
+        got = decode(encode(value))
+        assert got == value
+        assert repr(got) == repr(value)
+        assert [getattr(n, "span", None) for n in got] == [getattr(n, "span", None) for n in value]
+
+
+def test_values():
+    value = [None, -3, 0, 300, -(1 << 70), "", "é", [[]], TableDivisor(Alignment.RIGHT), KV("a", "b")]
+    assert decode(encode(value)) == value
+    assert decode(encode(PlainText("x", span=Span(3, 1000)))).span == Span(3, 1000)
+    # strings are stored once
+    assert len(encode(["long string"] * 100)) < len(encode(["long string"])) + 200
+
+
+def test_deep_nesting():
+    node = PlainText("x")
+    for _ in range(10_000):
+        node = Bold([node, PlainText("y")])
+    blob = encode([node])
+    got = decode(blob)
+    assert encode(got) == blob
+    for _ in range(10_000):
+        assert isinstance(got[0], Bold) and got[0].content[1] == PlainText("y")
+        got = got[0].content
+    assert got == [PlainText("x"), PlainText("y")]
+
+
+def test_rejects_other_versions():
+    blob = encode([PlainText("x")])
+    with pytest.raises(ValueError):
+        decode(b"nope" + blob)
+    with pytest.raises(ValueError):
+        decode(MAGIC + bytes([99]) + blob[len(MAGIC) + 1 :])
+    with pytest.raises(ValueError):
+        decode(HEADER[:-1] + bytes([HEADER[-1] ^ 1]) + blob[len(HEADER) :])
+    with pytest.raises(TypeError):
+        encode([object()])
@@ -0,0 +1,148 @@
+import gc
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from markdown_parser.chunk_cache import ChunkCache
+from markdown_parser.instrument import DocMetrics
+from markdown_parser.lifter import lift
+from markdown_parser.limits import Limits
+from markdown_parser.parser import make_parser
+from markdown_parser.renderer import render
+from markdown_parser.serialize import encode
+from markdown_parser.shared import SharedParser
+
+BLOCKS = [
+    "---\ntitle: post\n---",
+    "# title *em*",
+    "text **bold _em_** `code` [a](b) ![alt](u) x[^a] {^h|c} <sup>s</sup> \\*\n\n[^a]: note",
+    "* a\n    2. b\n        * c\n* d",
+    "> q **b**\n>> r\n>>> s",
+    "```py\ncode\n\n  more\n```",
+    "| a | b |\n|:--|--:|\n| c | _d_ |",
+    "plain text\non two lines",
+]
+# the same blocks in different orders, some repeated, so that threads parse the same chunks at once
+DOCS = ["\n\n".join(BLOCKS[i % len(BLOCKS):] + BLOCKS[:i % 3] + [f"doc {i} **{i}**"]) for i in range(40)]
+THREADS = 8
+
+
+@pytest.fixture
+def fast_switching():
+    # switch threads as often as possible, for races to show up
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def concurrently(fn, items, threads=THREADS):
+    barrier = threading.Barrier(threads)
+
+    def start():
+        barrier.wait()
+
+    with ThreadPoolExecutor(threads, initializer=start) as pool:
+        return list(pool.map(fn, items))
+
+
+def _result(nodes):
+    return encode(nodes), "".join(str(n) for n in render(lift(nodes)))
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"spans": True},
+    {"chunk_cache": True},
+    {"limits": Limits(max_chunk=1000, max_depth=50)},
+])
+def test_concurrent_parse(fast_switching, options):
+    serial = make_parser(**(options | {"chunk_cache": None}))
+    expected = {doc: _result(serial.parse_nodes(doc)) for doc in DOCS}
+    # small, so entries are evicted while other threads read them
+    cache = ChunkCache(max_entries=4) if options.get("chunk_cache") else None
+    shared = SharedParser(**(options | {"chunk_cache": cache}))
+
+    docs = DOCS * 2
+    got = concurrently(lambda doc: _result(shared.parse_nodes(doc)), docs)
+    assert got == [expected[doc] for doc in docs]
+    if cache is None:
+        assert shared.stats.chunks == serial.stats.chunks * len(docs) // len(DOCS)
+    else:
+        assert cache.stats.hits > 0
+
+
+def test_concurrent_metrics(fast_switching):
+    serial = make_parser()
+    expected = {}
+    for doc in DOCS:
+        metrics = DocMetrics()
+        serial.parse_nodes(doc, metrics=metrics)
+        expected[doc] = (metrics.chunks, metrics.p1_tokens, metrics.p2_tokens, metrics.nodes)
+    shared = SharedParser()
+    shared.parse_nodes(DOCS[0])
+    assert shared._parser._p2_instrumented is None  # until metrics are used
+    instrumented = set()
+
+    def run(doc):
+        metrics = DocMetrics()
+        shared.parse_nodes(doc, metrics=metrics)
+        instrumented.add(shared.local().instrumented())
+        return metrics.chunks, metrics.p1_tokens, metrics.p2_tokens, metrics.nodes
+
+    docs = DOCS * 2
+    assert concurrently(run, docs) == [expected[doc] for doc in docs]
+    # built once, by whichever thread was first
+    assert len(instrumented) == 1
+
+
+def test_concurrent_stream(fast_switching, parser):
+    expected = {doc: encode(parser.parse_nodes(doc)) for doc in DOCS}
+    shared = SharedParser()
+    got = concurrently(lambda doc: encode(list(shared.parse_stream(doc.splitlines(keepends=True)))), DOCS)
+    assert got == [expected[doc] for doc in DOCS]
+
+
+def test_local():
+    shared = SharedParser()
+    assert shared.local() is shared.local()
+    barrier = threading.Barrier(4)
+
+    def run(_):
+        barrier.wait()  # one call per thread
+        return shared.local()
+
+    others = concurrently(run, range(4), threads=4)
+    assert len({id(p) for p in others + [shared.local()]}) == 5
+    # they share the grammars
+    assert all(p.p2 is shared.local().p2 for p in others)
+
+
+def test_short_lived_threads(parser):
+    # eg: a server starting a thread per request
+    shared = SharedParser()
+    instrumented = shared.local().instrumented()
+    forks = []
+
+    def request(doc):
+        metrics = DocMetrics()
+        assert encode(shared.parse_nodes(doc, metrics=metrics)) == encode(parser.parse_nodes(doc))
+        assert metrics.p2_tokens > 0
+        assert shared.local().instrumented() is instrumented
+        forks.append(weakref.ref(shared.local()))
+
+    for doc in DOCS:
+        thread = threading.Thread(target=request, args=(doc,))
+        thread.start()
+        thread.join()
+    gc.collect()
+    # nothing kept for the threads which are gone, but their stats
+    assert len(forks) == len(DOCS) and all(fork() is None for fork in forks)
+    assert list(shared._forks) == [shared.local()]
+    serial = make_parser()
+    for doc in DOCS:
+        serial.parse_nodes(doc)
+    assert shared.stats == serial.stats